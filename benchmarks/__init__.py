@@ -0,0 +1,6 @@
+"""Page-object benchmark suite.
+
+Runs each page-object flow repeatedly against the bundled stand-in app
+(deterministic data, configurable latency) and records wall time, WebDriver
+command counts and sleep vs active time. Run with `python -m benchmarks`.
+"""
@@ -0,0 +1,128 @@
+"""Benchmark the page-object hot paths.
+
+Examples:
+  python -m benchmarks                                  # all default flows, 10 iterations
+  python -m benchmarks --flows login create_rfi_fill_form -n 30
+  python -m benchmarks --save-baseline                  # record benchmarks/baseline.json
+  python -m benchmarks --threshold 0.2                  # fail on >20% regressions
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+from config.config import Config
+from stub_server import StubPulseServer
+from utils.driver_factory import BROWSER_PROFILES, create_chrome_driver
+from benchmarks.flows import FLOWS, DEFAULT_FLOWS, BenchmarkContext
+from benchmarks import harness
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results", "latest.json")
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run page-object flows repeatedly and report wall time, "
+                    "WebDriver commands and sleep vs active time.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Examples:" + __doc__.split("Examples:", 1)[1],
+    )
+    parser.add_argument("--flows", nargs="+", choices=list(FLOWS), default=DEFAULT_FLOWS,
+                        help="Flows to run (default: all except inspection_checklist_camera)")
+    parser.add_argument("-n", "--iterations", type=int, default=10,
+                        help="Measured iterations per flow (default: %(default)s)")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="Unmeasured iterations run first per flow (default: %(default)s)")
+    parser.add_argument("--base-url",
+                        help="Benchmark an already running target instead of the bundled stand-in app "
+                             "(data is not reset between iterations)")
+    parser.add_argument("--latency-ms", type=int, default=Config.LOCAL_SERVER_LATENCY_MS,
+                        help="Artificial API latency of the stand-in app (default: %(default)s)")
+    parser.add_argument("--headed", action="store_true",
+                        help="Show the browser window (headless by default)")
+    parser.add_argument("--browser-profile", choices=BROWSER_PROFILES, default=Config.BROWSER_PROFILE,
+                        help="Chrome profile; performance is always headless (default: %(default)s)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show page-object log output while flows run")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="Where to write the JSON results (default: benchmarks/results/latest.json)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Baseline JSON to compare against (default: benchmarks/baseline.json)")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Allowed slowdown vs baseline as a fraction (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write these results to the baseline file instead of comparing")
+    return parser.parse_args(argv)
+
+
+def run_benchmarks(args, server):
+    # One browser runs every flow, including the camera checklist
+    driver = create_chrome_driver(headless=not args.headed, profile=args.browser_profile, camera=True)
+    context = BenchmarkContext(driver, server)
+    results = {}
+    try:
+        for name in args.flows:
+            print(f"[INFO] Benchmarking {name} ({args.warmup} warmup + {args.iterations} iterations)...")
+            # Page objects log every step; keep that out of the report unless asked for
+            output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+            with output:
+                results[name] = harness.run_flow(FLOWS[name], context, args.iterations, args.warmup)
+    finally:
+        driver.quit()
+    return results
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    server = None
+    if args.base_url:
+        Config.BASE_URL = args.base_url.rstrip("/")
+    else:
+        server = StubPulseServer(latency_ms=args.latency_ms).start()
+        Config.BASE_URL = server.url
+
+    try:
+        results = run_benchmarks(args, server)
+    finally:
+        if server is not None:
+            server.stop()
+
+    report = harness.build_report(results, {
+        "target": "remote" if args.base_url else "local",
+        "base_url": Config.BASE_URL,
+        "latency_ms": None if args.base_url else args.latency_ms,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "headless": not args.headed,
+    })
+    harness.print_results(results)
+
+    failed = any(result["errors"] for result in results.values())
+    if args.save_baseline:
+        harness.save_report(report, args.baseline)
+        print(f"[SUCCESS] Baseline saved to {args.baseline}")
+        return 1 if failed else 0
+
+    harness.save_report(report, args.output)
+    print(f"[INFO] Results written to {args.output}")
+
+    regressed = False
+    if os.path.exists(args.baseline):
+        rows = harness.compare(report, harness.load_report(args.baseline), args.threshold)
+        harness.print_comparison(rows, args.threshold)
+        regressed = any(row["regressed"] for row in rows)
+        if regressed:
+            print("[ERROR] Performance regressed beyond the threshold.")
+    else:
+        print(f"[INFO] No baseline at {args.baseline} - run with --save-baseline to record one.")
+
+    return 1 if (failed or regressed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+from config.config import Config
+from config.test_data import TestData
+from pages.login_page import LoginPage
+from pages.cntr.createRfi_page import CreateRfiPage
+from pages.cntr.inspectionChecklist_page import InspectionChecklistPage
+from pages.block_engineer.review_rfi_page import ReviewRfiPage
+from pages.block_engineer.approve_rfi_page import ApproveRfiPage
+from pages.quality.inspect_rfi_page import InspectRfiPage
+from pages.quality.final_approval_page import FinalApprovalPage
+
+
+class BenchmarkContext:
+    """Browser + target shared by all flows of one benchmark run.
+
+    Keeps one logged-in role at a time and resets the stand-in app's data
+    before each iteration so every sample starts from the same state.
+    """
+
+    def __init__(self, driver, server=None):
+        self.driver = driver
+        self.server = server
+        self.role = None
+        self.page = None
+
+    def reset_data(self):
+        if self.server is not None:
+            self.server.state.reset()
+
+    def logout(self):
+        self.driver.delete_all_cookies()
+        self.driver.get(f"{Config.BASE_URL}/favicon.ico")
+        self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        self.role = None
+
+    def ensure_role(self, role):
+        if self.role == role:
+            return
+        self.logout()
+        credentials = TestData.get_credentials(role)
+        login_page = LoginPage(self.driver)
+        login_page.navigate()
+        login_page.login(credentials["username"], credentials["password"])
+        self.role = role
+
+    def open_welcome(self):
+        self.driver.get(f"{Config.BASE_URL}/welcome")
+        LoginPage(self.driver).wait_for_page_load()
+
+    def prepare(self, flow):
+        self.reset_data()
+        self.page = None
+        flow.setup(self)
+
+    def recover(self):
+        """Start the next iteration from a clean browser after a failure."""
+        try:
+            self.logout()
+        except Exception as e:
+            print(f"[WARN] Could not reset browser after failed iteration: {e}")
+            self.role = None
+
+
+class Flow:
+    """One measured page-object workflow: setup() and verify() are untimed."""
+
+    def __init__(self, name, description, setup, run, verify=None):
+        self.name = name
+        self.description = description
+        self._setup = setup
+        self._run = run
+        self._verify = verify
+
+    def setup(self, context):
+        self._setup(context)
+
+    def run(self, context):
+        self._run(context)
+
+    def verify(self, context):
+        if self._verify is not None and not self._verify(context):
+            raise AssertionError(f"{self.name}: flow finished without its success state")
+
+
+# -----------------------------------------------------
+# FLOW DEFINITIONS
+# -----------------------------------------------------
+def _setup_login(context):
+    context.logout()
+    context.page = LoginPage(context.driver)
+    context.page.navigate()
+
+
+def _run_login(context):
+    credentials = TestData.get_credentials("contractor")
+    context.page.login(credentials["username"], credentials["password"])
+    context.role = "contractor"
+
+
+def _setup_create_rfi(context):
+    context.ensure_role("contractor")
+    context.page = CreateRfiPage(context.driver)
+    context.page.navigate()
+    context.page.open_form()
+
+
+def _setup_checklist(context):
+    _setup_create_rfi(context)
+    context.page.fill_form()
+    context.page.submit_form()
+    context.page = InspectionChecklistPage(context.driver)
+    context.page.wait_for_form_visible()
+
+
+def _run_checklist(capture_photos):
+    def run(context):
+        context.page.complete_inspection_checklist(capture_photos=capture_photos)
+    return run
+
+
+def _verify_checklist(context):
+    return context.page.is_element_visible(InspectionChecklistPage.SUCCESS_TOAST)
+
+
+def _setup_role_page(role, page_class):
+    def setup(context):
+        context.ensure_role(role)
+        context.open_welcome()
+        context.page = page_class(context.driver)
+        context.page.navigate()
+    return setup
+
+
+FLOWS = {
+    flow.name: flow for flow in [
+        Flow("login", "Contractor login from the login page",
+             _setup_login, _run_login,
+             lambda context: "/login" not in context.driver.current_url.lower()),
+        Flow("create_rfi_fill_form", "Fill every Create RFI cascade field",
+             _setup_create_rfi, lambda context: context.page.fill_form()),
+        Flow("inspection_checklist", "Fill and submit the 12-question checklist (no photos)",
+             _setup_checklist, _run_checklist(False), _verify_checklist),
+        Flow("inspection_checklist_camera", "Checklist with a camera capture per question",
+             _setup_checklist, _run_checklist(True), _verify_checklist),
+        Flow("review_rfi", "Block engineer reviews the newest pending RFI",
+             _setup_role_page("block_engineer", ReviewRfiPage),
+             lambda context: context.page.review_rfi(),
+             lambda context: context.page.is_success_displayed()),
+        Flow("approve_rfi", "Block engineer final-approves a reviewed RFI",
+             _setup_role_page("block_engineer", ApproveRfiPage),
+             lambda context: context.page.approve_rfi(),
+             lambda context: context.page.is_success_displayed()),
+        Flow("inspect_rfi", "Quality inspector inspects a pending RFI",
+             _setup_role_page("quality_inspector", InspectRfiPage),
+             lambda context: context.page.perform_inspection(),
+             lambda context: context.page.is_inspection_complete()),
+        Flow("final_approval", "Quality inspector closes an inspected RFI",
+             _setup_role_page("quality_inspector", FinalApprovalPage),
+             lambda context: context.page.give_final_approval(),
+             lambda context: context.page.is_success_displayed()),
+    ]
+}
+
+# Run when --flows is not given (camera capture is opt-in)
+DEFAULT_FLOWS = [name for name in FLOWS if name != "inspection_checklist_camera"]
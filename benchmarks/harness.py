@@ -0,0 +1,215 @@
+import json
+import os
+import platform
+import threading
+import time
+from datetime import datetime, timezone
+
+from utils.instrumentation import subscribe_execute, subscribe_sleep
+
+
+class CommandProbe:
+    """Counts WebDriver commands and time.sleep() idle time while active.
+
+    `driver.execute` is the single funnel every WebDriver command goes through
+    (find_element, click, execute_script, ...), so subscribing to it counts
+    them all. time.sleep is observed process-wide - WebDriverWait polls with
+    it - but only sleeps on the benchmarking thread are counted. Both hooks
+    come from utils.instrumentation and are removed on exit.
+
+    Usage:
+        with CommandProbe(driver) as probe:
+            page.fill_form()
+        probe.commands, probe.command_seconds, probe.sleep_seconds
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.commands = 0
+        self.command_seconds = 0.0
+        self.sleep_seconds = 0.0
+        self._thread = threading.get_ident()
+        self._unsubscribe = []
+
+    def __enter__(self):
+        self._unsubscribe = [subscribe_execute(self.driver, self._on_command), subscribe_sleep(self._on_sleep)]
+        return self
+
+    def __exit__(self, *exc_info):
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+        return False
+
+    def _on_command(self, command, params, response, error, started, elapsed, frame):
+        self.commands += 1
+        self.command_seconds += elapsed
+
+    def _on_sleep(self, seconds, started, elapsed, frame):
+        if threading.get_ident() == self._thread:
+            self.sleep_seconds += elapsed
+
+
+# -----------------------------------------------------
+# STATISTICS
+# -----------------------------------------------------
+def percentile(values, pct):
+    """Linear-interpolated percentile (pct in 0..100); None for no values."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values):
+    if not values:
+        return None
+    return {
+        "mean": sum(values) / len(values),
+        "min": min(values),
+        "max": max(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+    }
+
+
+# -----------------------------------------------------
+# RUNNING
+# -----------------------------------------------------
+def run_flow(flow, context, iterations, warmup=0):
+    """Run `flow` warmup + iterations times and return its result dict.
+
+    Only flow.run is measured; flow.setup (navigation, data reset) and
+    flow.verify run outside the probe.
+    """
+    samples = []
+    errors = []
+    for index in range(warmup + iterations):
+        measured = index >= warmup
+        try:
+            context.prepare(flow)
+            with CommandProbe(context.driver) as probe:
+                started = time.perf_counter()
+                flow.run(context)
+                wall = time.perf_counter() - started
+            flow.verify(context)
+        except Exception as e:
+            if measured:
+                errors.append(f"iteration {index - warmup + 1}: {type(e).__name__}: {e}")
+            context.recover()
+            continue
+        if measured:
+            samples.append({
+                "wall": wall,
+                "commands": probe.commands,
+                "command_time": probe.command_seconds,
+                "sleep": probe.sleep_seconds,
+                "active": max(0.0, wall - probe.sleep_seconds),
+            })
+
+    return {
+        "description": flow.description,
+        "iterations": iterations,
+        "succeeded": len(samples),
+        "errors": errors,
+        "wall": summarize([s["wall"] for s in samples]),
+        "commands": summarize([s["commands"] for s in samples]),
+        "command_time": summarize([s["command_time"] for s in samples]),
+        "sleep": summarize([s["sleep"] for s in samples]),
+        "active": summarize([s["active"] for s in samples]),
+        "samples": samples,
+    }
+
+
+def build_report(flow_results, meta):
+    return {
+        "meta": dict(
+            meta,
+            created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            python=platform.python_version(),
+            platform=platform.platform(),
+        ),
+        "flows": flow_results,
+    }
+
+
+def save_report(report, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# -----------------------------------------------------
+# BASELINE COMPARISON
+# -----------------------------------------------------
+# (metric, statistic) pairs checked against the baseline
+COMPARED_METRICS = [("wall", "p50"), ("wall", "p95"), ("commands", "mean")]
+
+
+def compare(current, baseline, threshold=0.10):
+    """Compare two reports. Returns a list of rows; a row regresses when the
+    current value exceeds the baseline by more than `threshold` (fraction)."""
+    rows = []
+    for name, result in current["flows"].items():
+        base = baseline.get("flows", {}).get(name)
+        if not base:
+            continue
+        for metric, stat in COMPARED_METRICS:
+            now = (result.get(metric) or {}).get(stat)
+            before = (base.get(metric) or {}).get(stat)
+            if now is None or not before:
+                continue
+            change = (now - before) / before
+            rows.append({
+                "flow": name,
+                "metric": f"{metric}.{stat}",
+                "baseline": before,
+                "current": now,
+                "change": change,
+                "regressed": change > threshold,
+            })
+    return rows
+
+
+# -----------------------------------------------------
+# REPORTING
+# -----------------------------------------------------
+def print_results(flow_results):
+    print("\n" + "=" * 96)
+    print(f"{'FLOW':<28}{'OK':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'cmds':>8}{'cmd ms':>10}{'sleep ms':>10}{'active ms':>11}")
+    print("-" * 96)
+    for name, result in flow_results.items():
+        wall = result["wall"]
+        if wall is None:
+            print(f"{name:<28}{'0/' + str(result['iterations']):>6}  all iterations failed")
+            continue
+        print(f"{name:<28}{result['succeeded']:>3}/{result['iterations']:<2}"
+              f"{wall['p50'] * 1000:>10.0f}{wall['p95'] * 1000:>10.0f}{wall['p99'] * 1000:>10.0f}"
+              f"{result['commands']['mean']:>8.0f}{result['command_time']['mean'] * 1000:>10.0f}"
+              f"{result['sleep']['mean'] * 1000:>10.0f}{result['active']['mean'] * 1000:>11.0f}")
+    print("=" * 96)
+    for name, result in flow_results.items():
+        for error in result["errors"][:3]:
+            print(f"[ERROR] {name}: {error}")
+
+
+def print_comparison(rows, threshold):
+    print(f"\nBaseline comparison (regression threshold +{threshold:.0%})")
+    print("-" * 78)
+    for row in rows:
+        mark = "REGRESSED" if row["regressed"] else "ok"
+        print(f"{row['flow']:<28}{row['metric']:<14}{row['baseline']:>10.3f} -> {row['current']:>10.3f}"
+              f"  {row['change']:>+7.1%}  {mark}")
+    print("-" * 78)
@@ -0,0 +1,6 @@
+"""Bulk RFI creation from a dataset.
+
+Creates one RFI per CSV/JSON row (plot, block, package, activity, locations,
+quantity, ...) as fast as the target allows, e.g. to load a staging
+environment before review and inspection runs. Run with `python -m bulk_rfi`.
+"""
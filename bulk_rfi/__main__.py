@@ -0,0 +1,194 @@
+"""Create RFIs in bulk from a CSV/JSON dataset.
+
+Examples:
+  python -m bulk_rfi                                    # bundled sample, local stand-in app
+  python -m bulk_rfi my_rfis.csv --base-url https://staging.example.com --workers 4
+  python -m bulk_rfi --repeat 10 --browser-profile performance
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+
+from config.config import Config
+from stub_server import StubPulseServer
+from utils.driver_factory import BROWSER_PROFILES, create_chrome_driver
+from utils.rfi_record import load_records
+from bulk_rfi.creator import BulkRfiCreator
+
+BULK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DATASET = os.path.join(BULK_DIR, "sample_rfis.csv")
+DEFAULT_OUTPUT = os.path.join(BULK_DIR, "results", "latest.json")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m bulk_rfi",
+        description="Create one RFI per dataset row and report throughput (rows/min).",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Examples:" + __doc__.split("Examples:", 1)[1],
+    )
+    parser.add_argument("dataset", nargs="?", default=DEFAULT_DATASET,
+                        help="CSV or JSON file of RFIs (default: bulk_rfi/sample_rfis.csv)")
+    parser.add_argument("--role", default="contractor",
+                        help="Role that creates the RFIs (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Browsers creating RFIs in parallel, each logged in once (default: %(default)s)")
+    parser.add_argument("--limit", type=int,
+                        help="Only create the first N rows")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="Create every row N times, e.g. to load a staging environment (default: %(default)s)")
+    parser.add_argument("--base-url",
+                        help="Create RFIs on an already running target instead of the bundled stand-in app")
+    parser.add_argument("--latency-ms", type=int, default=Config.LOCAL_SERVER_LATENCY_MS,
+                        help="Artificial API latency of the stand-in app (default: %(default)s)")
+    parser.add_argument("--headed", action="store_true",
+                        help="Show the browser windows (headless by default)")
+    parser.add_argument("--browser-profile", choices=BROWSER_PROFILES, default=Config.BROWSER_PROFILE,
+                        help="Chrome profile; performance is always headless (default: %(default)s)")
+    parser.add_argument("--photos", action="store_true",
+                        help="Capture a photo per checklist question (fake camera)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show page-object log output while rows run")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="Where to write the JSON results (default: bulk_rfi/results/latest.json)")
+    return parser.parse_args(argv)
+
+
+def run_worker(name, args, rows, results, log):
+    """Log in once, then create rows from the shared queue until it is empty."""
+    driver = None
+    try:
+        driver = create_chrome_driver(headless=not args.headed, profile=args.browser_profile, camera=args.photos)
+        creator = BulkRfiCreator(driver, role=args.role, capture_photos=args.photos)
+        creator.login()
+        while True:
+            try:
+                number, record = rows.get_nowait()
+            except queue.Empty:
+                return
+            result = dict(creator.create(record, number), worker=name)
+            results.append(result)
+            if result["error"]:
+                log(f"[ERROR] Row {number} ({record!r}) failed after {result['seconds']:.1f}s: {result['error']}")
+            else:
+                log(f"[SUCCESS] Row {number}: {result['rfi_id'] or result['reference']} in {result['seconds']:.1f}s [{name}]")
+    except Exception as e:
+        log(f"[ERROR] {name} stopped: {e}")
+    finally:
+        if driver is not None:
+            driver.quit()
+
+
+def build_report(results, elapsed):
+    seconds = sorted(result["seconds"] for result in results if not result["error"])
+    ok = len(seconds)
+    per_worker = {}
+    for result in results:
+        per_worker.setdefault(result["worker"], []).append(result)
+    return {
+        "rows": len(results),
+        "ok": ok,
+        "failed": len(results) - ok,
+        "elapsed_seconds": round(elapsed, 2),
+        "rows_per_minute": round(ok / elapsed * 60, 2) if elapsed else 0.0,
+        "p50_seconds": round(statistics.median(seconds), 2) if seconds else None,
+        "workers": {
+            name: {
+                "ok": sum(1 for result in rows if not result["error"]),
+                "rows_per_minute": round(sum(1 for result in rows if not result["error"]) / elapsed * 60, 2)
+                if elapsed else 0.0,
+            }
+            for name, rows in sorted(per_worker.items())
+        },
+        "results": sorted(results, key=lambda result: result["row"]),
+    }
+
+
+def print_report(report):
+    print("\n" + "=" * 60)
+    print("BULK RFI CREATION")
+    print("=" * 60)
+    print(f"  Created: {report['ok']}/{report['rows']}  Failed: {report['failed']}")
+    print(f"  Elapsed: {report['elapsed_seconds']:.1f}s  Throughput: {report['rows_per_minute']:.1f} rows/min")
+    if report["p50_seconds"] is not None:
+        print(f"  p50 per row: {report['p50_seconds']:.1f}s")
+    if len(report["workers"]) > 1:
+        for name, worker in report["workers"].items():
+            print(f"    {name}: {worker['ok']} row(s), {worker['rows_per_minute']:.1f} rows/min")
+    print("=" * 60)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    try:
+        records = load_records(args.dataset)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Could not read dataset: {e}")
+        return 2
+    records = records[:args.limit] if args.limit else records
+    rows = queue.Queue()
+    for repeat in range(max(args.repeat, 1)):
+        for number, record in enumerate(records, 1):
+            rows.put((repeat * len(records) + number, record))
+    total = rows.qsize()
+    workers = max(1, min(args.workers, total))
+
+    server = None
+    if args.base_url:
+        Config.BASE_URL = args.base_url.rstrip("/")
+    else:
+        server = StubPulseServer(latency_ms=args.latency_ms).start()
+        Config.BASE_URL = server.url
+    print(f"[INFO] Creating {total} RFI(s) from {args.dataset} on {Config.BASE_URL} with {workers} worker(s)...")
+
+    # Page objects log every step; keep that out of the progress lines unless asked for
+    console = sys.stdout
+    lock = threading.Lock()
+
+    def log(message):
+        with lock:
+            print(message, file=console, flush=True)
+
+    results = []
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    start = time.perf_counter()
+    try:
+        with output:
+            threads = [threading.Thread(target=run_worker, name=f"bulk-{index + 1}",
+                                        args=(f"worker-{index + 1}", args, rows, results, log))
+                       for index in range(workers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            server.stop()
+
+    report = build_report(results, elapsed)
+    report["dataset"] = args.dataset
+    report["base_url"] = Config.BASE_URL
+    print_report(report)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"[INFO] Results written to {args.output}")
+
+    not_created = total - report["ok"]
+    if not_created:
+        print(f"[ERROR] {not_created} RFI(s) were not created.")
+    return 1 if not_created else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
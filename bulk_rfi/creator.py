@@ -0,0 +1,71 @@
+import time
+from urllib.parse import urlparse
+
+from config.config import Config
+from config.test_data import TestData
+from pages.login_page import LoginPage
+from pages.cntr.createRfi_page import CreateRfiPage
+from pages.cntr.inspectionChecklist_page import InspectionChecklistPage
+from utils.rfi_handle import RfiHandle
+
+
+class BulkRfiCreator:
+    """Creates RFIs from RfiRecords in one logged-in browser.
+
+    Rows run back to back on the welcome page: no reload or re-login between
+    them. Each row opens the Create RFI form again; fill_form skips fields that
+    already show the wanted value, so a form that opens with the previous
+    row's selections only has the differing fields re-entered (one that opens
+    empty - like the stand-in app's - is filled in full). After a failed row
+    the welcome page is reloaded once so the next row starts clean.
+
+    Usage:
+        creator = BulkRfiCreator(driver)
+        creator.login()
+        result = creator.create(record, row=1)
+    """
+
+    def __init__(self, driver, role="contractor", capture_photos=False, fill_mode="bulk"):
+        self.driver = driver
+        self.role = role
+        self.capture_photos = capture_photos
+        self.fill_mode = fill_mode
+        self.create_page = CreateRfiPage(driver)
+        self.checklist_page = InspectionChecklistPage(driver)
+        self._needs_reload = False
+
+    def login(self):
+        credentials = TestData.get_credentials(self.role)
+        login_page = LoginPage(self.driver)
+        login_page.navigate()
+        login_page.login(credentials["username"], credentials["password"])
+        login_page.wait.until(lambda d: not urlparse(d.current_url).path.rstrip("/").endswith("/login"))
+
+    def open_welcome(self):
+        self.driver.get(f"{Config.BASE_URL}/welcome")
+        self.create_page.wait_for_page_load()
+
+    def create(self, record, row):
+        """Create one RFI; returns {row, reference, rfi_id, seconds, error}."""
+        handle = RfiHandle.new(created_by=self.role)
+        start = time.perf_counter()
+        error = None
+        try:
+            if self._needs_reload:
+                self.open_welcome()
+                self._needs_reload = False
+            self.create_page.open_form()
+            self.create_page.fill_form(handle, record, debug=False)
+            self.create_page.submit_form()
+            self.checklist_page.complete_inspection_checklist(
+                capture_photos=self.capture_photos, fill_mode=self.fill_mode, handle=handle)
+        except Exception as e:
+            error = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+            self._needs_reload = True
+        return {
+            "row": row,
+            "reference": handle.reference,
+            "rfi_id": handle.rfi_id,
+            "seconds": time.perf_counter() - start,
+            "error": error,
+        }
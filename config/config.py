@@ -1,5 +1,91 @@
+import os
+
+
 class Config:
-    BASE_URL = "https://pulse-docker.cfapps.ap11.hana.ondemand.com"
+    # Live Pulse deployment
+    REMOTE_BASE_URL = "https://pulse-docker.cfapps.ap11.hana.ondemand.com"
+    # Bundled stand-in app (python -m stub_server / pytest --local-server)
+    LOCAL_SERVER_HOST = "127.0.0.1"
+    LOCAL_SERVER_PORT = int(os.environ.get("PULSE_LOCAL_PORT", 8765))
+    # Artificial delay added to every stand-in API response
+    LOCAL_SERVER_LATENCY_MS = int(os.environ.get("PULSE_LOCAL_LATENCY_MS", 0))
+    # PULSE_BASE_URL wins; PULSE_TARGET=local points the suite at the stand-in
+    BASE_URL = os.environ.get("PULSE_BASE_URL") or (
+        f"http://{LOCAL_SERVER_HOST}:{LOCAL_SERVER_PORT}"
+        if os.environ.get("PULSE_TARGET") == "local" else REMOTE_BASE_URL
+    )
     IMPLICIT_WAIT = 2
     EXPLICIT_WAIT = 5
-    BROWSER = "chrome"
\ No newline at end of file
+    BROWSER = "chrome"
+    # Most Chrome instances pre-spawned for the selected tests' driver fixtures
+    BROWSER_POOL_SIZE = 2
+    # Where the resolved chromedriver manifest is kept (shared across processes)
+    DRIVER_CACHE_DIR = os.environ.get(
+        "PULSE_DRIVER_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "selenium-pulse")
+    )
+    # Never hit the network to resolve chromedriver
+    DRIVER_OFFLINE = os.environ.get("PULSE_DRIVER_OFFLINE", "0") == "1"
+    # Saved login sessions per role, reused until they are TTL seconds old
+    STORAGE_STATE_DIR = ".auth"
+    STORAGE_STATE_TTL = int(os.environ.get("PULSE_STORAGE_STATE_TTL", 30 * 60))
+    # Inspection checklist: "bulk" sets all observations in one script call,
+    # "keystroke" types each one (fidelity runs)
+    CHECKLIST_FILL_MODE = os.environ.get("PULSE_CHECKLIST_FILL_MODE", "bulk")
+    # Which fallback locator strategy worked last, per logical element
+    LOCATOR_CACHE_FILE = os.path.join(".cache", "locator_strategies.json")
+    # Per-test WebDriver command traces written by --trace-webdriver
+    TRACE_DIR = os.environ.get("PULSE_TRACE_DIR", "traces")
+    # Rank idle time (time.sleep, implicit-wait misses) per call site (--profile-sleeps)
+    PROFILE_SLEEPS = os.environ.get("PULSE_PROFILE_SLEEPS", "0") == "1"
+    # run_tests.py --coordinator: default port, and seconds without a worker
+    # heartbeat before a leased step is handed to another worker
+    COORDINATOR_PORT = int(os.environ.get("PULSE_COORDINATOR_PORT", 8790))
+    WORK_LEASE_TIMEOUT = int(os.environ.get("PULSE_WORK_LEASE_TIMEOUT", 120))
+    # Shared secret workers send with every coordinator request; the
+    # coordinator generates (and prints) one when it is not set
+    COORDINATOR_TOKEN = os.environ.get("PULSE_COORDINATOR_TOKEN")
+    # Per-test duration history used to balance --shard-count shards (EMA-smoothed)
+    DURATIONS_FILE = os.path.join(".cache", "test_durations.json")
+    DURATION_EMA_ALPHA = 0.3
+    # Estimated cost of a role login, charged once per role a shard uses
+    SHARD_LOGIN_SECONDS = 8
+    # run_tests.py: one RfiHandle file per scenario run, shared by its steps
+    RFI_HANDLE_DIR = os.path.join(".cache", "rfi_handles")
+    # run_tests.py: steps that passed per scenario, so --resume skips them
+    CHECKPOINT_DIR = os.path.join(".cache", "checkpoints")
+    # --on-failure retry: extra attempts per step, and the first backoff
+    # (seconds, doubled after every attempt)
+    STEP_RETRIES = int(os.environ.get("PULSE_STEP_RETRIES", 2))
+    STEP_RETRY_BACKOFF = float(os.environ.get("PULSE_STEP_RETRY_BACKOFF", 5))
+    # Chrome profile: "standard" (visible, full-featured) or "performance"
+    # (headless, no images/fonts/extensions, eager page loads - parallel CI)
+    BROWSER_PROFILE = os.environ.get("PULSE_BROWSER_PROFILE", "standard")
+    PERFORMANCE_WINDOW_SIZE = "1366,768"
+    # Pulse JSON API used to seed RFIs for role tests (default: BASE_URL/api)
+    API_URL = os.environ.get("PULSE_API_URL")
+    # Seconds per API call, and kept-alive connections per role session
+    API_TIMEOUT = float(os.environ.get("PULSE_API_TIMEOUT", 15))
+    API_POOL_SIZE = 4
+    # Role tests get their RFI seeded through the API instead of the first list row.
+    # The seeding endpoints are those of the stand-in app, so seeding is only on by
+    # default against it (PULSE_TARGET=local, --local-server) or an explicit PULSE_API_URL
+    SEED_RFIS = os.environ.get(
+        "PULSE_SEED_RFIS", "1" if API_URL or os.environ.get("PULSE_TARGET") == "local" else "0"
+    ) == "1"
+    # Consecutive seeding failures before a session stops trying (a success resets it)
+    SEED_MAX_FAILURES = 3
+    # Detail routes under BASE_URL used to open a seeded RFI directly (/rfis/<id>,
+    # /inspections/<id>). Only the stand-in's routes are known, so they are unset
+    # (search the list instead) unless PULSE_TARGET=local or set explicitly
+    RFI_DETAIL_PATH = os.environ.get("PULSE_RFI_DETAIL_PATH") or (
+        "/rfis" if os.environ.get("PULSE_TARGET") == "local" else None
+    )
+    INSPECTION_DETAIL_PATH = os.environ.get("PULSE_INSPECTION_DETAIL_PATH") or (
+        "/inspections" if os.environ.get("PULSE_TARGET") == "local" else None
+    )
+    # Failure evidence (screenshot, DOM, console) per test, written in the background
+    ARTIFACT_DIR = os.environ.get("PULSE_ARTIFACT_DIR", "artifacts")
+    ARTIFACT_JPEG_QUALITY = 70
+    # Page-object log level: INFO shows the steps; DEBUG also runs diagnostic
+    # probes (page structure dumps, option scraping) that cost WebDriver calls
+    LOG_LEVEL = os.environ.get("PULSE_LOG_LEVEL", "INFO")
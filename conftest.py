@@ -1,50 +1,325 @@
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from config.config import Config
 from pages.login_page import LoginPage
 from config.test_data import TestData
+from utils.browser_pool import BrowserPool
+from utils.driver_factory import BROWSER_PROFILES, create_chrome_driver
+from utils.storage_state import StorageStateCache
+from utils.webdriver_tracer import WebDriverTracer
+from utils.sleep_profiler import SleepProfiler
+from utils.sharding import DurationHistory, DurationRecorder, ShardingPlugin
+from utils.rfi_handle import load_handle
+from utils.rfi_seeder import RfiSeeder
+from utils.api_client import ApiError
+from utils.artifacts import artifact_pipeline
+from utils.logger import LEVELS, get_logger, set_level
+from selenium.webdriver.remote.webdriver import WebDriver
+from stub_server import StubPulseServer
+import functools
 import time
+import requests
 
-def _create_driver():
-    """Helper function to create a Chrome driver with standard options."""
-    chrome_options = Options()
-    # Note: Running in visible mode (not headless) - browser window will be visible
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    # Allow camera and geolocation permissions automatically
-    chrome_options.add_argument("--use-fake-ui-for-media-stream")  # Auto-allow camera/mic
-    chrome_options.add_argument("--use-fake-device-for-media-stream")  # Use fake camera device
-    
-    # Set preferences for automatic permissions
-    prefs = {
-        "profile.default_content_setting_values.media_stream_camera": 1,  # Allow camera
-        "profile.default_content_setting_values.media_stream_mic": 1,     # Allow microphone
-        "profile.default_content_setting_values.geolocation": 1,          # Allow geolocation
-        "profile.default_content_setting_values.notifications": 1         # Allow notifications
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
-    
-    # Install chromedriver and get the correct path
-    driver_path = ChromeDriverManager().install()
-    # Fix for webdriver-manager returning THIRD_PARTY_NOTICES path
-    if "THIRD_PARTY_NOTICES" in driver_path:
-        import os
-        driver_path = os.path.join(os.path.dirname(driver_path), "chromedriver.exe")
-    
-    service = Service(driver_path)
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.implicitly_wait(Config.IMPLICIT_WAIT)
-    driver.maximize_window()
+log = get_logger(__name__)
+
+# Warm Chrome instances shared by the driver fixtures, one pool per browser variant
+# (False: plain browser, True: with the fake camera); see _pool_for()
+_browser_pools = {}
+_browser_pool_size = Config.BROWSER_POOL_SIZE
+# Roles whose session driver needs the fake camera (a selected test is marked camera)
+_camera_roles = set()
+# Saved per-role login sessions (None when disabled with --no-storage-state)
+_storage_states = None
+# Local stand-in app started for this session with --local-server
+_local_server = None
+# WebDriver command tracer (None unless --trace-webdriver)
+_tracer = None
+# Idle-time profiler (None unless --profile-sleeps)
+_sleep_profiler = None
+# Seeding failures in a row; seeding stops at Config.SEED_MAX_FAILURES (a success resets it)
+_seed_failures = 0
+
+# Session fixtures that log in, and the role they log in as (used for sharding)
+ROLE_FIXTURES = {
+    "logged_in_driver": "contractor",
+    "contractor_driver": "contractor",
+    "admin_driver": "admin",
+    "project_manager_driver": "project_manager",
+    "client_driver": "client",
+    "contractor_incharge_driver": "contractor_incharge",
+    "block_engineer_driver": "block_engineer",
+    "quality_inspector_driver": "quality_inspector",
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-pool-size",
+        type=int,
+        default=Config.BROWSER_POOL_SIZE,
+        help="Most Chrome instances to pre-spawn for the selected tests (0 = spawn on demand)",
+    )
+    parser.addoption(
+        "--browser-profile",
+        choices=BROWSER_PROFILES,
+        default=Config.BROWSER_PROFILE,
+        help="Chrome profile: standard (visible, full-featured) or performance "
+             "(headless, no images/fonts/extensions, eager page loads) (default: %(default)s)",
+    )
+    parser.addoption(
+        "--page-log-level",
+        choices=LEVELS,
+        type=str.upper,
+        default=Config.LOG_LEVEL.upper(),
+        help="Page-object log level; DEBUG also runs the diagnostic probes (default: %(default)s)",
+    )
+    parser.addoption(
+        "--offline-driver",
+        action="store_true",
+        default=False,
+        help="Resolve chromedriver from the local manifest/PATH only, without network access",
+    )
+    parser.addoption(
+        "--no-storage-state",
+        action="store_true",
+        default=False,
+        help="Always log in through the UI instead of restoring saved role sessions",
+    )
+    parser.addoption(
+        "--storage-state-ttl",
+        type=int,
+        default=Config.STORAGE_STATE_TTL,
+        help="Seconds a saved role session stays valid (default: %(default)s)",
+    )
+    parser.addoption(
+        "--local-server",
+        action="store_true",
+        default=False,
+        help="Start the bundled Pulse stand-in app on a free port and run against it",
+    )
+    parser.addoption(
+        "--local-latency-ms",
+        type=int,
+        default=Config.LOCAL_SERVER_LATENCY_MS,
+        help="Artificial API latency of the stand-in app started by --local-server (default: %(default)s)",
+    )
+    parser.addoption(
+        "--seed-rfis",
+        action="store_true",
+        default=False,
+        help="Seed role tests' RFIs through the API (on by default with --local-server, "
+             "PULSE_TARGET=local or PULSE_API_URL)",
+    )
+    parser.addoption(
+        "--no-seed-rfis",
+        action="store_true",
+        default=False,
+        help="Don't seed role tests' RFIs through the API; they work on the first RFI in the list",
+    )
+    parser.addoption(
+        "--trace-webdriver",
+        action="store_true",
+        default=False,
+        help="Record every WebDriver command and write a Chrome trace-event file per test",
+    )
+    parser.addoption(
+        "--trace-dir",
+        default=Config.TRACE_DIR,
+        help="Directory for --trace-webdriver output (default: %(default)s)",
+    )
+    parser.addoption(
+        "--profile-sleeps",
+        action="store_true",
+        default=Config.PROFILE_SLEEPS,
+        help="Report idle seconds (time.sleep and implicit-wait misses) per call site at the end",
+    )
+    parser.addoption(
+        "--profile-sleeps-top",
+        type=int,
+        default=25,
+        help="Number of call sites shown in the --profile-sleeps report (default: %(default)s)",
+    )
+    parser.addoption(
+        "--shard-count",
+        type=int,
+        default=1,
+        help="Split the collected tests into this many role-grouped, duration-balanced shards",
+    )
+    parser.addoption(
+        "--shard-index",
+        type=int,
+        default=0,
+        help="Which shard to run, 0-based (default: %(default)s)",
+    )
+    parser.addoption(
+        "--store-durations",
+        action="store_true",
+        default=False,
+        help="Record test durations into the history file (always on when sharding)",
+    )
+    parser.addoption(
+        "--durations-file",
+        default=Config.DURATIONS_FILE,
+        help="Per-test duration history used to balance shards (default: %(default)s)",
+    )
+
+
+def pytest_configure(config):
+    global _browser_pool_size, _storage_states, _local_server, _tracer, _sleep_profiler
+    Config.BROWSER_PROFILE = config.getoption("--browser-profile")
+    set_level(config.getoption("--page-log-level"))
+    if config.getoption("--offline-driver"):
+        Config.DRIVER_OFFLINE = True
+    if config.getoption("--local-server"):
+        _local_server = StubPulseServer(latency_ms=config.getoption("--local-latency-ms")).start()
+        Config.BASE_URL = _local_server.url
+        Config.RFI_DETAIL_PATH = Config.RFI_DETAIL_PATH or "/rfis"
+        Config.INSPECTION_DETAIL_PATH = Config.INSPECTION_DETAIL_PATH or "/inspections"
+    if config.getoption("--seed-rfis") or config.getoption("--local-server"):
+        Config.SEED_RFIS = True
+    if config.getoption("--no-seed-rfis"):
+        Config.SEED_RFIS = False
+    if config.getoption("--trace-webdriver"):
+        _tracer = WebDriverTracer(config.getoption("--trace-dir"))
+    if config.getoption("--profile-sleeps"):
+        _sleep_profiler = SleepProfiler().start()
+    _configure_sharding(config)
+    if not config.getoption("--no-storage-state"):
+        _storage_states = StorageStateCache(ttl=config.getoption("--storage-state-ttl"))
+    _browser_pool_size = config.getoption("--browser-pool-size")
+
+
+def _pool_for(camera=False):
+    """The browser pool for a variant, created on first use."""
+    if camera not in _browser_pools:
+        _browser_pools[camera] = BrowserPool(functools.partial(_create_driver, camera=camera),
+                                             size=_browser_pool_size)
+    return _browser_pools[camera]
+
+
+def _configure_sharding(config):
+    shard_count = config.getoption("--shard-count")
+    shard_index = config.getoption("--shard-index")
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise pytest.UsageError(f"--shard-index must be in 0..{shard_count - 1} (got {shard_index})")
+    if shard_count == 1 and not config.getoption("--store-durations"):
+        return
+    history = DurationHistory(config.getoption("--durations-file"), alpha=Config.DURATION_EMA_ALPHA)
+    if shard_count > 1:
+        config.pluginmanager.register(
+            ShardingPlugin(shard_index, shard_count, history, ROLE_FIXTURES, Config.SHARD_LOGIN_SECONDS),
+            "pulse-sharding",
+        )
+    if not config.option.collectonly:
+        config.pluginmanager.register(DurationRecorder(history), "pulse-durations")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    # After sharding/scenario selection: only the tests that will run count
+    camera_items = [item for item in items if item.get_closest_marker("camera")]
+    _camera_roles.update(ROLE_FIXTURES[name] for item in camera_items
+                         for name in item.fixturenames if name in ROLE_FIXTURES)
+    if config.option.collectonly:
+        return
+    if camera_items:
+        print(f"[POOL] {len(camera_items)} camera test(s); fake camera for role(s): "
+              f"{', '.join(sorted(_camera_roles)) or 'none'}")
+    # Start the browsers the selected tests will lease while the session sets up:
+    # one per session role (they are held until the end) plus one for `driver`
+    for camera in (False, True):
+        count = _browsers_needed(items, camera)
+        if count:
+            _pool_for(camera=camera).prewarm(min(count, _browser_pool_size))
+
+
+def _browsers_needed(items, camera):
+    """Browsers the selected items lease from the plain (or fake-camera) pool."""
+    roles = {ROLE_FIXTURES[name] for item in items for name in item.fixturenames if name in ROLE_FIXTURES}
+    roles = roles & _camera_roles if camera else roles - _camera_roles
+    uses_driver = any("driver" in item.fixturenames and
+                      (item.get_closest_marker("camera") is not None) == camera for item in items)
+    return len(roles) + uses_driver
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # Setup, call and teardown (incl. fixture logins) all count towards the test
+    if _sleep_profiler is not None:
+        _sleep_profiler.current_test = item.nodeid
+    if _tracer is not None:
+        _tracer.begin_test(item.nodeid)
+    # Page objects' capture_failure() calls go to this test's artifact directory
+    artifact_pipeline().current_test = item.nodeid
+    try:
+        yield
+    finally:
+        artifact_pipeline().current_test = None
+        if _tracer is not None:
+            _tracer.end_test()
+        if _sleep_profiler is not None:
+            _sleep_profiler.current_test = None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Failure evidence from every browser the test used; written in the background
+    outcome = yield
+    report = outcome.get_result()
+    if not report.failed or report.when not in ("setup", "call"):
+        return
+    seen = set()
+    for name, value in getattr(item, "funcargs", {}).items():
+        if not isinstance(value, WebDriver) or id(value) in seen:
+            continue
+        seen.add(id(value))
+        try:
+            directory = artifact_pipeline().capture(value, f"{report.when}_{name}", test=item.nodeid)
+        except Exception as e:
+            print(f"[ARTIFACT] [WARN] Could not capture {name}: {e}")
+            continue
+        report.user_properties.append(("artifacts", directory))
+        report.sections.append(("artifacts", f"{name}: {directory}"))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if _sleep_profiler is None:
+        return
+    terminalreporter.write_sep("=", "idle time by call site (--profile-sleeps)")
+    for line in _sleep_profiler.report_lines(top=config.getoption("--profile-sleeps-top")):
+        terminalreporter.write_line(line)
+
+
+def pytest_unconfigure(config):
+    artifact_pipeline().close()
+    for pool in _browser_pools.values():
+        pool.shutdown()
+    _browser_pools.clear()
+    if _tracer is not None:
+        _tracer.close()
+    if _sleep_profiler is not None:
+        _sleep_profiler.stop()
+    if _local_server is not None:
+        _local_server.stop()
+
+def _create_driver(camera=False):
+    """Helper function to create a Chrome driver (Config.BROWSER_PROFILE options)."""
+    driver = create_chrome_driver(camera=camera)
+    if _tracer is not None:
+        _tracer.attach(driver)
+    if _sleep_profiler is not None:
+        _sleep_profiler.attach(driver)
     return driver
 
 def _login_as_role(driver, role):
-    """Helper function to login with a specific role."""
+    """Helper function to login with a specific role.
+
+    Restores a saved session for the role when one is valid; otherwise logs in
+    through the UI and saves the resulting session for later fixtures/processes.
+    """
     credentials = TestData.get_credentials(role)
+    if _storage_states is not None and _storage_states.restore(driver, role, credentials["username"]):
+        return
+
     login_page = LoginPage(driver)
     login_page.navigate()
     login_page.login(credentials["username"], credentials["password"])
@@ -57,80 +332,130 @@ def _login_as_role(driver, role):
         WebDriverWait(driver, 5).until(
             lambda d: "/login" not in d.current_url.lower()
         )
+        if _storage_states is not None:
+            _storage_states.save(driver, role, credentials["username"])
     except Exception:
         # If URL doesn't change, just proceed - login might be successful anyway
         pass
 
+def _leased_driver(role=None, camera=False):
+    """Lease a warm driver from the pool, optionally logged in as `role`.
+
+    The driver comes from the fake-camera pool when `camera` is set or a
+    selected camera test uses this role. It is reset and returned to its
+    pool afterwards instead of being quit.
+    """
+    pool = _pool_for(camera or role in _camera_roles)
+    driver = pool.acquire()
+    try:
+        if role:
+            _login_as_role(driver, role)
+        yield driver
+    finally:
+        pool.release(driver)
+
 @pytest.fixture(scope="function")
-def driver():
+def driver(request):
     """Setup and teardown for Chrome driver (function scope)"""
-    driver = _create_driver()
-    yield driver
-    driver.quit()
+    yield from _leased_driver(camera=request.node.get_closest_marker("camera") is not None)
 
 @pytest.fixture(scope="session")
 def logged_in_driver():
     """Setup a logged-in driver with contractor role (backward compatibility)"""
-    driver = _create_driver()
-    _login_as_role(driver, "contractor")
-    yield driver
-    driver.quit()
+    yield from _leased_driver("contractor")
 
 @pytest.fixture(scope="session")
 def contractor_driver():
     """Setup a logged-in driver with contractor role - persists across tests"""
-    driver = _create_driver()
-    _login_as_role(driver, "contractor")
-    yield driver
-    driver.quit()
+    yield from _leased_driver("contractor")
 
 @pytest.fixture(scope="session")
 def admin_driver():
     """Setup a logged-in driver with admin role - persists across tests"""
-    driver = _create_driver()
-    _login_as_role(driver, "admin")
-    yield driver
-    driver.quit()
+    yield from _leased_driver("admin")
 
 @pytest.fixture(scope="session")
 def project_manager_driver():
     """Setup a logged-in driver with project manager role - persists across tests"""
-    driver = _create_driver()
-    _login_as_role(driver, "project_manager")
-    yield driver
-    driver.quit()
+    yield from _leased_driver("project_manager")
 
 @pytest.fixture(scope="session")
 def client_driver():
     """Setup a logged-in driver with client role - persists across tests"""
-    driver = _create_driver()
-    _login_as_role(driver, "client")
-    yield driver
-    driver.quit()
+    yield from _leased_driver("client")
 
 @pytest.fixture(scope="session")
 def contractor_incharge_driver():
     """Setup a logged-in driver with contractor incharge role - persists across tests"""
-    driver = _create_driver()
-    _login_as_role(driver, "contractor_incharge")
-    yield driver
-    driver.quit()
+    yield from _leased_driver("contractor_incharge")
 
 @pytest.fixture(scope="session")
 def block_engineer_driver():
     """Setup a logged-in driver with block engineer role - persists across tests"""
-    driver = _create_driver()
-    _login_as_role(driver, "block_engineer")
-    yield driver
-    driver.quit()
+    yield from _leased_driver("block_engineer")
 
 @pytest.fixture(scope="session")
 def quality_inspector_driver():
     """Setup a logged-in driver with quality inspector role - persists across tests"""
-    driver = _create_driver()
-    _login_as_role(driver, "quality_inspector")
-    yield driver
-    driver.quit()
+    yield from _leased_driver("quality_inspector")
+
+@pytest.fixture(scope="function")
+def rfi_handle():
+    """RFI created by an earlier step of this scenario (None: use the first RFI in the list)"""
+    handle = load_handle()
+    if handle is not None:
+        print(f"[HANDLE] Working on {handle}")
+    return handle
+
+@pytest.fixture(scope="session")
+def rfi_seeder():
+    """Seeds RFIs at a lifecycle stage through the API (None unless seeding is on)"""
+    if not Config.SEED_RFIS:
+        yield None
+        return
+    seeder = RfiSeeder()
+    yield seeder
+    seeder.close()
+
+def _rfi_at_stage(rfi_handle, rfi_seeder, stage):
+    """The scenario's RFI when one is set; otherwise a new RFI seeded at `stage`.
+
+    Falls back to None (first RFI in the list) when the API call fails; after
+    Config.SEED_MAX_FAILURES failures in a row the session stops trying.
+    """
+    global _seed_failures
+    if rfi_handle is not None or rfi_seeder is None or _seed_failures >= Config.SEED_MAX_FAILURES:
+        return rfi_handle
+    try:
+        handle = rfi_seeder.seed(stage)
+    except (requests.RequestException, ApiError, KeyError) as e:
+        _seed_failures += 1
+        giving_up = _seed_failures >= Config.SEED_MAX_FAILURES
+        log.warning("[SEED] Could not seed an RFI at stage %s through the API (%s) - using the first RFI in the list%s",
+                    stage, e, "; seeding is off for the rest of the session" if giving_up else "")
+        return None
+    _seed_failures = 0
+    return handle
+
+@pytest.fixture(scope="function")
+def rfi_pending_review(rfi_handle, rfi_seeder):
+    """RFI waiting for the block engineer's review"""
+    return _rfi_at_stage(rfi_handle, rfi_seeder, "pending_review")
+
+@pytest.fixture(scope="function")
+def rfi_pending_approval(rfi_handle, rfi_seeder):
+    """Reviewed RFI waiting for the block engineer's final approval"""
+    return _rfi_at_stage(rfi_handle, rfi_seeder, "pending_approval")
+
+@pytest.fixture(scope="function")
+def rfi_pending_inspection(rfi_handle, rfi_seeder):
+    """Reviewed RFI waiting for the quality inspection"""
+    return _rfi_at_stage(rfi_handle, rfi_seeder, "pending_inspection")
+
+@pytest.fixture(scope="function")
+def rfi_inspected(rfi_handle, rfi_seeder):
+    """Inspected RFI waiting for the quality team's final approval"""
+    return _rfi_at_stage(rfi_handle, rfi_seeder, "inspected")
 
 @pytest.fixture(scope="session")
 def base_url():
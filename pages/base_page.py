@@ -1,12 +1,285 @@
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from config.config import Config
+from utils.locator_cache import locator_cache
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+# Installs (once per document) a MutationObserver recording the time of the last
+# DOM change, then reports how long the DOM has been quiet and how many finite
+# animations are still running. Infinite animations (spinners) are ignored.
+_PAGE_SIGNALS_JS = """
+if (!window.__pulseSignals) {
+    window.__pulseSignals = {lastMutation: performance.now()};
+    new MutationObserver(() => { window.__pulseSignals.lastMutation = performance.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+const running = (document.getAnimations ? document.getAnimations() : []).filter(
+    a => a.playState === 'running' && a.effect && a.effect.getTiming().iterations !== Infinity
+);
+return {
+    quietMs: performance.now() - window.__pulseSignals.lastMutation,
+    animations: running.length
+};
+"""
+
+# Bounding box plus running (finite) animations on the element and its subtree
+_ELEMENT_BOX_JS = """
+const el = arguments[0];
+const r = el.getBoundingClientRect();
+const animations = (el.getAnimations ? el.getAnimations({subtree: true}) : []).filter(
+    a => a.playState === 'running' && a.effect && a.effect.getTiming().iterations !== Infinity
+);
+return [r.x, r.y, r.width, r.height, animations.length];
+"""
+
+# Counts in-flight fetch/XHR requests and records the time of the last network
+# start/finish. Registered for every new document (so it sees the app's first
+# requests) and injected into the current one on demand.
+_NETWORK_PROBE_SRC = """
+if (!window.__pulseNet) {
+    const net = window.__pulseNet = {inflight: 0, last: performance.now()};
+    const begin = () => { net.inflight++; net.last = performance.now(); };
+    const end = () => { net.inflight = Math.max(0, net.inflight - 1); net.last = performance.now(); };
+    if (window.fetch) {
+        const nativeFetch = window.fetch;
+        window.fetch = function (...args) {
+            begin();
+            try {
+                return nativeFetch.apply(this, args).finally(end);
+            } catch (e) {
+                end();
+                throw e;
+            }
+        };
+    }
+    const nativeSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        begin();
+        this.addEventListener('loadend', end, {once: true});
+        try {
+            return nativeSend.apply(this, args);
+        } catch (e) {
+            end();
+            throw e;
+        }
+    };
+}
+"""
+
+_NETWORK_STATE_JS = _NETWORK_PROBE_SRC + """
+return [window.__pulseNet.inflight, performance.now() - window.__pulseNet.last];
+"""
+
+# Restarts the quiet window right before a click, so an idle page only counts
+# as idle once the requests the click starts (if any) have had time to begin
+_NETWORK_ARM_JS = _NETWORK_PROBE_SRC + """
+window.__pulseNet.last = performance.now();
+"""
+
+# Collects every option of the open dropdown(s) in one round trip as compact
+# [label, value, state] rows, where state is 'selected', 'disabled' or ''.
+# Ark-style items ([data-part='item']) are preferred; plain <span> labels are
+# the fallback for lists that render text only.
+_DROPDOWN_ITEMS_SRC = """
+const openContents = document.querySelectorAll("[data-part='content'][data-state='open']");
+const contents = openContents.length ? openContents : document.querySelectorAll("[data-part='content']");
+const norm = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const items = [];
+contents.forEach((content) => {
+    const nodes = content.querySelectorAll("[data-part='item']");
+    if (nodes.length) {
+        nodes.forEach((node) => items.push({node, label: norm(node.textContent)}));
+    } else {
+        content.querySelectorAll('span').forEach((node) => {
+            const label = norm(node.textContent);
+            if (label) items.push({node, label});
+        });
+    }
+});
+const stateOf = (node) => {
+    if (node.hasAttribute('data-disabled') || node.getAttribute('aria-disabled') === 'true') return 'disabled';
+    if (node.getAttribute('data-state') === 'checked' || node.getAttribute('aria-selected') === 'true') return 'selected';
+    return '';
+};
+"""
+
+_HARVEST_OPTIONS_JS = _DROPDOWN_ITEMS_SRC + """
+return items.map(({node, label}) => [label, node.getAttribute('data-value') || label, stateOf(node)]);
+"""
+
+# Clicks the options whose label matches exactly (already-selected ones are left
+# alone); returns the matched elements and the labels not (yet) in the list.
+# With a `keep` list, selected options not in it are clicked off first.
+_SELECT_OPTIONS_JS = _DROPDOWN_ITEMS_SRC + """
+const [wanted, keep] = arguments;
+const clicked = [];
+const missing = [];
+if (keep) {
+    items.filter((item) => stateOf(item.node) === 'selected' && !keep.includes(item.label))
+        .forEach((item) => item.node.click());
+}
+wanted.forEach((label) => {
+    const match = items.find((item) => item.label === label && stateOf(item.node) !== 'disabled');
+    if (!match) {
+        missing.push(label);
+        return;
+    }
+    clicked.push(match.node);
+    if (stateOf(match.node) === 'selected') return;  // clicking again would deselect it
+    match.node.scrollIntoView({block: 'center'});
+    match.node.click();
+});
+return {clicked: clicked, missing: missing};
+"""
+
+# Evaluates every strategy in one call and returns [position, element] for the
+# first strategy (in the given order) that matches a usable element, or null.
+_FIRST_MATCH_JS = """
+const [strategies, requireVisible, scope] = arguments;
+const usable = (el) => !requireVisible
+    || ((el.offsetParent !== null || el.getClientRects().length > 0) && !el.disabled);
+const xpath = (value, context) => {
+    const snapshot = document.evaluate(value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const found = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) found.push(snapshot.snapshotItem(i));
+    return found;
+};
+// With a scope, every strategy is resolved relative to the scope's first match
+let root = document;
+if (scope) {
+    root = (scope[0] === 'xpath' ? xpath(scope[1], document) : Array.from(document.querySelectorAll(scope[1])))[0];
+    if (!root) return null;
+}
+const query = (by, value) => {
+    if (by === 'xpath') return xpath(value, root);
+    if (by === 'id') return [document.getElementById(value)].filter((el) => el && root.contains(el));
+    if (by === 'tag name') return Array.from(root.getElementsByTagName(value));
+    if (by === 'class name') return Array.from(root.getElementsByClassName(value));
+    if (by === 'name') return Array.from(document.getElementsByName(value)).filter((el) => root.contains(el));
+    return Array.from(root.querySelectorAll(value));
+};
+for (let i = 0; i < strategies.length; i++) {
+    let found = [];
+    try {
+        found = query(strategies[i][0], strategies[i][1]);
+    } catch (e) {
+        continue;  // invalid selector for this document - try the next strategy
+    }
+    const el = found.find(usable);
+    if (el) return [i, el];
+}
+return null;
+"""
+
+# Label -> control index of a form, built in one walk of its <label>s and kept
+# in the page. A control is the label's `for` target, else the first trigger/
+# input/textarea/select after the label (its siblings), else one inside it;
+# labels are keyed without the required-field '*'. A MutationObserver drops
+# the index only when an indexed control is removed or a label is added, so
+# handles stay valid across value changes and dropdowns opening.
+# Returns [version, control or null] for one label, [version, {label: control}]
+# for all of them; with `usable`, a hidden or disabled control counts as missing.
+_FORM_INDEX_JS = """
+const [rootSelector, wanted, usable] = arguments;
+const CONTROL = "button[data-part='trigger'], input:not([type='hidden']), textarea, select";
+const norm = (text) => (text || '').replace(/\\s+/g, ' ').replace(/\\s*\\*\\s*$/, '').trim();
+let index = window.__pulseForm;
+if (!index) {
+    index = window.__pulseForm = {fields: null, root: null, controls: new Set(), version: 0};
+    const touches = (nodes) => Array.from(nodes).some((node) => node.nodeType === 1 && (
+        index.controls.has(node) || Array.from(index.controls).some((control) => node.contains(control))
+        || node.matches('label') || node.querySelector('label') !== null));
+    new MutationObserver((records) => {
+        if (index.fields && records.some((r) => touches(r.removedNodes) || touches(r.addedNodes))) {
+            index.fields = null;
+            index.version++;
+        }
+    }).observe(document, {childList: true, subtree: true});
+}
+if (!index.fields || index.root !== rootSelector) {
+    const root = rootSelector ? document.querySelector(rootSelector) : document;
+    if (!root) return [index.version, wanted ? null : {}];
+    index.fields = {};
+    index.root = rootSelector;
+    index.controls = new Set();
+    root.querySelectorAll('label').forEach((label) => {
+        const name = norm(label.textContent);
+        if (!name || name in index.fields) return;
+        let control = label.htmlFor ? document.getElementById(label.htmlFor) : null;
+        for (let sib = label.nextElementSibling; !control && sib; sib = sib.nextElementSibling) {
+            control = sib.matches(CONTROL) ? sib : sib.querySelector(CONTROL);
+        }
+        control = control || label.querySelector(CONTROL);
+        if (control) {
+            index.fields[name] = control;
+            index.controls.add(control);
+        }
+    });
+}
+const ok = (el) => !usable || ((el.offsetParent !== null || el.getClientRects().length > 0) && !el.disabled);
+if (wanted) {
+    const control = index.fields[norm(wanted)];
+    return [index.version, control && ok(control) ? control : null];
+}
+return [index.version, index.fields];
+"""
+
+# Displayed value of every indexed form field: an input's value, else the
+# control's text ('' while an Ark trigger shows its placeholder).
+_FORM_VALUES_JS = "const fields = (function () {" + _FORM_INDEX_JS + "}).apply(null, [arguments[0], null, false])[1];" + """
+const values = {};
+Object.entries(fields).forEach(([label, el]) => {
+    values[label] = el.tagName === 'INPUT' || el.tagName === 'TEXTAREA' || el.tagName === 'SELECT'
+        ? el.value
+        : (el.hasAttribute('data-placeholder-shown') ? '' : (el.textContent || '').replace(/\\s+/g, ' ').trim());
+});
+return values;
+"""
+
+
+def xpath_literal(text):
+    """`text` as an XPath string literal, even when it contains both quote kinds.
+
+    XPath 1.0 has no escapes, so a value with ' and " is built with concat().
+    """
+    text = str(text)
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
 
 class BasePage:
+    # Polling interval for the browser-signal waits below
+    SIGNAL_POLL_INTERVAL = 0.05
+    # How long the DOM must stay unchanged to count as settled
+    DOM_QUIET_MS = 150
+    # How long no fetch/XHR may be in flight to count as network idle
+    NETWORK_QUIET_MS = 100
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
+        self._install_network_probe()
+
+    def _install_network_probe(self):
+        """Register the fetch/XHR probe for every new document (once per driver)."""
+        if getattr(self.driver, "_pulse_network_probe", False):
+            return
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": _NETWORK_PROBE_SRC}
+            )
+        except Exception:
+            pass  # No CDP (non-Chromium driver): the probe is injected lazily instead
+        self.driver._pulse_network_probe = True
     
     def find_element(self, locator):
         return self.wait.until(EC.presence_of_element_located(locator))
@@ -68,4 +341,308 @@ class BasePage:
     def wait_for_element_visible(self, locator, timeout=None):
         """Wait for element to become visible."""
         t = timeout if timeout is not None else Config.EXPLICIT_WAIT
-        return self.wait.until(EC.visibility_of_element_located(locator))
\ No newline at end of file
+        return self.wait.until(EC.visibility_of_element_located(locator))
+
+    # -----------------------------------------------------
+    # BROWSER-SIGNAL WAITS (replace fixed time.sleep calls)
+    # -----------------------------------------------------
+    def _signal_wait(self, timeout=None):
+        t = timeout if timeout is not None else Config.EXPLICIT_WAIT
+        return WebDriverWait(self.driver, t, poll_frequency=self.SIGNAL_POLL_INTERVAL)
+
+    def _page_signals(self):
+        return self.driver.execute_script(_PAGE_SIGNALS_JS)
+
+    def wait_for_dom_stable(self, quiet_ms=None, timeout=None):
+        """Wait until the DOM has not mutated for `quiet_ms` milliseconds.
+
+        Returns True when settled, False if the DOM kept changing until timeout.
+        """
+        quiet_ms = self.DOM_QUIET_MS if quiet_ms is None else quiet_ms
+        try:
+            self._signal_wait(timeout).until(lambda d: self._page_signals()["quietMs"] >= quiet_ms)
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_animations(self, timeout=None):
+        """Wait until no finite CSS/Web animation is running (transitions, accordions, dialogs)."""
+        try:
+            self._signal_wait(timeout).until(lambda d: self._page_signals()["animations"] == 0)
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_settled(self, quiet_ms=None, timeout=None):
+        """Wait until the DOM is quiet and no animation is running."""
+        quiet_ms = self.DOM_QUIET_MS if quiet_ms is None else quiet_ms
+
+        def settled(driver):
+            signals = self._page_signals()
+            return signals["quietMs"] >= quiet_ms and signals["animations"] == 0
+
+        try:
+            self._signal_wait(timeout).until(settled)
+            return True
+        except TimeoutException:
+            return False
+
+    def wait_for_element_stable(self, element_or_locator, timeout=None):
+        """Wait until an element stops moving/resizing and has no running animation.
+
+        Accepts a WebElement or a locator tuple. Returns the element.
+        """
+        element = element_or_locator
+        if isinstance(element_or_locator, tuple):
+            element = self.find_element(element_or_locator)
+
+        last_box = [None]
+
+        def stable(driver):
+            box = driver.execute_script(_ELEMENT_BOX_JS, element)
+            steady = box[4] == 0 and box[:4] == last_box[0]
+            last_box[0] = box[:4]
+            return steady
+
+        try:
+            self._signal_wait(timeout).until(stable)
+        except TimeoutException:
+            pass
+        return element
+
+    def wait_for_network_idle(self, quiet_ms=None, timeout=None):
+        """Wait until no fetch/XHR request has been in flight for `quiet_ms` milliseconds.
+
+        Returns True when idle, False if requests kept running until timeout.
+        """
+        quiet_ms = self.NETWORK_QUIET_MS if quiet_ms is None else quiet_ms
+
+        def idle(driver):
+            inflight, idle_ms = driver.execute_script(_NETWORK_STATE_JS)
+            return inflight == 0 and idle_ms >= quiet_ms
+
+        try:
+            self._signal_wait(timeout).until(idle)
+            return True
+        except TimeoutException:
+            return False
+
+    def click_and_wait_for_network(self, element, timeout=None):
+        """Click something that navigates or loads data (menu, tab, list row, submit).
+
+        Waits for the requests the click starts to finish, rather than for the
+        DOM to go quiet: a route change can pause between rendering the shell
+        and rendering the data. Keep wait_for_dom_stable() for in-place re-renders.
+        """
+        self.driver.execute_script(_NETWORK_ARM_JS)
+        element.click()
+        return self.wait_for_network_idle(timeout=timeout)
+
+    def wait_for_attribute(self, element, name, value, timeout=None):
+        """Wait until `element` has attribute `name` equal to `value` (e.g. data-state='open')."""
+        try:
+            self._signal_wait(timeout).until(lambda d: element.get_attribute(name) == value)
+            return True
+        except TimeoutException:
+            return False
+
+    # -----------------------------------------------------
+    # DROPDOWN OPTIONS (one round trip per call)
+    # -----------------------------------------------------
+    def get_dropdown_options(self):
+        """Return every option of the open dropdown in a single execute_script call.
+
+        Returns a list of dicts: {"label", "value", "selected", "disabled"}.
+        """
+        rows = self.driver.execute_script(_HARVEST_OPTIONS_JS)
+        return [
+            {"label": label, "value": value, "selected": state == "selected", "disabled": state == "disabled"}
+            for label, value, state in rows
+        ]
+
+    def get_dropdown_labels(self):
+        """Return just the option labels of the open dropdown."""
+        return [row[0] for row in self.driver.execute_script(_HARVEST_OPTIONS_JS)]
+
+    def select_dropdown_options(self, labels, timeout=None, exclusive=False):
+        """Click the options with the given labels in the open dropdown.
+
+        Each poll is a single execute_script call. Options still missing (e.g. a
+        filtered list that is loading) are retried until `timeout`. With
+        `exclusive` (multi-selects), other selected options are deselected.
+        Returns the clicked elements; raises TimeoutException if an option never appears.
+        """
+        remaining = list(labels)
+        clicked = []
+
+        def select(driver):
+            result = driver.execute_script(_SELECT_OPTIONS_JS, remaining, list(labels) if exclusive else None)
+            clicked.extend(result["clicked"])
+            remaining[:] = result["missing"]
+            return not remaining
+
+        try:
+            self._signal_wait(timeout).until(select)
+        except TimeoutException:
+            raise TimeoutException(
+                f"Dropdown option(s) {remaining} not found. Available: {self.get_dropdown_labels()[:20]}"
+            )
+        return clicked
+
+    # -----------------------------------------------------
+    # FALLBACK LOCATORS (learned order, one query per poll)
+    # -----------------------------------------------------
+    def find_first(self, name, locators, timeout=None, require_visible=True, scope=None, catch_all=False):
+        """Find an element through an ordered list of fallback locators.
+
+        All strategies are evaluated together in one in-page query per poll, so a
+        missing strategy costs nothing instead of a full timeout. The strategy that
+        wins is remembered under `name` (across runs) and tried first next time.
+
+        Args:
+            name: Logical element name, e.g. "login.button"
+            locators: Ordered (By, value) fallback locators
+            timeout: Seconds to wait for any strategy to match
+            require_visible: Only accept displayed, enabled elements
+            scope: (By.XPATH or By.CSS_SELECTOR, value) of the element the locators
+                are relative to (e.g. ".//button" inside one section), so the same
+                learned locator serves every section sharing `name`
+            catch_all: The last locator is a generic last resort: it is always
+                tried last and never remembered, so it cannot shadow a specific
+                strategy on later lookups
+
+        Returns:
+            The matching WebElement. Raises TimeoutException if none matches.
+        """
+        learnable = locators[:-1] if catch_all else locators
+        order = locator_cache.order(name, learnable) + list(range(len(learnable), len(locators)))
+        strategies = [list(locators[i]) for i in order]
+        match = []
+
+        def first_match(driver):
+            result = driver.execute_script(_FIRST_MATCH_JS, strategies, require_visible,
+                                           list(scope) if scope else None)
+            if result:
+                match[:] = result
+            return bool(result)
+
+        try:
+            self._signal_wait(timeout).until(first_match)
+        except TimeoutException:
+            raise TimeoutException(f"'{name}' not found with any of {len(locators)} locator strategies")
+
+        index = order[match[0]]
+        if index < len(learnable):
+            locator_cache.record(name, locators[index])
+        return match[1]
+
+    # -----------------------------------------------------
+    # FORM FIELD INDEX (label -> control, one in-page walk)
+    # -----------------------------------------------------
+    # CSS selector of the form the index is built for (None: whole document)
+    FORM_ROOT = None
+
+    def form_fields(self):
+        """Every labelled control of FORM_ROOT as {label: WebElement}.
+
+        The index is built in the page in one pass and reused until the form's
+        structure changes, so the returned handles stay stable between calls.
+        """
+        return self.driver.execute_script(_FORM_INDEX_JS, self.FORM_ROOT, None, False)[1]
+
+    def form_values(self):
+        """What every indexed field currently shows, as {label: text} ('' when empty), in one call."""
+        return self.driver.execute_script(_FORM_VALUES_JS, self.FORM_ROOT)
+
+    def form_field(self, label, timeout=None, clickable=False, fallback=None):
+        """The control labelled `label` (e.g. "Plot No."; a trailing '*' is ignored).
+
+        Each poll is one index lookup instead of a document-wide XPath text scan.
+
+        Args:
+            label: Field label text
+            timeout: Seconds to wait for the field to appear
+            clickable: Also wait until the control is displayed and enabled
+            fallback: Locator tried once if the index never finds the label
+
+        Returns:
+            The WebElement. Raises TimeoutException if the field never appears.
+        """
+        found = []
+
+        def lookup(driver):
+            control = driver.execute_script(_FORM_INDEX_JS, self.FORM_ROOT, label, clickable)[1]
+            if control is not None:
+                found[:] = [control]
+            return control is not None
+
+        try:
+            self._signal_wait(timeout).until(lookup)
+            return found[0]
+        except TimeoutException:
+            if fallback is not None:
+                for element in self.driver.find_elements(*fallback):
+                    if not clickable or (element.is_displayed() and element.is_enabled()):
+                        log.warning("Field '%s' not in the form index - found it by locator", label)
+                        return element
+            raise TimeoutException(f"Form field '{label}' not found")
+
+    # -----------------------------------------------------
+    # OPENING A SPECIFIC RFI (RfiHandle)
+    # -----------------------------------------------------
+    RFI_SEARCH_INPUT = (By.XPATH, "//input[@type='search' or contains(@placeholder, 'Search')]")
+    RFI_ROW = "//table//tr[@data-testid='rfi-row' or contains(@class, 'table-row')]"
+    # Name of the Config setting with this page's detail route, e.g.
+    # "RFI_DETAIL_PATH" -> /rfis/<id>; None or an unset route: search only
+    RFI_DETAIL_ROUTE = None
+
+    def click_rfi_row(self, handle=None, first_row_locator=None):
+        """Open the RFI behind `handle` from the current RFI list.
+
+        Searches the list for the handle and clicks the row that contains it.
+        The direct detail URL is tried first only when the RFI number is known
+        and the page's detail route is configured (RFI_DETAIL_ROUTE).
+        Without a handle the first row is clicked (single-runner behaviour).
+        Returns once the requests of the opened RFI have finished.
+        """
+        if handle is None:
+            self.click_and_wait_for_network(self.wait.until(EC.element_to_be_clickable(first_row_locator)))
+            return
+        detail_path = getattr(Config, self.RFI_DETAIL_ROUTE) if self.RFI_DETAIL_ROUTE else None
+        if handle.rfi_id and detail_path and self._open_rfi_by_url(detail_path, handle.rfi_id):
+            return
+        self._open_rfi_by_search(handle)
+
+    def _open_rfi_by_url(self, detail_path, rfi_id):
+        list_url = self.driver.current_url
+        self.driver.get(f"{Config.BASE_URL}{detail_path}/{rfi_id}")
+        try:
+            self.wait.until(EC.visibility_of_element_located(
+                (By.XPATH, f"//*[self::h1 or self::h2 or self::h3][contains(normalize-space(), {xpath_literal(rfi_id)})]")
+            ))
+            log.info("[HANDLE] Opened %s by URL", rfi_id)
+            return True
+        except TimeoutException:
+            log.warning("[HANDLE] %s not shown at its detail URL - searching the list instead", rfi_id)
+            self.driver.get(list_url)
+            self.wait_for_page_load()
+            return False
+
+    def _open_rfi_by_search(self, handle):
+        text = handle.search_text
+        searches = [el for el in self.driver.find_elements(*self.RFI_SEARCH_INPUT) if el.is_displayed()]
+        if searches:
+            searches[0].clear()
+            searches[0].send_keys(text)
+            # Let the search request land so the row found below is from the filtered list
+            self.wait_for_network_idle()
+        row = (By.XPATH, f"({self.RFI_ROW}[contains(normalize-space(), {xpath_literal(text)})])[1]")
+
+        try:
+            # The list re-renders while the search applies; a row going stale is looked up again
+            element = WebDriverWait(self.driver, 10, ignored_exceptions=(StaleElementReferenceException,)).until(
+                EC.element_to_be_clickable(row))
+        except TimeoutException:
+            raise TimeoutException(f"RFI {handle} not found in the list (searched for '{text}')")
+        self.click_and_wait_for_network(element)
+        log.info("[HANDLE] Opened RFI matching '%s' from the list", text)
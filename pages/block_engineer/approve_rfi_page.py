@@ -2,7 +2,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
-import time
+from utils.logger import get_logger
+
+log = get_logger(__name__)
 
 
 class ApproveRfiPage(BasePage):
@@ -21,6 +23,7 @@ class ApproveRfiPage(BasePage):
     
     # RFI List
     FIRST_RFI_ROW = (By.XPATH, "(//table//tr[@data-testid='rfi-row' or contains(@class, 'table-row')])[1]")
+    RFI_DETAIL_ROUTE = "RFI_DETAIL_PATH"
     APPROVE_BUTTON = (By.XPATH, "//button[contains(text(), 'Final Approve') or contains(text(), 'Approve')]")
     
     # Approval Section
@@ -36,37 +39,41 @@ class ApproveRfiPage(BasePage):
 
     def navigate(self):
         """Navigate to RFI approval page."""
-        print("[INFO] Navigating to RFI approval page...")
+        log.info("Navigating to RFI approval page...")
         try:
             rfi_menu = self.wait.until(EC.element_to_be_clickable(self.RFI_LIST_MENU))
-            rfi_menu.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Navigated to RFI list")
+            self.click_and_wait_for_network(rfi_menu)
+            log.success("Navigated to RFI list")
         except Exception as e:
-            print(f"[ERROR] Failed to navigate: {str(e)}")
+            log.error("Failed to navigate: %s", e)
             raise
 
     def go_to_approved_list(self):
         """Click on approved RFIs tab."""
-        print("[ACTION] Opening approved RFIs...")
+        log.action("Opening approved RFIs...")
         try:
             approved_tab = self.wait.until(EC.element_to_be_clickable(self.APPROVED_TAB))
-            approved_tab.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Opened approved RFIs")
+            self.click_and_wait_for_network(approved_tab)
+            log.success("Opened approved RFIs")
         except Exception as e:
-            print(f"[WARNING] Approved tab not found: {str(e)}")
+            log.warning("Approved tab not found: %s", e)
 
     def open_first_rfi(self):
         """Open the first RFI in the list."""
-        print("[ACTION] Opening first RFI for final approval...")
+        self.open_rfi()
+
+    def open_rfi(self, handle=None):
+        """Open the RFI behind `handle` for final approval (the first RFI when None).
+
+        Args:
+            handle: RfiHandle of the scenario's RFI
+        """
+        log.action("Opening %s for final approval...", handle or 'first RFI')
         try:
-            first_rfi = self.wait.until(EC.element_to_be_clickable(self.FIRST_RFI_ROW))
-            first_rfi.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Opened RFI")
+            self.click_rfi_row(handle, self.FIRST_RFI_ROW)
+            log.success("Opened RFI")
         except Exception as e:
-            print(f"[ERROR] Failed to open RFI: {str(e)}")
+            log.error("Failed to open RFI: %s", e)
             raise
 
     def add_approval_notes(self, notes):
@@ -75,38 +82,37 @@ class ApproveRfiPage(BasePage):
         Args:
             notes: Approval notes text
         """
-        print(f"[ACTION] Adding approval notes: {notes}")
+        log.action("Adding approval notes: %s", notes)
         try:
             notes_field = self.wait.until(EC.visibility_of_element_located(self.APPROVAL_NOTES_TEXTAREA))
             notes_field.clear()
             notes_field.send_keys(notes)
-            print("[SUCCESS] Added approval notes")
+            log.success("Added approval notes")
         except Exception as e:
-            print(f"[WARNING] Could not add approval notes: {str(e)}")
+            log.warning("Could not add approval notes: %s", e)
 
     def click_approve(self):
         """Click the approve button."""
-        print("[ACTION] Clicking Approve...")
+        log.action("Clicking Approve...")
         try:
             approve_btn = self.wait.until(EC.element_to_be_clickable(self.APPROVE_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", approve_btn)
-            time.sleep(0.2)
+            self.wait_for_element_stable(approve_btn)
             approve_btn.click()
-            print("[SUCCESS] Clicked Approve")
+            log.success("Clicked Approve")
         except Exception as e:
-            print(f"[ERROR] Failed to click approve: {str(e)}")
+            log.error("Failed to click approve: %s", e)
             raise
 
     def confirm_approval(self):
         """Confirm the final approval."""
-        print("[ACTION] Confirming approval...")
+        log.action("Confirming approval...")
         try:
             confirm_btn = self.wait.until(EC.element_to_be_clickable(self.CONFIRM_APPROVE_BUTTON))
-            confirm_btn.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Approval confirmed")
+            self.click_and_wait_for_network(confirm_btn)
+            log.success("Approval confirmed")
         except Exception as e:
-            print(f"[ERROR] Failed to confirm approval: {str(e)}")
+            log.error("Failed to confirm approval: %s", e)
             raise
 
     def is_success_displayed(self):
@@ -117,18 +123,19 @@ class ApproveRfiPage(BasePage):
         except:
             return False
 
-    def approve_rfi(self, notes="Final approval granted"):
+    def approve_rfi(self, notes="Final approval granted", handle=None):
         """Complete RFI approval workflow.
         
         Args:
             notes: Approval notes (default: "Final approval granted")
+            handle: RfiHandle of the RFI to work on (default: first in the list)
         """
-        print("\n=== STARTING RFI APPROVAL WORKFLOW ===")
+        log.info("=== STARTING RFI APPROVAL WORKFLOW ===")
         
         self.go_to_approved_list()
-        self.open_first_rfi()
+        self.open_rfi(handle)
         self.add_approval_notes(notes)
         self.click_approve()
         self.confirm_approval()
         
-        print("=== RFI APPROVAL COMPLETED ===\n")
+        log.info("=== RFI APPROVAL COMPLETED ===")
@@ -2,7 +2,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
-import time
+from utils.logger import get_logger
+
+log = get_logger(__name__)
 
 
 class ReviewRfiPage(BasePage):
@@ -21,6 +23,7 @@ class ReviewRfiPage(BasePage):
     
     # RFI List
     FIRST_RFI_ROW = (By.XPATH, "(//table//tr[@data-testid='rfi-row' or contains(@class, 'table-row')])[1]")
+    RFI_DETAIL_ROUTE = "RFI_DETAIL_PATH"
     VIEW_BUTTON = (By.XPATH, "//button[contains(text(), 'View') or contains(text(), 'Details')]")
     
     # Review Section
@@ -39,46 +42,49 @@ class ReviewRfiPage(BasePage):
 
     def navigate(self):
         """Navigate to RFI review page."""
-        print("[INFO] Navigating to RFI review page...")
+        log.info("Navigating to RFI review page...")
         try:
             rfi_menu = self.wait.until(EC.element_to_be_clickable(self.RFI_LIST_MENU))
-            rfi_menu.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Navigated to RFI list")
+            self.click_and_wait_for_network(rfi_menu)
+            log.success("Navigated to RFI list")
         except Exception as e:
-            print(f"[ERROR] Failed to navigate: {str(e)}")
+            log.error("Failed to navigate: %s", e)
             raise
 
     def go_to_pending_reviews(self):
         """Click on pending reviews tab."""
-        print("[ACTION] Opening pending reviews...")
+        log.action("Opening pending reviews...")
         try:
             pending_tab = self.wait.until(EC.element_to_be_clickable(self.PENDING_TAB))
-            pending_tab.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Opened pending reviews")
+            self.click_and_wait_for_network(pending_tab)
+            log.success("Opened pending reviews")
         except Exception as e:
-            print(f"[WARNING] Pending tab not found or already on pending view: {str(e)}")
+            log.warning("Pending tab not found or already on pending view: %s", e)
 
     def open_first_rfi(self):
         """Open the first RFI in the list."""
-        print("[ACTION] Opening first RFI for review...")
+        self.open_rfi()
+
+    def open_rfi(self, handle=None):
+        """Open the RFI behind `handle` for review (the first RFI when None).
+
+        Args:
+            handle: RfiHandle of the scenario's RFI
+        """
+        log.action("Opening %s for review...", handle or 'first RFI')
         try:
-            first_rfi = self.wait.until(EC.element_to_be_clickable(self.FIRST_RFI_ROW))
-            first_rfi.click()
-            time.sleep(0.5)
+            self.click_rfi_row(handle, self.FIRST_RFI_ROW)
             
             # Try to click View button if exists
             try:
                 view_btn = self.wait.until(EC.element_to_be_clickable(self.VIEW_BUTTON))
-                view_btn.click()
-                time.sleep(0.5)
+                self.click_and_wait_for_network(view_btn)
             except:
                 pass  # View button may not exist if RFI opens directly
             
-            print("[SUCCESS] Opened RFI for review")
+            log.success("Opened RFI for review")
         except Exception as e:
-            print(f"[ERROR] Failed to open RFI: {str(e)}")
+            log.error("Failed to open RFI: %s", e)
             raise
 
     def add_review_comments(self, comments):
@@ -87,54 +93,53 @@ class ReviewRfiPage(BasePage):
         Args:
             comments: Review comments text
         """
-        print(f"[ACTION] Adding review comments: {comments}")
+        log.action("Adding review comments: %s", comments)
         try:
             comments_field = self.wait.until(EC.visibility_of_element_located(self.REVIEW_COMMENTS_TEXTAREA))
             comments_field.clear()
             comments_field.send_keys(comments)
-            print("[SUCCESS] Added review comments")
+            log.success("Added review comments")
         except Exception as e:
-            print(f"[ERROR] Failed to add comments: {str(e)}")
+            log.error("Failed to add comments: %s", e)
             raise
 
     def approve_rfi(self):
         """Approve the RFI."""
-        print("[ACTION] Approving RFI...")
+        log.action("Approving RFI...")
         try:
             approve_btn = self.wait.until(EC.element_to_be_clickable(self.APPROVE_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", approve_btn)
-            time.sleep(0.2)
+            self.wait_for_element_stable(approve_btn)
             approve_btn.click()
-            print("[SUCCESS] Clicked Approve button")
+            log.success("Clicked Approve button")
         except Exception as e:
-            print(f"[ERROR] Failed to approve: {str(e)}")
+            log.error("Failed to approve: %s", e)
             raise
 
     def request_changes(self):
         """Request changes to the RFI."""
-        print("[ACTION] Requesting changes...")
+        log.action("Requesting changes...")
         try:
             request_btn = self.wait.until(EC.element_to_be_clickable(self.REQUEST_CHANGES_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", request_btn)
-            time.sleep(0.2)
+            self.wait_for_element_stable(request_btn)
             request_btn.click()
-            print("[SUCCESS] Clicked Request Changes button")
+            log.success("Clicked Request Changes button")
         except Exception as e:
-            print(f"[ERROR] Failed to request changes: {str(e)}")
+            log.error("Failed to request changes: %s", e)
             raise
 
     def submit_review(self):
         """Submit the review."""
-        print("[ACTION] Submitting review...")
+        log.action("Submitting review...")
         try:
             submit_btn = self.wait.until(EC.element_to_be_clickable(self.SUBMIT_REVIEW_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", submit_btn)
-            time.sleep(0.2)
-            submit_btn.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Review submitted")
+            self.wait_for_element_stable(submit_btn)
+            self.click_and_wait_for_network(submit_btn)
+            log.success("Review submitted")
         except Exception as e:
-            print(f"[ERROR] Failed to submit review: {str(e)}")
+            log.error("Failed to submit review: %s", e)
             raise
 
     def is_success_displayed(self):
@@ -145,17 +150,18 @@ class ReviewRfiPage(BasePage):
         except:
             return False
 
-    def review_rfi(self, comments="Reviewed and approved", approve=True):
+    def review_rfi(self, comments="Reviewed and approved", approve=True, handle=None):
         """Complete RFI review workflow.
         
         Args:
             comments: Review comments (default: "Reviewed and approved")
             approve: True to approve, False to request changes
+            handle: RfiHandle of the RFI to work on (default: first in the list)
         """
-        print("\n=== STARTING RFI REVIEW WORKFLOW ===")
+        log.info("=== STARTING RFI REVIEW WORKFLOW ===")
         
         self.go_to_pending_reviews()
-        self.open_first_rfi()
+        self.open_rfi(handle)
         self.add_review_comments(comments)
         
         if approve:
@@ -165,4 +171,4 @@ class ReviewRfiPage(BasePage):
         
         self.submit_review()
         
-        print("=== RFI REVIEW COMPLETED ===\n")
+        log.info("=== RFI REVIEW COMPLETED ===")
@@ -5,7 +5,12 @@ from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from pages.base_page import BasePage
 from config.config import Config
-import time
+from utils.artifacts import capture_failure
+from utils.rfi_handle import RfiHandle
+from utils.rfi_record import RfiRecord
+from utils.logger import get_logger
+
+log = get_logger(__name__)
 
 
 class CreateRfiPage(BasePage):
@@ -13,7 +18,24 @@ class CreateRfiPage(BasePage):
 
     CREATE_RFI_BUTTON = (By.XPATH, "//button[normalize-space()='Create RFI']")
     FORM_CONTAINER = (By.CSS_SELECTOR, ".steps__content.h_full.ov_auto")
+    # The form index (BasePage.form_field) is built under the stepper content
+    FORM_ROOT = FORM_CONTAINER[1]
+
+    # Form fields, by label (resolved through the form index)
+    PLOT_FIELD = "Plot No."
+    BLOCK_FIELD = "Block No."
+    PACKAGE_FIELD = "Package"
+    SUBPACKAGE_FIELD = "Sub-Package"
+    ACTIVITY_FIELD = "Activity"
+    SUBACTIVITY_FIELD = "Sub-Activity"
+    LOCATION_FIELD = "Location"
+    QUANTITY_FIELD = "Quantity"
+    UNIT_FIELD = "Unit of Measurement"
+    SUBCONTRACTOR_FIELD = "Sub Contractor"
+    INSPECTION_CHECKPOINT_FIELD = "Inspection Checkpoint"
+    INSPECTION_CHECKLIST_FIELD = "Inspection Checklist"
 
+    # Label-relative locators, used only if a label is missing from the form index
     # Dropdown triggers
     PLOT_TRIGGER = (By.XPATH, "//label[.//span[normalize-space()='Plot No. *']]/following-sibling::div//button[@data-part='trigger']")
     BLOCK_TRIGGER = (By.XPATH, "//label[.//span[normalize-space()='Block No. *']]/following-sibling::div//button[@data-part='trigger']")
@@ -30,6 +52,38 @@ class CreateRfiPage(BasePage):
     QUANTITY_INPUT = (By.XPATH, "//input[@placeholder='Enter Quantity']")
     SUBCONTRACTOR_INPUT = (By.XPATH, "//input[@placeholder='Enter sub contractor name']")
 
+    # Fill order, with the field whose change clears each one (the app resets
+    # dependent fields when a parent changes)
+    FORM_CASCADE = [
+        (PLOT_FIELD, None),
+        (BLOCK_FIELD, PLOT_FIELD),
+        (PACKAGE_FIELD, BLOCK_FIELD),
+        (SUBPACKAGE_FIELD, PACKAGE_FIELD),
+        (ACTIVITY_FIELD, SUBPACKAGE_FIELD),
+        (SUBACTIVITY_FIELD, ACTIVITY_FIELD),
+        (LOCATION_FIELD, SUBACTIVITY_FIELD),
+        (QUANTITY_FIELD, LOCATION_FIELD),
+        (UNIT_FIELD, None),
+        (SUBCONTRACTOR_FIELD, None),
+        (INSPECTION_CHECKPOINT_FIELD, SUBACTIVITY_FIELD),
+        (INSPECTION_CHECKLIST_FIELD, INSPECTION_CHECKPOINT_FIELD),
+    ]
+
+    FIELD_FALLBACKS = {
+        PLOT_FIELD: PLOT_TRIGGER,
+        BLOCK_FIELD: BLOCK_TRIGGER,
+        PACKAGE_FIELD: PACKAGE_TRIGGER,
+        SUBPACKAGE_FIELD: SUBPACKAGE_TRIGGER,
+        ACTIVITY_FIELD: ACTIVITY_TRIGGER,
+        SUBACTIVITY_FIELD: SUBACTIVITY_TRIGGER,
+        LOCATION_FIELD: LOCATION_INPUT,
+        QUANTITY_FIELD: QUANTITY_INPUT,
+        UNIT_FIELD: UNIT_TRIGGER,
+        SUBCONTRACTOR_FIELD: SUBCONTRACTOR_INPUT,
+        INSPECTION_CHECKPOINT_FIELD: INSPECTION_CHECKPOINT_TRIGGER,
+        INSPECTION_CHECKLIST_FIELD: INSPECTION_CHECKLIST_TRIGGER,
+    }
+
     # Buttons
     PROCEED_BUTTON = (By.XPATH, "//button[normalize-space()='Proceed']")
     SUBMIT_BUTTON = (By.XPATH, "//button[normalize-space()='Submit']")
@@ -47,104 +101,91 @@ class CreateRfiPage(BasePage):
         except Exception:
             pass
 
+    def field(self, target, clickable=True):
+        """Element for a field label (via the form index) or a locator tuple."""
+        if isinstance(target, str):
+            return self.form_field(target, timeout=10, clickable=clickable,
+                                   fallback=self.FIELD_FALLBACKS.get(target))
+        condition = EC.element_to_be_clickable if clickable else EC.visibility_of_element_located
+        return self.wait.until(condition(target))
+
     def safe_click(self, locator):
-        """Click element only when clickable."""
-        el = self.wait.until(EC.element_to_be_clickable(locator))
+        """Click element (field label or locator) only when clickable."""
+        el = self.field(locator)
         self.scroll_into_view(el)
         self.driver.execute_script("arguments[0].click();", el)
         return el
 
     def safe_input(self, locator, text):
         """Type text and confirm persistence instantly."""
-        el = self.wait.until(EC.visibility_of_element_located(locator))
+        el = self.field(locator)
         self.scroll_into_view(el)
         el.clear()
         el.send_keys(text)
         el.send_keys(Keys.TAB)
         self.wait.until(lambda d: text.lower() in (el.get_attribute("value") or "").lower())
-        print(f"[INPUT] {text} -> {locator}")
+        log.debug("[INPUT] %s -> %s", text, locator)
         return el
 
-    def wait_for_field_ready(self, locator, field_name, timeout=2):
-        """Wait until field becomes visible & enabled."""
-        self.wait.until(lambda d: d.find_element(*locator).is_enabled())
-        print(f"[READY] {field_name}")
-        return True
-
     # ---------- dropdown logic ----------
 
-    def select_dropdown_with_dependency_wait(
-        self, trigger_locator, option_text, dependent_field_locator=None,
-        dependent_field_name=None, is_multiselect=False
-    ):
+    def wait_for_dropdown_options(self, timeout=None):
+        """Wait until the open dropdown has rendered its (API-loaded) options and return their labels."""
+        def loaded_options(driver):
+            return self.get_dropdown_labels() or False
+
+        try:
+            return self._signal_wait(timeout).until(loaded_options)
+        except TimeoutException:
+            return []
+
+    def select_dropdown_with_dependency_wait(self, trigger_locator, option_text, is_multiselect=False):
         """Select one or multiple dropdown options with zero manual pauses."""
         options = option_text if isinstance(option_text, list) else [option_text]
-        print(f"[SELECT] {options}")
+        log.debug("[SELECT] %s", options)
 
         try:
             # Open dropdown
-            print(f"[DEBUG] Clicking dropdown trigger: {trigger_locator}")
+            log.debug("Clicking dropdown trigger: %s", trigger_locator)
             trigger = self.safe_click(trigger_locator)
             dropdown_open = (By.XPATH, "//div[@data-part='content' and @data-state='open']")
             self.wait.until(EC.presence_of_element_located(dropdown_open))
-            print("[DEBUG] Dropdown opened successfully")
+            log.debug("Dropdown opened successfully")
             
-            # Wait for options to load (important for API-driven dropdowns)
-            time.sleep(1.0)  # Give time for options to load from API
-            
-            # Debug: Show available options
-            try:
-                all_options = self.driver.find_elements(By.XPATH, "//div[@data-part='content']//span")
-                available_options = [opt.text for opt in all_options if opt.text.strip()]
-                print(f"[DEBUG] Available options ({len(available_options)}): {available_options[:5]}...")  # Show first 5
-                
+            # Options are fetched from the API when the dropdown opens - proceed as soon as they land
+            self.wait_for_network_idle()
+            if log.debug_enabled:
+                # Scraping every label is for the log only; the selection below waits for its options
+                available_options = self.wait_for_dropdown_options()
+                log.debug("Available options (%s): %s...", len(available_options), available_options[:5])
                 if not available_options:
-                    print("[WARNING] No options found in dropdown! Waiting longer...")
-                    time.sleep(2.0)  # Wait more for data to load
-                    all_options = self.driver.find_elements(By.XPATH, "//div[@data-part='content']//span")
-                    available_options = [opt.text for opt in all_options if opt.text.strip()]
-                    print(f"[DEBUG] After waiting: Available options ({len(available_options)}): {available_options[:5]}...")
-                    
-                    if not available_options:
-                        print("[ERROR] Still no options available!")
-                        self.driver.save_screenshot("no_dropdown_options.png")
-                        print("[DEBUG] Screenshot saved as no_dropdown_options.png")
-            except Exception as e:
-                print(f"[WARNING] Could not list dropdown options: {e}")
+                    log.error("No options available!")
+                    capture_failure(self.driver, "no_dropdown_options")
                 
         except TimeoutException as e:
-            print(f"[ERROR] Failed to open dropdown: {str(e)}")
-            # Take screenshot for debugging
-            try:
-                self.driver.save_screenshot("errors/dropdown_open_failed.png")
-                print("[DEBUG] Screenshot saved as errors/dropdown_open_failed.png")
-            except:
-                pass
+            log.error("Failed to open dropdown: %s", e)
+            capture_failure(self.driver, "dropdown_open_failed")
             raise
 
-        # Select each option
-        for opt_text in options:
-            try:
-                opt_xpath = f"//div[@data-part='content']//span[normalize-space()='{opt_text}']"
-                print(f"[DEBUG] Looking for option: '{opt_text}'")
-                option = self.wait.until(EC.element_to_be_clickable((By.XPATH, opt_xpath)))
-                self.scroll_into_view(option)
-                self.driver.execute_script("arguments[0].click();", option)
-                print(f"[SUCCESS] Selected '{opt_text}'")
-            except TimeoutException:
-                print(f"[ERROR] Could not find option '{opt_text}' in dropdown")
-                raise
+        # Select all options in one script call per poll
+        try:
+            log.debug("Looking for option(s): %s", options)
+            option = self.select_dropdown_options(options, timeout=10, exclusive=is_multiselect)[-1]
+            log.success("Selected %s", options)
+        except TimeoutException as e:
+            log.error("Could not select option(s) in dropdown: %s", e.msg)
+            raise
 
         # Close dropdown
         if is_multiselect:
             # click outside to persist selection
             self.driver.execute_script("document.body.click();")
-            print("[DEBUG] Closed multi-select dropdown.")
+            log.debug("Closed multi-select dropdown.")
             try:
                 first_val = options[0]
-                self.wait.until(lambda d: first_val.lower() in (d.find_element(*trigger_locator).get_attribute("value") or "").lower())
+                self.wait.until(lambda d: first_val.lower() in (trigger.get_attribute("value") or "").lower())
             except Exception:
-                print("[WARN] Could not confirm persistence.")
+                log.warning("Could not confirm persistence.")
         else:
             try:
                 option.send_keys(Keys.TAB)
@@ -155,128 +196,164 @@ class CreateRfiPage(BasePage):
         try:
             self.wait.until(EC.invisibility_of_element_located(dropdown_open))
         except TimeoutException:
-            print("[WARN] Dropdown did not close completely.")
-
-        # Handle dependent field
-        if dependent_field_locator and dependent_field_name:
-            self.wait_for_field_ready(dependent_field_locator, dependent_field_name)
+            log.warning("Dropdown did not close completely.")
 
     # ---------- actions ----------
 
     def navigate(self):
-        print(f"[DEBUG] Navigating to {Config.BASE_URL}/welcome")
+        log.debug("Navigating to %s/welcome", Config.BASE_URL)
         self.driver.get(f"{Config.BASE_URL}/welcome")
         self.wait_for_page_load()
     
     def debug_page_state(self):
-        """Debug helper to check current page state."""
-        print("\n=== DEBUG: PAGE STATE ===")
+        """Debug helper to check current page state (DEBUG level only - it costs several round trips)."""
+        if not log.debug_enabled:
+            return
+        log.debug("=== DEBUG: PAGE STATE ===")
         try:
-            print(f"Current URL: {self.driver.current_url}")
+            log.debug("Current URL: %s", self.driver.current_url)
             
             # Check if Create RFI button exists
             create_rfi_buttons = self.driver.find_elements(*self.CREATE_RFI_BUTTON)
-            print(f"Create RFI buttons found: {len(create_rfi_buttons)}")
+            log.debug("Create RFI buttons found: %s", len(create_rfi_buttons))
             
             # Check if form is open
             form_containers = self.driver.find_elements(*self.FORM_CONTAINER)
-            print(f"Form containers found: {len(form_containers)}")
+            log.debug("Form containers found: %s", len(form_containers))
             
             if form_containers:
-                # Check if Plot dropdown exists
-                plot_triggers = self.driver.find_elements(*self.PLOT_TRIGGER)
-                print(f"Plot No. dropdowns found: {len(plot_triggers)}")
-                if plot_triggers:
-                    print(f"  Plot dropdown visible: {plot_triggers[0].is_displayed()}")
-                    print(f"  Plot dropdown enabled: {plot_triggers[0].is_enabled()}")
+                # Check if Plot dropdown exists (one form index walk)
+                fields = self.form_fields()
+                log.debug("Form fields indexed: %s", len(fields))
+                plot_trigger = fields.get(self.PLOT_FIELD)
+                log.debug("Plot No. dropdown found: %s", plot_trigger is not None)
+                if plot_trigger is not None:
+                    log.debug("  Plot dropdown visible: %s", plot_trigger.is_displayed())
+                    log.debug("  Plot dropdown enabled: %s", plot_trigger.is_enabled())
         except Exception as e:
-            print(f"Error in debug: {e}")
-        print("=== END DEBUG ===\n")
+            log.debug("Error in debug: %s", e)
+        log.debug("=== END DEBUG ===")
 
     def open_form(self):
-        print("[INFO] Opening Create RFI form...")
+        log.info("Opening Create RFI form...")
         try:
             # Wait for Create RFI button to be visible and clickable
             create_rfi_btn = self.wait.until(EC.element_to_be_clickable(self.CREATE_RFI_BUTTON))
             self.scroll_into_view(create_rfi_btn)
-            time.sleep(0.5)  # Small wait for page to stabilize
+            self.wait_for_element_stable(create_rfi_btn)
             create_rfi_btn.click()
             
             # Wait for form to open
             self.wait.until(EC.visibility_of_element_located(self.FORM_CONTAINER))
-            print("[INFO] Form container visible, waiting for data to load...")
+            log.info("Form container visible, waiting for data to load...")
             
-            # Wait longer for API data to load (dropdown options need to fetch from backend)
-            time.sleep(2.0)  # Increased wait for API data
-            print("[SUCCESS] Form opened and data should be loaded.")
+            # Form is ready once its API data has arrived and the stepper animation is done
+            self.wait_for_network_idle(timeout=10)
+            self.wait_for_animations()
+            log.success("Form opened and data loaded.")
         except Exception as e:
-            print(f"[ERROR] Failed to open form: {str(e)}")
+            log.error("Failed to open form: %s", e)
             raise
 
-    def fill_form(self):
-        print("=== START FORM FILL ===")
+    def fill_form(self, handle=None, record=None, debug=True):
+        """Fill every RFI field from `record` (default: the suite's standard RFI).
+
+        Fields that already show the wanted value, and whose parent field was
+        not changed, are left alone: when the form opens with the previous
+        RFI's selections, only the first difference in the cascade and the
+        fields it clears are entered again. An empty form is filled in full.
+
+        Args:
+            handle: RfiHandle whose reference is added to the sub contractor name
+            record: RfiRecord with the values to enter
+            debug: Log the page state before filling (off for bulk runs)
+        """
+        record = record or RfiRecord()
+        log.info("=== START FORM FILL ===")
         
         # Debug page state
-        self.debug_page_state()
+        if debug:
+            self.debug_page_state()
         
         # Wait for first field to be ready
         try:
-            print("[INFO] Waiting for Plot No. field to be ready...")
-            self.wait.until(EC.element_to_be_clickable(self.PLOT_TRIGGER))
-            time.sleep(0.5)  # Additional stabilization time
-            print("[SUCCESS] Form is ready for input.")
+            log.info("Waiting for Plot No. field to be ready...")
+            plot_trigger = self.field(self.PLOT_FIELD)
+            self.wait_for_element_stable(plot_trigger)
+            log.success("Form is ready for input.")
         except Exception as e:
-            print(f"[ERROR] Form fields not ready: {str(e)}")
-            # Take screenshot
-            try:
-                self.driver.save_screenshot("form_not_ready.png")
-                print("[DEBUG] Screenshot saved as form_not_ready.png")
-            except:
-                pass
+            log.error("Form fields not ready: %s", e)
+            capture_failure(self.driver, "form_not_ready")
             raise
         
-        self.select_dropdown_with_dependency_wait(self.PLOT_TRIGGER, "S05b", self.BLOCK_TRIGGER, "Block No.")
-        self.select_dropdown_with_dependency_wait(self.BLOCK_TRIGGER, "BL05", self.PACKAGE_TRIGGER, "Package")
-        self.select_dropdown_with_dependency_wait(self.PACKAGE_TRIGGER, "Civil", self.SUBPACKAGE_TRIGGER, "Sub-Package")
-        self.select_dropdown_with_dependency_wait(self.SUBPACKAGE_TRIGGER, "MMS Installation", self.ACTIVITY_TRIGGER, "Activity")
-        self.select_dropdown_with_dependency_wait(self.ACTIVITY_TRIGGER, "MMS Installation", self.SUBACTIVITY_TRIGGER, "Sub-Activity")
-        self.select_dropdown_with_dependency_wait(self.SUBACTIVITY_TRIGGER, "MMS Installation", self.LOCATION_INPUT, "Location")
-
-        # Multi-select Location
-        self.select_dropdown_with_dependency_wait(self.LOCATION_INPUT, ["R01-T01", "R01-T02"], self.QUANTITY_INPUT, "Quantity", is_multiselect=True)
-
-        self.safe_input(self.QUANTITY_INPUT, "25")
-        self.select_dropdown_with_dependency_wait(self.UNIT_TRIGGER, "MTR")
-        self.safe_input(self.SUBCONTRACTOR_INPUT, "TechBuild Contractors Pvt Ltd")
-
-        self.select_dropdown_with_dependency_wait(
-            self.INSPECTION_CHECKPOINT_TRIGGER,
-            "If Tracker: Tracker Alignment, Tightening & Torquing up to Torque Tube incl. Transmission Shaft If Fixed Tilt: Fixed Tilt Alignment, Tightening & Torquing up to bracing, perlin and all asembly parts",
-            self.INSPECTION_CHECKLIST_TRIGGER,
-            "Inspection Checklist"
-        )
-        self.select_dropdown_with_dependency_wait(
-            self.INSPECTION_CHECKLIST_TRIGGER,
-            "PV Module Mounting Structure Installation Protocol - Tracker"
-        )
-        print("=== FORM FILL COMPLETE ===")
+        subcontractor = record.subcontractor
+        if handle is not None:
+            # Lets later roles find exactly this RFI through the list search
+            subcontractor = f"{subcontractor} {handle.reference}"
+        values = {
+            self.PLOT_FIELD: record.plot,
+            self.BLOCK_FIELD: record.block,
+            self.PACKAGE_FIELD: record.package,
+            self.SUBPACKAGE_FIELD: record.subpackage,
+            self.ACTIVITY_FIELD: record.activity,
+            self.SUBACTIVITY_FIELD: record.subactivity,
+            self.LOCATION_FIELD: record.locations,
+            self.QUANTITY_FIELD: record.quantity,
+            self.UNIT_FIELD: record.unit,
+            self.SUBCONTRACTOR_FIELD: subcontractor,
+            self.INSPECTION_CHECKPOINT_FIELD: record.checkpoint,
+            self.INSPECTION_CHECKLIST_FIELD: record.checklist,
+        }
+
+        shown = self.form_values()
+        changed = set()
+        for label, parent in self.FORM_CASCADE:
+            wanted = values[label]
+            if parent not in changed and self._shows(shown.get(label), wanted):
+                log.debug("[SKIP] %s already '%s'", label, shown.get(label))
+                continue
+            if label in (self.QUANTITY_FIELD, self.SUBCONTRACTOR_FIELD):
+                self.safe_input(label, wanted)
+            else:
+                self.select_dropdown_with_dependency_wait(label, wanted, is_multiselect=isinstance(wanted, list))
+            changed.add(label)
+        log.info("=== FORM FILL COMPLETE ===")
+
+    @staticmethod
+    def _shows(shown, wanted):
+        """True if a field showing `shown` already holds `wanted` (a value or list of values)."""
+        if not shown:
+            return False
+        if isinstance(wanted, list):
+            return sorted(part.strip() for part in shown.split(",")) == sorted(wanted)
+        return shown.strip().lower() == str(wanted).strip().lower()
 
     def submit_form(self):
         """Click Proceed button to move from Step 1 (RFI details) to Step 2 (Inspection Checklist)."""
-        print("[ACTION] Clicking Proceed to go to Inspection Checklist...")
+        log.action("Clicking Proceed to go to Inspection Checklist...")
         try:
             # Wait for Proceed button and click it
             proceed_btn = self.wait.until(EC.element_to_be_clickable(self.PROCEED_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", proceed_btn)
             self.driver.execute_script("arguments[0].click();", proceed_btn)
-            print("[SUCCESS] Clicked Proceed - navigating to Inspection Checklist (Step 2).")
+            log.success("Clicked Proceed - navigating to Inspection Checklist (Step 2).")
         except Exception as e:
-            print(f"[ERROR] Failed to click Proceed button: {str(e)}")
+            log.error("Failed to click Proceed button: %s", e)
             raise
 
-    def create_rfi(self):
-        print("\n=== START RFI CREATION ===")
+    def create_rfi(self, handle=None, record=None):
+        """Open, fill and proceed with a new RFI; returns its RfiHandle.
+
+        The handle carries a unique reference written into the RFI. Pass it to
+        InspectionChecklistPage.complete_inspection_checklist to capture the RFI
+        number, then to the review/inspection pages to open this exact RFI.
+        """
+        log.info("=== START RFI CREATION ===")
+        handle = handle or RfiHandle.new(created_by="contractor")
+        self.handle = handle
         self.open_form()
-        self.fill_form()
+        self.fill_form(handle, record)
         self.submit_form()
-        print("=== END RFI CREATION ===")
+        log.info("RFI reference: %s", handle.reference)
+        log.info("=== END RFI CREATION ===")
+        return handle
@@ -2,10 +2,28 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, WebDriverException
 from pages.base_page import BasePage
+from config.config import Config
+from utils.artifacts import capture_failure
+from utils.logger import get_logger
+import re
 import time
 
+log = get_logger(__name__)
+
+
+# Visible elements matching an XPath, in document order (no implicit wait when none match)
+_VISIBLE_BY_XPATH_JS = """
+const snapshot = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const found = [];
+for (let i = 0; i < snapshot.snapshotLength; i++) {
+    const el = snapshot.snapshotItem(i);
+    if (el.offsetParent !== null || el.getClientRects().length > 0) found.push(el);
+}
+return found;
+"""
+
 
 class InspectionChecklistPage(BasePage):
     """Inspection Checklist Page - Fills form after RFI submission.
@@ -62,6 +80,53 @@ class InspectionChecklistPage(BasePage):
     
     # Success messages
     SUCCESS_TOAST = (By.XPATH, "//*[contains(text(),'successfully') or contains(text(),'Success')]")
+    # RFI number in the submit confirmation, e.g. "RFI-0042 submitted successfully"
+    RFI_ID_PATTERN = re.compile(r"\bRFI[-/ ]?[A-Z0-9]*\d+\b")
+
+    QUESTION_COUNT = 12
+    DEFAULT_OBSERVATIONS = [
+        "Fasteners installed correctly with torque marks",
+        "Drive post installed within tolerance, heights maintained",
+        "Slew drive seat installed at ±0° angle",
+        "Post seat installed correctly, grounding cable in place",
+        "Slew drives aligned properly, motor facing south",
+        "Correct torque tube installed, alignment within tolerance",
+        "Purlins secured with torque marks, gaskets in place",
+        "Transmission shaft assembly installed correctly",
+        "Tube covers placed on both ends",
+        "Grounding cables installed at both ends and control box",
+        "AI Controller box accessories installed, cables properly routed",
+        "Communication box and wind sensor properly installed"
+    ]
+
+    # Observation inputs in question order (same XPath as get_observation_input_for_question)
+    _OBSERVATION_INPUTS_SRC = """
+    const snapshot = document.evaluate(
+        "//label[contains(text(), 'Observation/Measured Value')]/following-sibling::input",
+        document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const inputs = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) inputs.push(snapshot.snapshotItem(i));
+    """
+    _COUNT_OBSERVATIONS_JS = _OBSERVATION_INPUTS_SRC + "return inputs.length;"
+    _READ_OBSERVATIONS_JS = _OBSERVATION_INPUTS_SRC + "return inputs.map((el) => el.value);"
+    # React tracks the native value setter, so set through it and then fire the
+    # events a user would produce: input/change while typing, blur on Tab
+    _BULK_FILL_JS = _OBSERVATION_INPUTS_SRC + """
+    const values = arguments[0];
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    let filled = 0;
+    values.forEach((value, i) => {
+        const el = inputs[i];
+        if (!el) return;
+        el.focus();
+        setValue.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.blur();
+        filled++;
+    });
+    return filled;
+    """
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -69,9 +134,9 @@ class InspectionChecklistPage(BasePage):
 
     def wait_for_form_visible(self):
         """Wait for inspection checklist form to be visible."""
-        print("[INFO] Waiting for Inspection Checklist form...")
+        log.info("Waiting for Inspection Checklist form...")
         self.wait.until(EC.visibility_of_element_located(self.FORM_TITLE))
-        print("[SUCCESS] Inspection Checklist form is visible.")
+        log.success("Inspection Checklist form is visible.")
 
     def is_on_page_1(self):
         """Check if we are on page 1."""
@@ -90,63 +155,67 @@ class InspectionChecklistPage(BasePage):
             return False
     
     def debug_page_structure(self):
-        """Debug helper to print page structure info."""
-        print("\n=== DEBUG: PAGE STRUCTURE ===")
+        """Debug helper to print page structure info (DEBUG level only - it costs a round trip per probe)."""
+        if not log.debug_enabled:
+            return
+        log.debug("=== DEBUG: PAGE STRUCTURE ===")
         try:
             # Check collapsible sections
             collapsibles = self.driver.find_elements(By.CSS_SELECTOR, "div[data-scope='collapsible']")
-            print(f"Total collapsible sections: {len(collapsibles)}")
+            log.debug("Total collapsible sections: %s", len(collapsibles))
             
             closed = self.driver.find_elements(By.XPATH, "//div[@data-scope='collapsible'][@data-state='closed']")
-            print(f"Closed sections: {len(closed)}")
+            log.debug("Closed sections: %s", len(closed))
             
             open_sections = self.driver.find_elements(By.XPATH, "//div[@data-scope='collapsible'][@data-state='open']")
-            print(f"Open sections: {len(open_sections)}")
+            log.debug("Open sections: %s", len(open_sections))
             
             # Check for buttons
             all_buttons = self.driver.find_elements(By.TAG_NAME, "button")
-            print(f"Total buttons on page: {len(all_buttons)}")
+            log.debug("Total buttons on page: %s", len(all_buttons))
             
             # Check for camera icons
             camera_icons = self.driver.find_elements(By.XPATH, "//svg[contains(@class, 'lucide-camera')]")
-            print(f"Camera icons found: {len(camera_icons)}")
+            log.debug("Camera icons found: %s", len(camera_icons))
             
             # Check for "Use Camera" text
             use_camera_text = self.driver.find_elements(By.XPATH, "//p[contains(text(), 'Use Camera')]")
-            print(f"'Use Camera' text found: {len(use_camera_text)}")
+            log.debug("'Use Camera' text found: %s", len(use_camera_text))
             
             # Check for square-plus icon
             plus_icons = self.driver.find_elements(By.XPATH, "//svg[contains(@class, 'lucide-square-plus')]")
-            print(f"Square-plus icons found: {len(plus_icons)}")
+            log.debug("Square-plus icons found: %s", len(plus_icons))
             
             # Check for the text
             answer_text = self.driver.find_elements(By.XPATH, "//p[contains(text(), 'Answer all the questions')]")
-            print(f"'Answer all the questions' text found: {len(answer_text)}")
+            log.debug("'Answer all the questions' text found: %s", len(answer_text))
             
         except Exception as e:
-            print(f"Error in debug: {e}")
-        print("=== END DEBUG ===\n")
+            log.debug("Error in debug: %s", e)
+        log.debug("=== END DEBUG ===")
     
     def debug_popup_structure(self):
-        """Debug helper to print popup/dialog structure info."""
-        print("\n=== DEBUG: POPUP STRUCTURE ===")
+        """Debug helper to print popup/dialog structure info (DEBUG level only - it costs a round trip per probe)."""
+        if not log.debug_enabled:
+            return
+        log.debug("=== DEBUG: POPUP STRUCTURE ===")
         try:
             # Check for dialogs with data-scope
             data_scope_dialogs = self.driver.find_elements(By.XPATH, "//div[@data-scope='dialog']")
-            print(f"Dialogs with data-scope='dialog': {len(data_scope_dialogs)}")
+            log.debug("Dialogs with data-scope='dialog': %s", len(data_scope_dialogs))
             
             # Check for dialogs by role
             role_dialogs = self.driver.find_elements(By.XPATH, "//div[@role='dialog']")
-            print(f"Dialogs with role='dialog': {len(role_dialogs)}")
+            log.debug("Dialogs with role='dialog': %s", len(role_dialogs))
             
             # Check for confirmation text
             confirm_text = self.driver.find_elements(By.XPATH, "//p[contains(text(), 'Are you sure')]")
             if confirm_text:
-                print(f"Confirmation text found: '{confirm_text[0].text}'")
+                log.debug("Confirmation text found: '%s'", confirm_text[0].text)
             
             # Check for all Submit buttons
             submit_buttons = self.driver.find_elements(By.XPATH, "//button[normalize-space()='Submit']")
-            print(f"Total 'Submit' buttons: {len(submit_buttons)}")
+            log.debug("Total 'Submit' buttons: %s", len(submit_buttons))
             
             for idx, btn in enumerate(submit_buttons):
                 try:
@@ -154,17 +223,17 @@ class InspectionChecklistPage(BasePage):
                     enabled = btn.is_enabled()
                     btn_type = btn.get_attribute('type')
                     btn_form = btn.get_attribute('form')
-                    print(f"  Submit button {idx+1}: Visible={visible}, Enabled={enabled}, type='{btn_type}', form='{btn_form}'")
+                    log.debug("  Submit button %s: Visible=%s, Enabled=%s, type='%s', form='%s'", idx+1, visible, enabled, btn_type, btn_form)
                 except:
                     pass
             
             # Check for Cancel button
             cancel_buttons = self.driver.find_elements(By.XPATH, "//button[normalize-space()='Cancel']")
-            print(f"Cancel buttons: {len(cancel_buttons)}")
+            log.debug("Cancel buttons: %s", len(cancel_buttons))
             
         except Exception as e:
-            print(f"Error in popup debug: {e}")
-        print("=== END POPUP DEBUG ===\n")
+            log.debug("Error in popup debug: %s", e)
+        log.debug("=== END POPUP DEBUG ===")
 
     def get_question_by_number(self, question_number):
         """Get question section by its number (1-12)."""
@@ -193,7 +262,7 @@ class InspectionChecklistPage(BasePage):
 
     def expand_question_section(self, question_number):
         """Expand a specific question section if collapsed."""
-        print(f"[ACTION] Expanding question {question_number}...")
+        log.action("Expanding question %s...", question_number)
         question_section = self.get_question_by_number(question_number)
         
         try:
@@ -205,14 +274,14 @@ class InspectionChecklistPage(BasePage):
                 # Click the expand button within this section
                 expand_button = section_element.find_element(By.CSS_SELECTOR, "button[data-part='trigger']")
                 self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", expand_button)
-                time.sleep(0.3)
                 self.driver.execute_script("arguments[0].click();", expand_button)
-                time.sleep(0.3)
-                print(f"[SUCCESS] Question {question_number} expanded.")
+                self.wait_for_attribute(section_element, "data-state", "open")
+                self.wait_for_animations()
+                log.success("Question %s expanded.", question_number)
             else:
-                print(f"[INFO] Question {question_number} already expanded.")
+                log.info("Question %s already expanded.", question_number)
         except Exception as e:
-            print(f"[ERROR] Failed to expand question {question_number}: {str(e)}")
+            log.error("Failed to expand question %s: %s", question_number, e)
 
     def capture_photo_for_question(self, question_number, skip_camera=False):
         """Capture photo for a specific question.
@@ -222,217 +291,303 @@ class InspectionChecklistPage(BasePage):
             skip_camera: If True, skip camera capture (useful for headless mode)
         """
         if skip_camera:
-            print(f"[INFO] Skipping camera capture for question {question_number}")
+            log.info("Skipping camera capture for question %s", question_number)
             return
         
-        print(f"\n[ACTION] 📸 Starting camera capture for QUESTION {question_number}...")
-        print(f"[DEBUG] Ensuring clean state before capture...")
+        log.action("📸 Starting camera capture for QUESTION %s...", question_number)
+        log.debug("Ensuring clean state before capture...")
         
         # CRITICAL: Ensure no modal is open from previous question
         try:
             existing_videos = self.driver.find_elements(By.TAG_NAME, "video")
             visible_videos = [v for v in existing_videos if v.is_displayed()]
             if visible_videos:
-                print(f"[WARNING] ⚠️ Found {len(visible_videos)} open video modal(s) before question {question_number}")
-                print(f"[ACTION] Forcefully closing any open modals...")
+                log.warning("⚠️ Found %s open video modal(s) before question %s", len(visible_videos), question_number)
+                log.action("Forcefully closing any open modals...")
                 self._close_camera_modal()
-                time.sleep(0.5)  # Reduced wait
                 
                 # Double-check modal is closed
-                remaining_videos = [v for v in self.driver.find_elements(By.TAG_NAME, "video") if v.is_displayed()]
-                if remaining_videos:
-                    print(f"[ERROR] ❌ Modal still open! Trying ESC key...")
+                if not self._wait_for_camera_closed():
+                    log.error("❌ Modal still open! Trying ESC key...")
                     self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                    time.sleep(0.3)
+                    self._wait_for_camera_closed()
         except Exception as e:
-            print(f"[DEBUG] Error checking for existing modals: {e}")
+            log.debug("Error checking for existing modals: %s", e)
         
         try:
             # Find the camera button within this specific question
-            print(f"[DEBUG] Looking for camera button in question {question_number}...")
+            log.debug("Looking for camera button in question %s...", question_number)
             
             # Try multiple locator strategies with detailed debugging
             # Based on actual HTML: <div class="cursor_pointer"><svg class="lucide lucide-camera">...<p>Use Camera</p></div>
+            section = (By.XPATH, f"(//div[@data-scope='collapsible'])[{question_number}]")
             locators_to_try = [
-                (f"Strategy 1: Direct cursor_pointer div with camera SVG", 
-                 By.XPATH, f"(//div[@data-scope='collapsible'])[{question_number}]//div[@class='cursor_pointer' and .//svg[contains(@class, 'lucide-camera')]]"),
-                (f"Strategy 2: Camera SVG parent div", 
-                 By.XPATH, f"(//div[@data-scope='collapsible'])[{question_number}]//svg[contains(@class, 'lucide-camera')]/parent::div"),
-                (f"Strategy 3: Div containing 'Use Camera' text with camera icon", 
-                 By.XPATH, f"(//div[@data-scope='collapsible'])[{question_number}]//div[.//p[contains(text(), 'Use Camera')] and .//svg[contains(@class, 'lucide-camera')]]"),
-                (f"Strategy 4: Any div with cursor_pointer class in question section", 
-                 By.XPATH, f"(//div[@data-scope='collapsible'])[{question_number}]//div[contains(@class, 'cursor_pointer')]"),
+                # Strategy 1: Direct cursor_pointer div with camera SVG
+                (By.XPATH, ".//div[@class='cursor_pointer' and .//svg[contains(@class, 'lucide-camera')]]"),
+                # Strategy 2: Camera SVG parent div
+                (By.XPATH, ".//svg[contains(@class, 'lucide-camera')]/parent::div"),
+                # Strategy 3: Div containing 'Use Camera' text with camera icon
+                (By.XPATH, ".//div[.//p[contains(text(), 'Use Camera')] and .//svg[contains(@class, 'lucide-camera')]]"),
+                # Strategy 4: Namespace-safe match of the camera icon (SVG elements are not matched by //svg in HTML documents)
+                (By.XPATH, ".//*[local-name()='svg' and contains(@class, 'lucide-camera')]/ancestor::div[contains(@class, 'cursor_pointer')][1]"),
+                # Last resort: any div with cursor_pointer class in the question section (never learned)
+                (By.XPATH, ".//div[contains(@class, 'cursor_pointer')]"),
             ]
             
-            camera_btn = None
-            for strategy_name, locator_type, locator_value in locators_to_try:
-                try:
-                    print(f"[DEBUG] Trying: {strategy_name}")
-                    elements = self.driver.find_elements(locator_type, locator_value)
-                    print(f"[DEBUG]   Found {len(elements)} elements")
-                    if elements:
-                        # CRITICAL: Use the first element found within THIS question's scope
-                        # The locator already filters by question number, so first element should be correct
-                        camera_btn = elements[0]
-                        print(f"[SUCCESS] ✓ {strategy_name} worked - using first element!")
-                        
-                        # Verify this button is within the correct question section
-                        try:
-                            question_section = self.driver.find_element(By.XPATH, f"(//div[@data-scope='collapsible'])[{question_number}]")
-                            # Check if camera_btn is a descendant of this question section
-                            is_in_correct_section = self.driver.execute_script(
-                                "return arguments[0].contains(arguments[1]);", 
-                                question_section, camera_btn
-                            )
-                            if is_in_correct_section:
-                                print(f"[VERIFY] ✓ Camera button IS in question {question_number} section")
-                            else:
-                                print(f"[WARNING] ❌ Camera button NOT in question {question_number}, trying next strategy...")
-                                camera_btn = None
-                                continue
-                        except Exception as verify_err:
-                            print(f"[WARNING] Could not verify button location: {verify_err}")
-                        
-                        break
-                except Exception as e:
-                    print(f"[DEBUG]   Failed: {str(e)}")
-                    continue
+            # Every locator is relative to this question's section, so the match is in the right question
+            # and the strategy learned for one question applies to all of them.
+            # All strategies run in one in-page query; the one that won last run is tried first.
+            try:
+                camera_btn = self.find_first("checklist.camera_button", locators_to_try, timeout=3,
+                                             require_visible=False, scope=section, catch_all=True)
+                log.success("✓ Camera button located for question %s", question_number)
+            except TimeoutException:
+                camera_btn = None
             
             if not camera_btn:
-                print(f"[ERROR] ❌ Could not find camera button for question {question_number} with any strategy")
-                # Extensive debugging
-                print("\n[DEBUG] === DEBUGGING CAMERA BUTTON LOCATION ===")
-                try:
-                    # Check if question section exists
-                    question_section = self.driver.find_element(By.XPATH, f"(//div[@data-scope='collapsible'])[{question_number}]")
-                    print(f"[DEBUG] ✓ Question section {question_number} exists")
-                    
-                    # Check for camera icons in this section
-                    camera_icons = question_section.find_elements(By.XPATH, ".//svg[contains(@class, 'lucide-camera')]")
-                    print(f"[DEBUG] Camera icons in question {question_number}: {len(camera_icons)}")
-                    
-                    # Check for any clickable divs
-                    clickable_divs = question_section.find_elements(By.XPATH, ".//div[contains(@class, 'cursor_pointer')]")
-                    print(f"[DEBUG] Clickable divs in question {question_number}: {len(clickable_divs)}")
-                    
-                    # Check for "Use Camera" text
-                    use_camera_text = question_section.find_elements(By.XPATH, ".//p[contains(text(), 'Use Camera')]")
-                    print(f"[DEBUG] 'Use Camera' text found: {len(use_camera_text)}")
-                    
-                    # Get the HTML of the section for inspection
-                    section_html = question_section.get_attribute('outerHTML')[:500]
-                    print(f"[DEBUG] Question section HTML preview:\n{section_html}...")
-                    
-                    # Take screenshot for visual debugging
-                    screenshot_name = f"errors/camera_button_not_found_q{question_number}.png"
-                    self.driver.save_screenshot(screenshot_name)
-                    print(f"[DEBUG] Screenshot saved as {screenshot_name}")
-                    
-                except Exception as debug_err:
-                    print(f"[DEBUG] Debug failed: {debug_err}")
-                print("[DEBUG] === END DEBUGGING ===\n")
+                log.error("❌ Could not find camera button for question %s with any strategy", question_number)
+                capture_failure(self.driver, f"camera_button_not_found_q{question_number}")
+                if log.debug_enabled:
+                    self._debug_camera_section(question_number)
                 return
             
             # Scroll to the button and click
-            print(f"[DEBUG] Scrolling to camera button...")
+            log.debug("Scrolling to camera button...")
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", camera_btn)
-            time.sleep(0.3)  # Reduced wait
             
             # Check if button is visible and enabled
             is_visible = camera_btn.is_displayed()
-            is_enabled = camera_btn.is_enabled()
-            print(f"[DEBUG] Camera button - Visible: {is_visible}, Enabled: {is_enabled}")
+            if log.debug_enabled:
+                log.debug("Camera button - Visible: %s, Enabled: %s", is_visible, camera_btn.is_enabled())
             
             if not is_visible:
-                print(f"[WARNING] Camera button not visible, trying to make it visible...")
+                log.warning("Camera button not visible, trying to make it visible...")
                 self.driver.execute_script("arguments[0].style.display='block';", camera_btn)
-                time.sleep(0.3)
+                self._signal_wait().until(lambda d: camera_btn.is_displayed())
             
             # Click using JavaScript for reliability
-            print(f"[DEBUG] Clicking camera button with JavaScript...")
+            log.debug("Clicking camera button with JavaScript...")
             self.driver.execute_script("arguments[0].click();", camera_btn)
-            print(f"[DEBUG] ✓ Clicked camera button for question {question_number}")
+            log.debug("✓ Clicked camera button for question %s", question_number)
             
             # Wait for camera modal to appear (with video element)
-            print("[DEBUG] Waiting for camera modal to open...")
+            log.debug("Waiting for camera modal to open...")
             try:
                 video_element = WebDriverWait(self.driver, 5).until(
                     EC.visibility_of_element_located((By.TAG_NAME, "video"))
                 )
-                print("[SUCCESS] ✓ Camera modal opened with video feed")
-                time.sleep(0.5)  # Reduced camera initialization time
+                log.success("✓ Camera modal opened with video feed")
+                self._wait_for_video_ready(video_element)
             except TimeoutException:
-                print("[ERROR] ❌ Camera modal did not open (no video element)")
-                # Check what's on the page
-                print("[DEBUG] Checking page state after click...")
-                videos = self.driver.find_elements(By.TAG_NAME, "video")
-                print(f"[DEBUG] Video elements found: {len(videos)}")
-                buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                capture_btns = [b for b in buttons if "capture" in b.text.lower()]
-                print(f"[DEBUG] Buttons with 'capture' text: {len(capture_btns)}")
+                log.error("❌ Camera modal did not open (no video element)")
+                if log.debug_enabled:
+                    # Check what's on the page
+                    log.debug("Checking page state after click...")
+                    videos = self.driver.find_elements(By.TAG_NAME, "video")
+                    log.debug("Video elements found: %s", len(videos))
+                    buttons = self.driver.find_elements(By.TAG_NAME, "button")
+                    capture_btns = [b for b in buttons if "capture" in b.text.lower()]
+                    log.debug("Buttons with 'capture' text: %s", len(capture_btns))
                 return
             
             # Click Capture button in modal
-            print("[DEBUG] Looking for Capture button in modal...")
+            log.debug("Looking for Capture button in modal...")
             try:
                 capture_btn = WebDriverWait(self.driver, 5).until(
                     EC.element_to_be_clickable((By.XPATH, "//button[normalize-space()='Capture']"))
                 )
                 capture_btn.click()
-                print(f"[SUCCESS] ✓ Clicked Capture button")
+                log.success("✓ Clicked Capture button")
                 
                 # Wait for modal to close (video element should disappear)
-                print("[DEBUG] Waiting for modal to close...")
+                log.debug("Waiting for modal to close...")
                 try:
                     WebDriverWait(self.driver, 5).until(
                         EC.invisibility_of_element_located((By.TAG_NAME, "video"))
                     )
-                    print(f"[SUCCESS] ✅ Photo captured and modal closed for question {question_number}")
+                    log.success("✅ Photo captured and modal closed for question %s", question_number)
                 except TimeoutException:
-                    print(f"[WARNING] ⚠️ Modal didn't close automatically, forcing close...")
+                    log.warning("⚠️ Modal didn't close automatically, forcing close...")
                     self._close_camera_modal()
                 
-                # Wait for modal to fully close
-                time.sleep(0.4)  # Reduced wait
-                
                 # Final verification: No video elements visible
-                final_check = [v for v in self.driver.find_elements(By.TAG_NAME, "video") if v.is_displayed()]
-                if final_check:
-                    print(f"[ERROR] ❌ Video still visible! Force closing again...")
+                if not self._wait_for_camera_closed():
+                    log.error("❌ Video still visible! Force closing again...")
                     self._close_camera_modal()
-                    time.sleep(0.3)
                 else:
-                    print(f"[VERIFY] ✓ Modal fully closed, ready for next question")
+                    log.info("[VERIFY] ✓ Modal fully closed, ready for next question")
                 
             except TimeoutException:
-                print(f"[ERROR] ❌ Capture button not found in modal")
+                log.error("❌ Capture button not found in modal")
                 self._close_camera_modal()
                 return
             except Exception as e:
-                print(f"[ERROR] ❌ Error clicking Capture button: {str(e)}")
+                log.error("❌ Error clicking Capture button: %s", e)
                 self._close_camera_modal()
                 return
                 
         except Exception as e:
-            print(f"[ERROR] ❌ Camera capture failed for question {question_number}: {str(e)}")
-            print("[INFO] Attempting to close any open modals...")
+            log.error("❌ Camera capture failed for question %s: %s", question_number, e)
+            log.info("Attempting to close any open modals...")
             self._close_camera_modal()
             import traceback
-            print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+            log.debug("Traceback: %s", traceback.format_exc())
     
+    # One camera trigger per question (null where a question has none): the
+    # clickable cursor_pointer div around the lucide-camera icon
+    _CAMERA_TRIGGERS_JS = """
+    return Array.from(document.querySelectorAll("div[data-scope='collapsible']")).map((section) => {
+        const icon = section.querySelector('svg.lucide-camera');
+        return icon ? (icon.closest('div.cursor_pointer') || icon.parentElement) : null;
+    });
+    """
+    # 'ready' when a visible <video> delivers frames, 'opening' while it is
+    # still starting, 'closed' when no camera modal is visible
+    _CAMERA_STATE_JS = """
+    const video = Array.from(document.querySelectorAll('video')).find((v) => v.offsetParent !== null);
+    if (!video) return 'closed';
+    return video.readyState >= 2 ? 'ready' : 'opening';
+    """
+    _CLICK_CAPTURE_JS = """
+    const button = Array.from(document.querySelectorAll('button')).find(
+        (b) => b.textContent.trim() === 'Capture' && !b.disabled);
+    if (!button) return false;
+    button.click();
+    return true;
+    """
+
+    def _debug_camera_section(self, question_number):
+        """Log what a question section contains when its camera button can't be found."""
+        log.debug("=== DEBUGGING CAMERA BUTTON LOCATION ===")
+        try:
+            question_section = self.driver.find_element(By.XPATH, f"(//div[@data-scope='collapsible'])[{question_number}]")
+            log.debug("✓ Question section %s exists", question_number)
+            camera_icons = question_section.find_elements(By.XPATH, ".//svg[contains(@class, 'lucide-camera')]")
+            log.debug("Camera icons in question %s: %s", question_number, len(camera_icons))
+            clickable_divs = question_section.find_elements(By.XPATH, ".//div[contains(@class, 'cursor_pointer')]")
+            log.debug("Clickable divs in question %s: %s", question_number, len(clickable_divs))
+            use_camera_text = question_section.find_elements(By.XPATH, ".//p[contains(text(), 'Use Camera')]")
+            log.debug("'Use Camera' text found: %s", len(use_camera_text))
+            log.debug("Question section HTML preview:\n%s...", question_section.get_attribute('outerHTML')[:500])
+        except Exception as debug_err:
+            log.debug("Debug failed: %s", debug_err)
+        log.debug("=== END DEBUGGING ===")
+
+    def capture_photos_pipelined(self, question_numbers=None, timeout=5):
+        """Capture a photo for each question back to back and report per-question latency.
+
+        All camera triggers are located up front in one script call. Each
+        question then runs open -> media ready -> Capture -> modal closed, driven
+        by polling the media state instead of fixed pauses.
+
+        Args:
+            question_numbers: Questions to capture (default: all 12)
+            timeout: Max seconds for each of the open/capture phases
+
+        Returns:
+            dict of question number -> capture latency in seconds (None if it failed)
+        """
+        question_numbers = question_numbers or list(range(1, self.QUESTION_COUNT + 1))
+        log.action("📸 Pipelined camera capture for %s questions...", len(question_numbers))
+
+        camera_state = lambda d: d.execute_script(self._CAMERA_STATE_JS)
+        latencies = {}
+
+        try:
+            triggers = self.driver.execute_script(self._CAMERA_TRIGGERS_JS) or []
+            for number in question_numbers:
+                trigger = triggers[number - 1] if number <= len(triggers) else None
+                if trigger is None:
+                    log.error("❌ No camera trigger for question %s", number)
+                    latencies[number] = None
+                    continue
+
+                started = time.perf_counter()
+                try:
+                    try:
+                        self._click_camera_trigger(trigger)
+                    except StaleElementReferenceException:
+                        # The section re-rendered after the previous capture - locate the triggers again
+                        triggers = self.driver.execute_script(self._CAMERA_TRIGGERS_JS) or []
+                        if triggers[number - 1] is None:
+                            raise IndexError(f"no camera trigger for question {number} after re-render")
+                        self._click_camera_trigger(triggers[number - 1])
+                    self._signal_wait(timeout).until(lambda d: camera_state(d) == "ready")
+                    self._signal_wait(timeout).until(lambda d: d.execute_script(self._CLICK_CAPTURE_JS))
+                    self._signal_wait(timeout).until(lambda d: camera_state(d) == "closed")
+                    latencies[number] = time.perf_counter() - started
+                    log.success("✅ Q%s captured in %.0f ms", number, latencies[number] * 1000)
+                except TimeoutException:
+                    log.error("❌ Camera capture timed out for question %s (state: %s)",
+                              number, self._camera_state_or_unknown(camera_state))
+                    latencies[number] = None
+                    self._close_camera_modal()
+                except (WebDriverException, IndexError) as e:
+                    # One broken question must not cost the photos of the rest
+                    log.error("❌ Camera capture failed for question %s: %s", number, getattr(e, "msg", None) or e)
+                    latencies[number] = None
+                    self._close_camera_modal()
+        finally:
+            self._log_capture_report(latencies)
+        return latencies
+
+    def _camera_state_or_unknown(self, camera_state):
+        try:
+            return camera_state(self.driver)
+        except WebDriverException:
+            return "unknown"
+
+    def _click_camera_trigger(self, trigger):
+        self.driver.execute_script(
+            "arguments[0].scrollIntoView({block:'center', behavior:'instant'}); arguments[0].click();",
+            trigger,
+        )
+
+    @staticmethod
+    def _log_capture_report(latencies):
+        captured = [t for t in latencies.values() if t is not None]
+        log.info("📸 CAMERA CAPTURE LATENCY")
+        for number, latency in latencies.items():
+            shown = f"{latency * 1000:7.0f} ms" if latency is not None else "   FAILED"
+            log.info("  Q%-3s %s", number, shown)
+        if captured:
+            log.info("  Total %.2fs | mean %.0f ms | max %.0f ms | %s/%s captured", sum(captured),
+                     sum(captured) / len(captured) * 1000, max(captured) * 1000, len(captured), len(latencies))
+
+    def _wait_for_camera_closed(self, timeout=3):
+        """Wait until no camera <video> is visible. Returns True when the modal is gone."""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=self.SIGNAL_POLL_INTERVAL).until(
+                EC.invisibility_of_element_located((By.TAG_NAME, "video"))
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _wait_for_video_ready(self, video_element, timeout=5):
+        """Wait until the camera stream delivers frames (HTMLMediaElement.readyState >= HAVE_CURRENT_DATA)."""
+        try:
+            self._signal_wait(timeout).until(
+                lambda d: d.execute_script("return arguments[0].readyState >= 2;", video_element)
+            )
+            return True
+        except TimeoutException:
+            log.warning("Camera stream not ready in time, capturing anyway")
+            return False
+
     def _close_camera_modal(self):
         """Helper to close camera modal if it's open."""
         try:
             cancel_btn = self.driver.find_element(By.XPATH, "//button[normalize-space()='Cancel']")
             cancel_btn.click()
-            print("[INFO] Closed camera modal")
-            time.sleep(0.3)
+            log.info("Closed camera modal")
+            self._wait_for_camera_closed()
         except:
             # Try pressing Escape key
             try:
                 from selenium.webdriver.common.keys import Keys
                 self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                print("[INFO] Closed camera modal with ESC key")
+                log.info("Closed camera modal with ESC key")
             except:
                 pass
     
@@ -444,7 +599,7 @@ class InspectionChecklistPage(BasePage):
             observation_text: Text to fill in the observation field
             expand_first: If True, expand the question before filling (default: False)
         """
-        print(f"[ACTION] Filling observation for question {question_number}...")
+        log.action("Filling observation for question %s...", question_number)
         
         # Find and fill the input
         input_locator = self.get_observation_input_for_question(question_number)
@@ -454,62 +609,54 @@ class InspectionChecklistPage(BasePage):
             try:
                 input_element = self.wait.until(EC.visibility_of_element_located(input_locator))
             except TimeoutException:
-                print(f"[DEBUG] Input not visible for question {question_number}, expanding section...")
+                log.debug("Input not visible for question %s, expanding section...", question_number)
                 self.expand_question_section(question_number)
                 input_element = self.wait.until(EC.visibility_of_element_located(input_locator))
             
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", input_element)
-            time.sleep(0.1)  # Reduced wait
             
             input_element.clear()
             input_element.send_keys(observation_text)
             input_element.send_keys(Keys.TAB)
             
-            print(f"[SUCCESS] Filled observation for question {question_number}: {observation_text}")
+            log.success("Filled observation for question %s: %s", question_number, observation_text)
         except Exception as e:
-            print(f"[ERROR] Failed to fill observation for question {question_number}: {str(e)}")
+            log.error("Failed to fill observation for question %s: %s", question_number, e)
 
-    def fill_all_questions_on_page_2(self, observations=None, capture_photos=False):
+    def fill_all_questions_on_page_2(self, observations=None, capture_photos=False, fill_mode=None):
         """Fill all 12 questions on page 2 with observations and optionally capture photos.
         
         Args:
             observations: List of observation texts (defaults to standard observations)
             capture_photos: If True, capture photos for each question (default: False)
+            fill_mode: "bulk" sets all inputs in one script call, "keystroke" types
+                       each one (fidelity runs). Default: Config.CHECKLIST_FILL_MODE
         """
-        print("\n" + "="*60)
-        print("FILLING ALL QUESTIONS ON PAGE 2")
-        print("="*60)
+        log.info("=== FILLING ALL QUESTIONS ON PAGE 2 ===")
         
         # First, expand all questions at once using the master button
         self.expand_all_questions()
-        time.sleep(0.5)  # Reduced wait time for expansion
-        
-        # Default observations if none provided
-        if observations is None:
-            observations = [
-                "Fasteners installed correctly with torque marks",
-                "Drive post installed within tolerance, heights maintained",
-                "Slew drive seat installed at ±0° angle",
-                "Post seat installed correctly, grounding cable in place",
-                "Slew drives aligned properly, motor facing south",
-                "Correct torque tube installed, alignment within tolerance",
-                "Purlins secured with torque marks, gaskets in place",
-                "Transmission shaft assembly installed correctly",
-                "Tube covers placed on both ends",
-                "Grounding cables installed at both ends and control box",
-                "AI Controller box accessories installed, cables properly routed",
-                "Communication box and wind sensor properly installed"
-            ]
         
-        # Ensure we have 12 observations
-        while len(observations) < 12:
+        # Default observations if none provided; ensure we have 12
+        observations = list(observations if observations is not None else self.DEFAULT_OBSERVATIONS)
+        while len(observations) < self.QUESTION_COUNT:
             observations.append("Verified as per installation manual")
         
+        fill_mode = fill_mode or Config.CHECKLIST_FILL_MODE
+        if fill_mode == "bulk":
+            self.fill_observations_bulk(observations[:self.QUESTION_COUNT])
+            if capture_photos:
+                self.capture_photos_pipelined()
+        else:
+            self._fill_questions_keystroke(observations, capture_photos)
+        
+        log.info("✅ ALL 12 QUESTIONS FILLED SUCCESSFULLY")
+
+    def _fill_questions_keystroke(self, observations, capture_photos):
+        """Fill questions one by one with real keystrokes (fidelity mode)."""
         # Fill each question (they should all be expanded now)
-        for i in range(1, 13):
-            print(f"\n{'='*60}")
-            print(f"📝 PROCESSING QUESTION {i}/12")
-            print(f"{'='*60}")
+        for i in range(1, self.QUESTION_COUNT + 1):
+            log.info("📝 PROCESSING QUESTION %s/12", i)
             
             # CRITICAL: Scroll to question and wait for it to be stable
             try:
@@ -517,183 +664,171 @@ class InspectionChecklistPage(BasePage):
                 
                 # Scroll to center of question section (instant scroll, no smooth)
                 self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", question_section)
-                time.sleep(0.3)  # Reduced wait time
                     
             except Exception as e:
-                print(f"[WARNING] Could not scroll to question {i}: {e}")
+                log.warning("Could not scroll to question %s: %s", i, e)
             
             # Step 1: Fill observation text
-            print(f"[STEP 1/2] Filling observation text...")
+            log.info("[STEP 1/2] Filling observation text...")
             self.fill_observation_for_question(i, observations[i-1])
-            time.sleep(0.2)  # Reduced wait time
             
             # Step 2: Optionally capture photo
             if capture_photos:
-                print(f"[STEP 2/2] Camera capture for question {i}...")
-                time.sleep(0.3)  # Reduced pause
+                log.info("[STEP 2/2] Camera capture for question %s...", i)
                 
                 self.capture_photo_for_question(i, skip_camera=False)
                 
                 # CRITICAL: Verify modal is fully closed before moving to next question
-                print(f"[VERIFY] Checking modal closure after question {i}...")
-                time.sleep(0.3)  # Reduced wait
+                log.info("[VERIFY] Checking modal closure after question %s...", i)
                 try:
-                    open_videos = self.driver.find_elements(By.TAG_NAME, "video")
-                    visible_videos = [v for v in open_videos if v.is_displayed()]
-                    if visible_videos:
-                        print(f"[WARNING] ⚠️ {len(visible_videos)} camera modal(s) still visible after question {i}!")
-                        print("[ACTION] Forcing modal closure...")
+                    if not self._wait_for_camera_closed():
+                        log.warning("⚠️ Camera modal still visible after question %s!", i)
+                        log.action("Forcing modal closure...")
                         self._close_camera_modal()
-                        time.sleep(0.5)  # Reduced wait
                         
                         # Double-check
-                        still_visible = [v for v in self.driver.find_elements(By.TAG_NAME, "video") if v.is_displayed()]
-                        if still_visible:
-                            print(f"[ERROR] ❌ Modal STILL open! Pressing ESC...")
+                        if not self._wait_for_camera_closed():
+                            log.error("❌ Modal STILL open! Pressing ESC...")
                             self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-                            time.sleep(0.3)  # Reduced wait
+                            self._wait_for_camera_closed()
                     else:
-                        print(f"[VERIFY] ✓ No open modals, safe to proceed")
+                        log.info("[VERIFY] ✓ No open modals, safe to proceed")
                 except Exception as verify_err:
-                    print(f"[WARNING] Modal verification failed: {verify_err}")
+                    log.warning("Modal verification failed: %s", verify_err)
             
-            print(f"[SUCCESS] ✅ Question {i} COMPLETED")
-            print(f"{'─'*60}\n")
-            time.sleep(0.2)  # Reduced delay between questions
-        
-        print("\n" + "="*60)
-        print("✅ ALL 12 QUESTIONS FILLED SUCCESSFULLY")
-        print("="*60 + "\n")
+            log.success("✅ Question %s COMPLETED", i)
+
+    def fill_observations_bulk(self, observations):
+        """Fill every observation input in one script execution and verify in one read-back.
+
+        Values are set through the native value setter followed by input/change
+        events and a blur, so React's controlled inputs and onBlur validation see
+        them. Questions whose value did not persist are retyped with keystrokes.
+        """
+        count = len(observations)
+        log.action("Bulk-filling %s observations...", count)
+
+        # Inputs are only mounted for expanded questions
+        try:
+            self.wait.until(lambda d: d.execute_script(self._COUNT_OBSERVATIONS_JS) >= count)
+        except TimeoutException:
+            log.warning("Not all observation inputs are rendered - expanding remaining questions...")
+            for i in range(1, count + 1):
+                self.expand_question_section(i)
+
+        filled = self.driver.execute_script(self._BULK_FILL_JS, observations)
+        log.debug("Set %s observation inputs in one call", filled)
+
+        # Verify all values persisted (re-render may lag a frame behind)
+        mismatched = []
+
+        def persisted(driver):
+            values = driver.execute_script(self._READ_OBSERVATIONS_JS)
+            mismatched[:] = [
+                i for i, expected in enumerate(observations, 1)
+                if i > len(values) or values[i - 1] != expected
+            ]
+            return not mismatched
+
+        try:
+            self._signal_wait().until(persisted)
+            log.success("All %s observations filled and verified", count)
+        except TimeoutException:
+            log.warning("Observations did not persist for questions %s - retyping them", mismatched)
+            for i in mismatched:
+                self.fill_observation_for_question(i, observations[i - 1])
 
     def expand_all_questions(self):
         """Click the expand all button (square-plus icon) to open all question sections at once."""
-        print("[ACTION] Expanding all question sections...")
-        
-        # Take screenshot for debugging
-        try:
-            self.driver.save_screenshot("errors/before_expand_all.png")
-            print("[DEBUG] Screenshot saved as errors/before_expand_all.png")
-        except:
-            pass
+        log.action("Expanding all question sections...")
         
-        # Try multiple locator strategies
+        # Try multiple locator strategies - raced in one in-page query, last winner first
         locators_to_try = [
-            ("Text + sibling button", "//p[contains(text(), 'Answer all the questions')]/following-sibling::button"),
-            ("Parent div approach", "//div[.//p[contains(text(), 'Answer all the questions')]]//button[.//svg[contains(@class, 'lucide-square-plus')]]"),
-            ("SVG icon only", "//svg[contains(@class, 'lucide-square-plus')]/parent::button"),
-            ("Button with ghost variant", "//button[contains(@class, 'button--variant_ghost')]//svg[contains(@class, 'lucide-square-plus')]/parent::button"),
-            ("Direct button class", "button.button--variant_ghost.button--size_xs"),
+            # Text + sibling button
+            (By.XPATH, "//p[contains(text(), 'Answer all the questions')]/following-sibling::button"),
+            # Parent div approach
+            (By.XPATH, "//div[.//p[contains(text(), 'Answer all the questions')]]//button[.//svg[contains(@class, 'lucide-square-plus')]]"),
+            # SVG icon only
+            (By.XPATH, "//svg[contains(@class, 'lucide-square-plus')]/parent::button"),
+            # Button with ghost variant
+            (By.XPATH, "//button[contains(@class, 'button--variant_ghost')]//svg[contains(@class, 'lucide-square-plus')]/parent::button"),
+            # Direct button class
+            (By.CSS_SELECTOR, "button.button--variant_ghost.button--size_xs"),
+            # Any button containing the square-plus icon (replaces scanning every <button> and its <svg> children)
+            (By.CSS_SELECTOR, "button:has(svg.lucide-square-plus)"),
         ]
         
-        expand_btn = None
-        used_locator = None
-        
-        for locator_name, locator_xpath in locators_to_try:
-            try:
-                print(f"[DEBUG] Trying locator: {locator_name}")
-                if locator_xpath.startswith("button."):
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, locator_xpath)
-                else:
-                    elements = self.driver.find_elements(By.XPATH, locator_xpath)
-                
-                if elements:
-                    # Filter for visible and enabled buttons
-                    for elem in elements:
-                        if elem.is_displayed() and elem.is_enabled():
-                            expand_btn = elem
-                            used_locator = locator_name
-                            print(f"[SUCCESS] Found button using: {locator_name}")
-                            break
-                    if expand_btn:
-                        break
-            except Exception as e:
-                print(f"[DEBUG] Locator '{locator_name}' failed: {str(e)}")
-                continue
-        
-        if not expand_btn:
-            print("[WARNING] Standard locators failed. Trying aggressive search...")
-            # Last resort: find ALL buttons and check for square-plus icon
-            try:
-                all_buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                print(f"[DEBUG] Found {len(all_buttons)} total buttons on page")
-                
-                for idx, btn in enumerate(all_buttons):
-                    try:
-                        if btn.is_displayed() and btn.is_enabled():
-                            # Check if this button contains a square-plus SVG
-                            svgs = btn.find_elements(By.TAG_NAME, "svg")
-                            for svg in svgs:
-                                svg_class = svg.get_attribute("class")
-                                if svg_class and "lucide-square-plus" in svg_class:
-                                    expand_btn = btn
-                                    used_locator = f"Aggressive search (button #{idx})"
-                                    print(f"[SUCCESS] Found button with square-plus icon (button #{idx})")
-                                    break
-                            if expand_btn:
-                                break
-                    except:
-                        continue
-            except Exception as e:
-                print(f"[DEBUG] Aggressive search failed: {str(e)}")
+        try:
+            expand_btn = self.find_first("checklist.expand_all", locators_to_try, timeout=3)
+            log.success("Found expand all button")
+        except TimeoutException:
+            expand_btn = None
         
         if not expand_btn:
-            print("[ERROR] Could not find expand all button with any method!")
-            print("[INFO] Will expand questions individually...")
+            log.error("Could not find expand all button with any method!")
+            log.info("Will expand questions individually...")
             return
         
         try:
             # Scroll to button
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", expand_btn)
-            time.sleep(0.5)
+            self.wait_for_element_stable(expand_btn)
             
             # Try regular click first
             try:
                 expand_btn.click()
-                print("[DEBUG] Clicked button using regular click()")
+                log.debug("Clicked button using regular click()")
             except:
                 # Fallback to JavaScript click
                 self.driver.execute_script("arguments[0].click();", expand_btn)
-                print("[DEBUG] Clicked button using JavaScript click()")
+                log.debug("Clicked button using JavaScript click()")
             
-            time.sleep(1.0)  # Give time for accordions to expand
+            # Wait for the accordions to open and finish their expand animation
+            try:
+                self._signal_wait().until(lambda d: d.find_elements(
+                    By.XPATH, "//div[@data-scope='collapsible'][@data-state='open']"))
+            except TimeoutException:
+                pass
+            self.wait_for_animations()
             
             # Verify at least one question is now open
             try:
                 open_sections = self.driver.find_elements(By.XPATH, "//div[@data-scope='collapsible'][@data-state='open']")
                 if len(open_sections) > 0:
-                    print(f"[SUCCESS] All questions expanded. Found {len(open_sections)} open questions.")
+                    log.success("All questions expanded. Found %s open questions.", len(open_sections))
                 else:
-                    print("[WARNING] Button clicked but no questions appear to be open. Will expand individually...")
+                    log.warning("Button clicked but no questions appear to be open. Will expand individually...")
             except:
-                print("[WARNING] Could not verify questions expanded, but continuing...")
+                log.warning("Could not verify questions expanded, but continuing...")
                 
         except Exception as e:
-            print(f"[WARNING] Failed to click expand all button: {str(e)}")
-            print("[INFO] Will try expanding questions individually...")
+            log.warning("Failed to click expand all button: %s", e)
+            log.info("Will try expanding questions individually...")
 
     def collapse_all_questions(self):
         """Click the collapse all button to minimize all sections."""
-        print("[ACTION] Collapsing all question sections...")
+        log.action("Collapsing all question sections...")
         try:
             collapse_btn = self.wait.until(EC.element_to_be_clickable(self.COLLAPSE_ALL_BUTTON))
             self.driver.execute_script("arguments[0].click();", collapse_btn)
-            time.sleep(0.5)
-            print("[SUCCESS] All questions collapsed.")
+            self._signal_wait().until_not(lambda d: d.find_elements(
+                By.XPATH, "//div[@data-scope='collapsible'][@data-state='open']"))
+            log.success("All questions collapsed.")
         except Exception as e:
-            print(f"[ERROR] Failed to collapse questions: {str(e)}")
+            log.error("Failed to collapse questions: %s", e)
 
     def click_proceed_from_page_1(self):
         """Click proceed button on page 1."""
-        print("[ACTION] Clicking Proceed from page 1...")
+        log.action("Clicking Proceed from page 1...")
         try:
             proceed_btn = self.wait.until(EC.element_to_be_clickable(self.PROCEED_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", proceed_btn)
-            time.sleep(0.3)
+            self.wait_for_element_stable(proceed_btn)
             self.driver.execute_script("arguments[0].click();", proceed_btn)
-            time.sleep(0.5)
-            print("[SUCCESS] Clicked Proceed - moved to page 2.")
+            self.wait.until(EC.presence_of_element_located(self.PAGE_2_INDICATOR))
+            log.success("Clicked Proceed - moved to page 2.")
         except Exception as e:
-            print(f"[ERROR] Failed to click Proceed: {str(e)}")
+            log.error("Failed to click Proceed: %s", e)
 
     def submit_checklist_form(self):
         """Submit the inspection checklist form and handle confirmation popup.
@@ -704,29 +839,31 @@ class InspectionChecklistPage(BasePage):
         3. Click the Submit button on the popup
         4. Wait for success toast message
         """
-        print("[ACTION] Submitting inspection checklist form...")
+        log.action("Submitting inspection checklist form...")
+        # Toasts of an earlier submit may still be showing (back-to-back RFIs)
+        stale_toasts = self._visible_toasts()
         try:
             # Scroll to bottom
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.3)
             
             # Click the initial Submit button
             submit_btn = self.wait.until(EC.element_to_be_clickable(self.SUBMIT_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", submit_btn)
-            time.sleep(0.3)
+            self.wait_for_element_stable(submit_btn)
             self.driver.execute_script("arguments[0].click();", submit_btn)
-            print("[INFO] Clicked Submit button - waiting for confirmation popup...")
+            log.info("Clicked Submit button - waiting for confirmation popup...")
             
             # Wait for confirmation popup to appear
-            print("[INFO] Waiting for confirmation dialog...")
+            log.info("Waiting for confirmation dialog...")
             try:
                 # Wait for dialog to be visible
                 self.wait.until(EC.visibility_of_element_located(self.POPUP_DIALOG))
-                print("[SUCCESS] Confirmation dialog appeared!")
+                log.success("Confirmation dialog appeared!")
             except TimeoutException:
-                print("[WARNING] Dialog did not appear within timeout, trying anyway...")
+                log.warning("Dialog did not appear within timeout, trying anyway...")
             
-            time.sleep(0.5)
+            # Let the dialog finish its open animation
+            self.wait_for_animations()
             
             # Debug popup structure
             self.debug_popup_structure()
@@ -746,24 +883,22 @@ class InspectionChecklistPage(BasePage):
             ]
             
             popup_clicked = False
-            for locator in popup_submit_locators:
-                try:
-                    popup_submit = self.wait.until(EC.element_to_be_clickable(locator))
-                    self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", popup_submit)
-                    time.sleep(0.2)
-                    self.driver.execute_script("arguments[0].click();", popup_submit)
-                    print("[SUCCESS] Clicked Submit button on confirmation popup!")
-                    popup_clicked = True
-                    break
-                except:
-                    continue
+            try:
+                # All locators raced in one in-page query per poll, last winner first
+                popup_submit = self.find_first("checklist.popup_submit", popup_submit_locators, timeout=10)
+                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", popup_submit)
+                self.driver.execute_script("arguments[0].click();", popup_submit)
+                log.success("Clicked Submit button on confirmation popup!")
+                popup_clicked = True
+            except Exception:
+                pass
             
             if not popup_clicked:
-                print("[WARNING] Standard popup locators failed. Trying aggressive search...")
+                log.warning("Standard popup locators failed. Trying aggressive search...")
                 # Find all Submit buttons and click the visible one that's not the first
                 try:
                     all_submit_buttons = self.driver.find_elements(By.XPATH, "//button[normalize-space()='Submit']")
-                    print(f"[DEBUG] Found {len(all_submit_buttons)} Submit buttons")
+                    log.debug("Found %s Submit buttons", len(all_submit_buttons))
                     
                     for idx, btn in enumerate(all_submit_buttons):
                         try:
@@ -771,60 +906,69 @@ class InspectionChecklistPage(BasePage):
                                 # Skip the first one (main form submit), click the second (popup)
                                 if idx > 0:
                                     self.driver.execute_script("arguments[0].click();", btn)
-                                    print(f"[SUCCESS] Clicked Submit button #{idx+1} (popup)")
+                                    log.success("Clicked Submit button #%s (popup)", idx+1)
                                     popup_clicked = True
                                     break
                         except:
                             continue
                 except Exception as e:
-                    print(f"[DEBUG] Aggressive popup search failed: {str(e)}")
+                    log.debug("Aggressive popup search failed: %s", e)
             
             if not popup_clicked:
-                print("[WARNING] Could not find popup Submit button, trying to continue anyway...")
+                log.warning("Could not find popup Submit button, trying to continue anyway...")
             
-            # Wait for success message
-            self.wait.until(EC.visibility_of_element_located(self.SUCCESS_TOAST))
-            print("[SUCCESS] Inspection checklist submitted successfully!")
+            # Wait for this submit's success message
+            self.wait.until(lambda d: [toast for toast in self._visible_toasts() if toast not in stale_toasts])
+            log.success("Inspection checklist submitted successfully!")
             
         except Exception as e:
-            print(f"[ERROR] Failed to submit form: {str(e)}")
-            # Take screenshot for debugging
-            try:
-                self.driver.save_screenshot("errors/submit_error.png")
-                print("[DEBUG] Screenshot saved as errors/submit_error.png")
-            except:
-                pass
+            log.error("Failed to submit form: %s", e)
+            capture_failure(self.driver, "submit_error")
             raise
 
-    def complete_inspection_checklist(self, observations=None, capture_photos=False):
+    def _visible_toasts(self):
+        return self.driver.execute_script(_VISIBLE_BY_XPATH_JS, self.SUCCESS_TOAST[1])
+
+    def get_submitted_rfi_id(self):
+        """RFI number from the latest submit confirmation, or None if it doesn't show one."""
+        # Newest toast last in the document; older ones may still be fading out
+        for toast in reversed(self._visible_toasts()):
+            match = self.RFI_ID_PATTERN.search(toast.text or "")
+            if match:
+                return match.group(0)
+        return None
+
+    def complete_inspection_checklist(self, observations=None, capture_photos=False, fill_mode=None, handle=None):
         """Complete the entire inspection checklist workflow.
         
         Args:
             observations: List of observation texts for the 12 questions
             capture_photos: If True, capture photos for each question (default: False)
                            Note: Requires browser camera permissions
+            fill_mode: "bulk" (default) or "keystroke" - see fill_all_questions_on_page_2
+            handle: RfiHandle from CreateRfiPage.create_rfi; gets the assigned RFI number
         """
-        print("\n=== STARTING INSPECTION CHECKLIST ===")
+        log.info("=== STARTING INSPECTION CHECKLIST ===")
         
         # Wait for form to load
         self.wait_for_form_visible()
         
         # Check current page
         if self.is_on_page_1():
-            print("[INFO] Currently on page 1, clicking Proceed...")
+            log.info("Currently on page 1, clicking Proceed...")
             self.click_proceed_from_page_1()
         
         # Verify we're on page 2
         if not self.is_on_page_2():
             raise Exception("Failed to navigate to page 2")
         
-        print("[INFO] Now on page 2 - Filling questions...")
+        log.info("Now on page 2 - Filling questions...")
         
         # Debug: Show page structure
         self.debug_page_structure()
         
         # Fill all questions (with optional photo capture)
-        self.fill_all_questions_on_page_2(observations, capture_photos=capture_photos)
+        self.fill_all_questions_on_page_2(observations, capture_photos=capture_photos, fill_mode=fill_mode)
         
         # Optionally collapse sections for cleaner view
         # self.collapse_all_questions()
@@ -832,4 +976,8 @@ class InspectionChecklistPage(BasePage):
         # Submit the form
         self.submit_checklist_form()
         
-        print("=== INSPECTION CHECKLIST COMPLETED ===\n")
+        if handle is not None:
+            handle.rfi_id = self.get_submitted_rfi_id()
+            log.info("Submitted RFI: %s (reference %s)", handle.rfi_id or 'number not shown', handle.reference)
+        
+        log.info("=== INSPECTION CHECKLIST COMPLETED ===")
@@ -2,9 +2,13 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 from config.config import Config
-import time
+from utils.artifacts import capture_failure
+from utils.logger import get_logger
+
+log = get_logger(__name__)
 
 
 class LoginPage(BasePage):
@@ -39,16 +43,16 @@ class LoginPage(BasePage):
     def navigate(self):
         """Navigate to the login page and wait until input field is loaded."""
         self.driver.get(f"{Config.BASE_URL}/login")
-        print(f"[DEBUG] Navigating to {Config.BASE_URL}/login")
+        log.debug("Navigating to %s/login", Config.BASE_URL)
         
         # Wait for the website to be fully loaded
         self.wait_for_page_load(timeout=10)
 
         try:
             self.wait.until(EC.presence_of_element_located(self.USERNAME_INPUT))
-            print("[DEBUG] Login page loaded successfully.")
+            log.debug("Login page loaded successfully.")
         except Exception:
-            print("[WARN] Username input not found quickly — re-checking.")
+            log.warning("Username input not found quickly — re-checking.")
             self.wait.until(EC.presence_of_element_located(self.USERNAME_INPUT))
 
     # -----------------------------------------------------
@@ -61,10 +65,9 @@ class LoginPage(BasePage):
             field.clear()
             field.send_keys(username)
             field.send_keys(Keys.TAB) # Tab after filling input
-            time.sleep(0.5) # Short wait after tab
-            print(f"[DEBUG] Username entered: {username}")
+            log.debug("Username entered: %s", username)
         except Exception as e:
-            print(f"[ERROR] Failed to enter username: {e}")
+            log.error("Failed to enter username: %s", e)
             raise
 
     def enter_password(self, password):
@@ -74,31 +77,32 @@ class LoginPage(BasePage):
             field.clear()
             field.send_keys(password)
             field.send_keys(Keys.TAB) # Tab after filling input
-            time.sleep(0.5) # Short wait after tab
-            print("[DEBUG] Password entered and blurred")
+            self.wait_for_dom_stable() # Let onBlur validation render before submitting
+            log.debug("Password entered and blurred")
         except Exception as e:
-            print(f"[ERROR] Failed to enter password: {e}")
+            log.error("Failed to enter password: %s", e)
             raise
 
     # -----------------------------------------------------
     # LOGIN BUTTON HANDLING
     # -----------------------------------------------------
     def find_login_button(self):
-        """Find login button using multiple fallback locator strategies."""
-        print("\n[DEBUG] Searching for Login button...")
+        """Find login button using multiple fallback locator strategies.
 
-        for idx, locator in enumerate(self.LOGIN_BUTTON_LOCATORS, start=1):
-            try:
-                element = WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable(locator)
-                )
-                print(f"✓ [FOUND] Login button located via strategy {idx}: {locator}")
-                return element
-            except Exception:
-                print(f"✗ [MISS] Strategy {idx} failed: {locator}")
+        All strategies are raced in one in-page query; the one that worked last
+        run is preferred.
+        """
+        log.debug("Searching for Login button...")
 
-        self.driver.save_screenshot("login_error.png")
-        print("[ERROR] Could not locate Login button. Screenshot saved as login_error.png")
+        try:
+            element = self.find_first("login.button", self.LOGIN_BUTTON_LOCATORS, timeout=10)
+            log.debug("✓ [FOUND] Login button located")
+            return element
+        except TimeoutException:
+            log.debug("✗ [MISS] None of %s strategies matched", len(self.LOGIN_BUTTON_LOCATORS))
+
+        capture_failure(self.driver, "login_button_not_found")
+        log.error("Could not locate Login button.")
         raise Exception("Login button not found with any of the tried locators.")
 
     def click_login_button(self):
@@ -107,11 +111,10 @@ class LoginPage(BasePage):
             button = self.find_login_button()
             self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
             button.click()
-            print("[DEBUG] Login button clicked successfully.")
+            log.debug("Login button clicked successfully.")
         except Exception as e:
-            print(f"[ERROR] Click failed: {e}")
-            self.driver.save_screenshot("login_click_error.png")
-            print("[SCREENSHOT] Saved as login_click_error.png")
+            log.error("Click failed: %s", e)
+            capture_failure(self.driver, "login_click_error")
             raise
 
     # -----------------------------------------------------
@@ -119,7 +122,7 @@ class LoginPage(BasePage):
     # -----------------------------------------------------
     def login(self, username, password):
         """Perform full login: fill fields, blur, and submit."""
-        print(f"\n[INFO] Starting login flow with username: {username}")
+        log.info("Starting login flow with username: %s", username)
         initial_url = self.driver.current_url
 
         try:
@@ -132,22 +135,21 @@ class LoginPage(BasePage):
                 WebDriverWait(self.driver, 5).until(
                     lambda d: d.current_url != initial_url
                 )
-                print("[DEBUG] URL changed after login — likely successful.")
+                log.debug("URL changed after login — likely successful.")
             except Exception:
-                print("[WARN] URL did not change (SPA app) — continuing anyway.")
+                log.warning("URL did not change (SPA app) — continuing anyway.")
 
             # Optional: wait for spinner to disappear
             if self.is_element_present(self.LOADING_SPINNER):
                 try:
                     self.wait_for_element_to_disappear(self.LOADING_SPINNER, timeout=3)
-                    print("[DEBUG] Loading spinner disappeared after login.")
+                    log.debug("Loading spinner disappeared after login.")
                 except Exception:
-                    print("[WARN] Spinner did not disappear — continuing anyway.")
+                    log.warning("Spinner did not disappear — continuing anyway.")
 
         except Exception as e:
-            print(f"[ERROR] Login failed: {str(e)}")
-            self.driver.save_screenshot("errors/login_failed.png")
-            print("[SCREENSHOT] Saved as errors/login_failed.png")
+            log.error("Login failed: %s", e)
+            capture_failure(self.driver, "login_failed")
             raise
 
     # -----------------------------------------------------
@@ -157,7 +159,7 @@ class LoginPage(BasePage):
         """Return login error message text."""
         try:
             text = self.get_text(self.ERROR_MESSAGE)
-            print(f"[DEBUG] Error message detected: {text}")
+            log.debug("Error message detected: %s", text)
             return text
         except Exception:
             return ""
@@ -165,5 +167,5 @@ class LoginPage(BasePage):
     def is_error_displayed(self):
         """Check if error message is visible."""
         visible = self.is_element_visible(self.ERROR_MESSAGE, timeout=5)
-        print(f"[DEBUG] Error message visible: {visible}")
+        log.debug("Error message visible: %s", visible)
         return visible
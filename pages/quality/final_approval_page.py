@@ -2,7 +2,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
-import time
+from utils.logger import get_logger
+
+log = get_logger(__name__)
 
 
 class FinalApprovalPage(BasePage):
@@ -21,6 +23,7 @@ class FinalApprovalPage(BasePage):
     
     # RFI List
     FIRST_RFI_ROW = (By.XPATH, "(//table//tr[@data-testid='rfi-row' or contains(@class, 'table-row')])[1]")
+    RFI_DETAIL_ROUTE = "INSPECTION_DETAIL_PATH"
     FINAL_APPROVE_BUTTON = (By.XPATH, "//button[contains(text(), 'Final Approve') or contains(text(), 'Close')]")
     
     # Final Approval Form
@@ -36,37 +39,41 @@ class FinalApprovalPage(BasePage):
 
     def navigate(self):
         """Navigate to inspection page."""
-        print("[INFO] Navigating to inspection page...")
+        log.info("Navigating to inspection page...")
         try:
             inspection_menu = self.wait.until(EC.element_to_be_clickable(self.INSPECTION_MENU))
-            inspection_menu.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Navigated to inspection page")
+            self.click_and_wait_for_network(inspection_menu)
+            log.success("Navigated to inspection page")
         except Exception as e:
-            print(f"[ERROR] Failed to navigate: {str(e)}")
+            log.error("Failed to navigate: %s", e)
             raise
 
     def go_to_inspected_list(self):
         """Click on inspected RFIs tab."""
-        print("[ACTION] Opening inspected RFIs...")
+        log.action("Opening inspected RFIs...")
         try:
             inspected_tab = self.wait.until(EC.element_to_be_clickable(self.INSPECTED_TAB))
-            inspected_tab.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Opened inspected RFIs")
+            self.click_and_wait_for_network(inspected_tab)
+            log.success("Opened inspected RFIs")
         except Exception as e:
-            print(f"[WARNING] Inspected tab not found: {str(e)}")
+            log.warning("Inspected tab not found: %s", e)
 
     def open_first_rfi(self):
         """Open the first RFI for final approval."""
-        print("[ACTION] Opening first RFI for final approval...")
+        self.open_rfi()
+
+    def open_rfi(self, handle=None):
+        """Open the RFI behind `handle` for final approval (the first RFI when None).
+
+        Args:
+            handle: RfiHandle of the scenario's RFI
+        """
+        log.action("Opening %s for final approval...", handle or 'first RFI')
         try:
-            first_rfi = self.wait.until(EC.element_to_be_clickable(self.FIRST_RFI_ROW))
-            first_rfi.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Opened RFI")
+            self.click_rfi_row(handle, self.FIRST_RFI_ROW)
+            log.success("Opened RFI")
         except Exception as e:
-            print(f"[ERROR] Failed to open RFI: {str(e)}")
+            log.error("Failed to open RFI: %s", e)
             raise
 
     def add_final_remarks(self, remarks):
@@ -75,38 +82,37 @@ class FinalApprovalPage(BasePage):
         Args:
             remarks: Final remarks text
         """
-        print(f"[ACTION] Adding final remarks: {remarks}")
+        log.action("Adding final remarks: %s", remarks)
         try:
             remarks_field = self.wait.until(EC.visibility_of_element_located(self.FINAL_REMARKS_TEXTAREA))
             remarks_field.clear()
             remarks_field.send_keys(remarks)
-            print("[SUCCESS] Added final remarks")
+            log.success("Added final remarks")
         except Exception as e:
-            print(f"[WARNING] Could not add final remarks: {str(e)}")
+            log.warning("Could not add final remarks: %s", e)
 
     def click_final_approve(self):
         """Click the final approve button."""
-        print("[ACTION] Clicking Final Approve...")
+        log.action("Clicking Final Approve...")
         try:
             approve_btn = self.wait.until(EC.element_to_be_clickable(self.FINAL_APPROVE_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", approve_btn)
-            time.sleep(0.2)
+            self.wait_for_element_stable(approve_btn)
             approve_btn.click()
-            print("[SUCCESS] Clicked Final Approve")
+            log.success("Clicked Final Approve")
         except Exception as e:
-            print(f"[ERROR] Failed to click final approve: {str(e)}")
+            log.error("Failed to click final approve: %s", e)
             raise
 
     def confirm_final_approval(self):
         """Confirm the final approval."""
-        print("[ACTION] Confirming final approval...")
+        log.action("Confirming final approval...")
         try:
             confirm_btn = self.wait.until(EC.element_to_be_clickable(self.CONFIRM_FINAL_APPROVAL_BUTTON))
-            confirm_btn.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Final approval confirmed")
+            self.click_and_wait_for_network(confirm_btn)
+            log.success("Final approval confirmed")
         except Exception as e:
-            print(f"[ERROR] Failed to confirm final approval: {str(e)}")
+            log.error("Failed to confirm final approval: %s", e)
             raise
 
     def is_success_displayed(self):
@@ -117,18 +123,19 @@ class FinalApprovalPage(BasePage):
         except:
             return False
 
-    def give_final_approval(self, remarks="Quality inspection passed. RFI closed."):
+    def give_final_approval(self, remarks="Quality inspection passed. RFI closed.", handle=None):
         """Complete final approval workflow.
         
         Args:
             remarks: Final remarks (default: "Quality inspection passed. RFI closed.")
+            handle: RfiHandle of the RFI to work on (default: first in the list)
         """
-        print("\n=== STARTING FINAL APPROVAL WORKFLOW ===")
+        log.info("=== STARTING FINAL APPROVAL WORKFLOW ===")
         
         self.go_to_inspected_list()
-        self.open_first_rfi()
+        self.open_rfi(handle)
         self.add_final_remarks(remarks)
         self.click_final_approve()
         self.confirm_final_approval()
         
-        print("=== FINAL APPROVAL COMPLETED ===\n")
+        log.info("=== FINAL APPROVAL COMPLETED ===")
@@ -2,7 +2,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
-import time
+from utils.logger import get_logger
+
+log = get_logger(__name__)
 
 
 class InspectRfiPage(BasePage):
@@ -22,6 +24,7 @@ class InspectRfiPage(BasePage):
     
     # RFI List
     FIRST_RFI_ROW = (By.XPATH, "(//table//tr[@data-testid='rfi-row' or contains(@class, 'table-row')])[1]")
+    RFI_DETAIL_ROUTE = "INSPECTION_DETAIL_PATH"
     INSPECT_BUTTON = (By.XPATH, "//button[contains(text(), 'Inspect') or contains(text(), 'Start Inspection')]")
     
     # Inspection Form
@@ -47,46 +50,49 @@ class InspectRfiPage(BasePage):
 
     def navigate(self):
         """Navigate to inspection page."""
-        print("[INFO] Navigating to inspection page...")
+        log.info("Navigating to inspection page...")
         try:
             inspection_menu = self.wait.until(EC.element_to_be_clickable(self.INSPECTION_MENU))
-            inspection_menu.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Navigated to inspection page")
+            self.click_and_wait_for_network(inspection_menu)
+            log.success("Navigated to inspection page")
         except Exception as e:
-            print(f"[ERROR] Failed to navigate: {str(e)}")
+            log.error("Failed to navigate: %s", e)
             raise
 
     def go_to_pending_inspections(self):
         """Click on pending inspections tab."""
-        print("[ACTION] Opening pending inspections...")
+        log.action("Opening pending inspections...")
         try:
             pending_tab = self.wait.until(EC.element_to_be_clickable(self.PENDING_INSPECTIONS_TAB))
-            pending_tab.click()
-            time.sleep(0.5)
-            print("[SUCCESS] Opened pending inspections")
+            self.click_and_wait_for_network(pending_tab)
+            log.success("Opened pending inspections")
         except Exception as e:
-            print(f"[WARNING] Pending tab not found: {str(e)}")
+            log.warning("Pending tab not found: %s", e)
 
     def open_first_rfi(self):
         """Open the first RFI for inspection."""
-        print("[ACTION] Opening first RFI for inspection...")
+        self.open_rfi()
+
+    def open_rfi(self, handle=None):
+        """Open the RFI behind `handle` for inspection (the first RFI when None).
+
+        Args:
+            handle: RfiHandle of the scenario's RFI
+        """
+        log.action("Opening %s for inspection...", handle or 'first RFI')
         try:
-            first_rfi = self.wait.until(EC.element_to_be_clickable(self.FIRST_RFI_ROW))
-            first_rfi.click()
-            time.sleep(0.5)
+            self.click_rfi_row(handle, self.FIRST_RFI_ROW)
             
             # Try to click Inspect button if exists
             try:
                 inspect_btn = self.wait.until(EC.element_to_be_clickable(self.INSPECT_BUTTON))
-                inspect_btn.click()
-                time.sleep(0.5)
+                self.click_and_wait_for_network(inspect_btn)
             except:
                 pass  # Inspect button may not exist
             
-            print("[SUCCESS] Opened RFI for inspection")
+            log.success("Opened RFI for inspection")
         except Exception as e:
-            print(f"[ERROR] Failed to open RFI: {str(e)}")
+            log.error("Failed to open RFI: %s", e)
             raise
 
     def add_inspection_findings(self, findings):
@@ -95,40 +101,39 @@ class InspectRfiPage(BasePage):
         Args:
             findings: Inspection findings text
         """
-        print(f"[ACTION] Adding inspection findings: {findings}")
+        log.action("Adding inspection findings: %s", findings)
         try:
             findings_field = self.wait.until(EC.visibility_of_element_located(self.INSPECTION_FINDINGS_TEXTAREA))
             findings_field.clear()
             findings_field.send_keys(findings)
-            print("[SUCCESS] Added inspection findings")
+            log.success("Added inspection findings")
         except Exception as e:
-            print(f"[WARNING] Could not add findings: {str(e)}")
+            log.warning("Could not add findings: %s", e)
 
     def complete_quality_checklist(self):
         """Check all quality checklist items."""
-        print("[ACTION] Completing quality checklist...")
+        log.action("Completing quality checklist...")
         try:
             checklist_items = self.driver.find_elements(*self.QUALITY_CHECKLIST_ITEMS)
             if checklist_items:
                 for idx, item in enumerate(checklist_items):
                     if not item.is_selected():
                         self.driver.execute_script("arguments[0].click();", item)
-                        time.sleep(0.1)
-                print(f"[SUCCESS] Checked {len(checklist_items)} quality items")
+                log.success("Checked %s quality items", len(checklist_items))
             else:
-                print("[INFO] No quality checklist items found")
+                log.info("No quality checklist items found")
         except Exception as e:
-            print(f"[WARNING] Could not complete checklist: {str(e)}")
+            log.warning("Could not complete checklist: %s", e)
 
     def mark_as_pass(self):
         """Mark inspection as passed."""
-        print("[ACTION] Marking as PASS...")
+        log.action("Marking as PASS...")
         try:
             # Try radio button first
             try:
                 pass_radio = self.wait.until(EC.element_to_be_clickable(self.PASS_RADIO))
                 self.driver.execute_script("arguments[0].click();", pass_radio)
-                print("[SUCCESS] Marked as PASS (radio)")
+                log.success("Marked as PASS (radio)")
                 return
             except:
                 pass
@@ -138,24 +143,24 @@ class InspectRfiPage(BasePage):
                 pass_checkbox = self.wait.until(EC.element_to_be_clickable(self.PASS_CHECKBOX))
                 if not pass_checkbox.is_selected():
                     self.driver.execute_script("arguments[0].click();", pass_checkbox)
-                print("[SUCCESS] Marked as PASS (checkbox)")
+                log.success("Marked as PASS (checkbox)")
                 return
             except:
                 pass
             
-            print("[WARNING] Could not find pass option")
+            log.warning("Could not find pass option")
         except Exception as e:
-            print(f"[ERROR] Failed to mark as pass: {str(e)}")
+            log.error("Failed to mark as pass: %s", e)
 
     def mark_as_fail(self):
         """Mark inspection as failed."""
-        print("[ACTION] Marking as FAIL...")
+        log.action("Marking as FAIL...")
         try:
             # Try radio button first
             try:
                 fail_radio = self.wait.until(EC.element_to_be_clickable(self.FAIL_RADIO))
                 self.driver.execute_script("arguments[0].click();", fail_radio)
-                print("[SUCCESS] Marked as FAIL (radio)")
+                log.success("Marked as FAIL (radio)")
                 return
             except:
                 pass
@@ -165,36 +170,34 @@ class InspectRfiPage(BasePage):
                 fail_checkbox = self.wait.until(EC.element_to_be_clickable(self.FAIL_CHECKBOX))
                 if not fail_checkbox.is_selected():
                     self.driver.execute_script("arguments[0].click();", fail_checkbox)
-                print("[SUCCESS] Marked as FAIL (checkbox)")
+                log.success("Marked as FAIL (checkbox)")
                 return
             except:
                 pass
             
-            print("[WARNING] Could not find fail option")
+            log.warning("Could not find fail option")
         except Exception as e:
-            print(f"[ERROR] Failed to mark as fail: {str(e)}")
+            log.error("Failed to mark as fail: %s", e)
 
     def submit_inspection(self):
         """Submit the inspection."""
-        print("[ACTION] Submitting inspection...")
+        log.action("Submitting inspection...")
         try:
             submit_btn = self.wait.until(EC.element_to_be_clickable(self.SUBMIT_INSPECTION_BUTTON))
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center', behavior:'instant'});", submit_btn)
-            time.sleep(0.2)
-            submit_btn.click()
-            time.sleep(0.5)
+            self.wait_for_element_stable(submit_btn)
+            self.click_and_wait_for_network(submit_btn)
             
             # Handle confirmation dialog if exists
             try:
                 confirm_btn = self.wait.until(EC.element_to_be_clickable(self.CONFIRM_BUTTON))
-                confirm_btn.click()
-                time.sleep(0.3)
+                self.click_and_wait_for_network(confirm_btn)
             except:
                 pass  # No confirmation needed
             
-            print("[SUCCESS] Inspection submitted")
+            log.success("Inspection submitted")
         except Exception as e:
-            print(f"[ERROR] Failed to submit inspection: {str(e)}")
+            log.error("Failed to submit inspection: %s", e)
             raise
 
     def is_inspection_complete(self):
@@ -205,17 +208,18 @@ class InspectRfiPage(BasePage):
         except:
             return False
 
-    def perform_inspection(self, findings="All quality standards met", passed=True):
+    def perform_inspection(self, findings="All quality standards met", passed=True, handle=None):
         """Complete RFI inspection workflow.
         
         Args:
             findings: Inspection findings (default: "All quality standards met")
             passed: True to mark as pass, False to mark as fail
+            handle: RfiHandle of the RFI to work on (default: first in the list)
         """
-        print("\n=== STARTING RFI INSPECTION WORKFLOW ===")
+        log.info("=== STARTING RFI INSPECTION WORKFLOW ===")
         
         self.go_to_pending_inspections()
-        self.open_first_rfi()
+        self.open_rfi(handle)
         self.complete_quality_checklist()
         self.add_inspection_findings(findings)
         
@@ -226,4 +230,4 @@ class InspectRfiPage(BasePage):
         
         self.submit_inspection()
         
-        print("=== RFI INSPECTION COMPLETED ===\n")
+        log.info("=== RFI INSPECTION COMPLETED ===")
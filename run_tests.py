@@ -10,16 +10,38 @@ Usage:
     # List all scenarios
     python run_tests_enhanced.py --list-scenarios
     
+    # Run several scenarios concurrently (independent chains in parallel)
+    python run_tests_enhanced.py --scenario contractor_only quality_inspector_only --workers 2
+    python run_tests_enhanced.py --all-scenarios --workers 4
+    
     # Run individual workflows
     python run_tests_enhanced.py --role contractor --workflow rfi
+    
+    # Run against the bundled stand-in app instead of the live deployment
+    python run_tests_enhanced.py --scenario rfi_complete --local-server --local-latency-ms 50
 """
 
 import argparse
+import pytest
+import secrets
+import socket
 import subprocess
 import sys
 import os
+import threading
+import time
+import urllib.error
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
+from config.config import Config
 from config.test_data import TestData
+from stub_server import StubPulseServer
+from utils.work_queue import WorkQueue, CoordinatorServer, WorkerClient, PASSED, SKIPPED
+from utils.rfi_handle import HANDLE_FILE_ENV, RfiHandle, load_handle, save_handle
+from utils.scenario_session import ScenarioSelectionPlugin, parse_selection
+from utils.checkpoint import ScenarioCheckpoint
+from utils.driver_factory import BROWSER_PROFILES
 
 # Available roles
 ROLES = list(TestData.ROLES.keys())
@@ -254,7 +276,7 @@ def get_python_executable():
     return sys.executable
 
 
-def run_tests(pytest_args):
+def run_tests(pytest_args, env=None):
     """Run pytest with given arguments."""
     python_exe = get_python_executable()
     cmd = [python_exe, "-m", "pytest"] + pytest_args
@@ -263,12 +285,88 @@ def run_tests(pytest_args):
     print(f"▶️  Running: {' '.join(cmd)}")
     print(f"{'='*80}\n")
     
-    result = subprocess.run(cmd)
+    result = subprocess.run(cmd, env=env)
     return result.returncode
 
 
-def run_scenario(scenario_name, html_report=False):
-    """Run a complete multi-step scenario."""
+# Distinguishes the handle files of concurrent run_tests.py invocations
+_RUN_ID = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+def scenario_env(scenario_name):
+    """Environment for a scenario's steps: they share one RFI handle file.
+
+    The step that creates an RFI saves its handle there and the later steps
+    open that RFI, so scenarios running side by side never touch each
+    other's RFIs.
+    """
+    return dict(os.environ, **{HANDLE_FILE_ENV: _scenario_handle_file(scenario_name)})
+
+
+def _scenario_handle_file(scenario_name):
+    return os.path.join(Config.RFI_HANDLE_DIR, f"{_RUN_ID}-{scenario_name}.json")
+
+
+def discard_scenario_handles(scenario_names):
+    for name in scenario_names:
+        path = _scenario_handle_file(name)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# What to do when a step fails: stop the scenario, run its remaining steps
+# anyway, or retry the step with exponential backoff before stopping
+FAILURE_POLICIES = ["fail-fast", "continue", "retry"]
+
+
+def failure_policy(on_failure="fail-fast", retries=Config.STEP_RETRIES, backoff=Config.STEP_RETRY_BACKOFF):
+    return {"on_failure": on_failure, "retries": retries, "backoff": backoff}
+
+
+def run_with_policy(run_once, label, policy):
+    """Call `run_once()` (returns an exit code), retrying failures under the retry policy."""
+    attempts = 1 + policy['retries'] if policy['on_failure'] == "retry" else 1
+    for attempt in range(1, attempts + 1):
+        returncode = run_once()
+        if returncode == 0 or attempt == attempts:
+            return returncode
+        delay = policy['backoff'] * 2 ** (attempt - 1)
+        with _print_lock:
+            print(f"🔁 {label} failed (attempt {attempt}/{attempts}) - retrying in {delay:.0f}s")
+        time.sleep(delay)
+
+
+def load_checkpoint(scenario_name, resume=False):
+    """The scenario's checkpoint: the saved one with --resume, else a fresh one.
+
+    On resume, the RFI handle saved with the last completed step is put back
+    into the scenario's handle file, so the remaining steps open that RFI.
+    """
+    steps = [f"{step['role']}:{step['workflow']}" for step in SCENARIOS[scenario_name]['steps']]
+    path = os.path.join(Config.CHECKPOINT_DIR, f"{scenario_name}.json")
+    if not resume:
+        checkpoint = ScenarioCheckpoint(path, steps)
+        checkpoint.clear()
+        return checkpoint
+    checkpoint = ScenarioCheckpoint.load(path, steps)
+    if checkpoint.completed:
+        done = ", ".join(str(index) for index in sorted(checkpoint.completed))
+        print(f"💾 Resuming {scenario_name}: step(s) {done} already completed ({path})")
+        handle = checkpoint.last_handle()
+        if handle:
+            save_handle(RfiHandle.from_dict(handle), _scenario_handle_file(scenario_name))
+    else:
+        print(f"💾 No checkpoint for {scenario_name} - running every step")
+    return checkpoint
+
+
+def run_scenario(scenario_name, html_report=False, policy=None, resume=False):
+    """Run a complete multi-step scenario.
+
+    Args:
+        policy: failure_policy() - fail-fast (default), continue or retry
+        resume: skip the steps the scenario's checkpoint records as completed
+    """
     if scenario_name not in SCENARIOS:
         print(f"❌ Error: Scenario '{scenario_name}' not found")
         print("\nAvailable scenarios:")
@@ -285,13 +383,20 @@ def run_scenario(scenario_name, html_report=False):
     print(f"📊 Total Steps: {len(steps)}")
     print("="*80)
     
+    policy = policy or failure_policy()
     failed_steps = []
+    env = scenario_env(scenario_name)
+    checkpoint = load_checkpoint(scenario_name, resume)
     
     for idx, step in enumerate(steps, 1):
         role = step['role']
         workflow = step['workflow']
         description = step['description']
         
+        if checkpoint.is_completed(idx):
+            print(f"\n⏭️  STEP {idx}/{len(steps)} already completed (checkpoint): {description}")
+            continue
+        
         print(f"\n{'─'*80}")
         print(f"⏩ STEP {idx}/{len(steps)}: {description}")
         print(f"   Role: {role} | Workflow: {workflow}")
@@ -306,27 +411,30 @@ def run_scenario(scenario_name, html_report=False):
                 pytest_args.extend(["--html=report.html", "--self-contained-html"])
             
             # Run the test
-            returncode = run_tests(pytest_args)
+            returncode = run_with_policy(lambda: run_tests(pytest_args, env=env), f"STEP {idx}", policy)
             
             if returncode != 0:
                 print(f"\n❌ STEP {idx} FAILED: {description}")
                 failed_steps.append(f"Step {idx}: {description}")
                 
-                # Ask user if they want to continue
-                print(f"\n⚠️  Step failed. Continue with remaining steps? (y/n): ", end='')
-                try:
-                    response = input().strip().lower()
-                    if response != 'y':
-                        print("\n🛑 Scenario execution stopped by user")
-                        break
-                except:
-                    print("\n🛑 Scenario execution stopped")
+                if policy['on_failure'] != "continue":
+                    print(f"\n🛑 Scenario execution stopped (--on-failure {policy['on_failure']})")
                     break
+                print("\n➡️  Continuing with remaining steps (--on-failure continue)")
             else:
+                checkpoint.mark_completed(idx, load_handle(env[HANDLE_FILE_ENV]))
                 print(f"\n✅ STEP {idx} COMPLETED: {description}")
         else:
             print(f"❌ Error: Workflow '{workflow}' not found for role '{role}'")
             failed_steps.append(f"Step {idx}: Workflow not found")
+            if policy['on_failure'] != "continue":
+                break
+    
+    discard_scenario_handles([scenario_name])
+    if failed_steps:
+        print(f"\n💾 Checkpoint: {checkpoint.path} - rerun with --resume to skip the completed steps")
+    else:
+        checkpoint.clear()
     
     # Summary
     print("\n" + "="*80)
@@ -345,6 +453,430 @@ def run_scenario(scenario_name, html_report=False):
     return 0 if not failed_steps else 1
 
 
+# ============================================================================
+# PARALLEL SCENARIO ENGINE
+# ============================================================================
+_print_lock = threading.Lock()
+
+
+def build_step_graph(scenario_names):
+    """Expand scenarios into step nodes with their dependencies.
+
+    Steps of the same scenario hand an RFI over to the next role, so each step
+    depends on the one before it. Steps of different scenarios are independent
+    and may run concurrently.
+    """
+    nodes = []
+    for name in scenario_names:
+        previous = None
+        for idx, step in enumerate(SCENARIOS[name]['steps'], 1):
+            node_id = f"{name}#{idx}"
+            nodes.append({
+                "id": node_id,
+                "scenario": name,
+                "index": idx,
+                "total": len(SCENARIOS[name]['steps']),
+                "step": step,
+                "depends_on": [previous] if previous else [],
+            })
+            previous = node_id
+    return nodes
+
+
+def _run_step_node(node, html_report=False):
+    """Run a single step node in its own pytest subprocess, buffering its output."""
+    step = node['step']
+    role, workflow = step['role'], step['workflow']
+    label = f"[{node['scenario']} {node['index']}/{node['total']}]"
+
+    if role not in WORKFLOWS_BY_ROLE or workflow not in WORKFLOWS_BY_ROLE[role]:
+        with _print_lock:
+            print(f"❌ {label} Workflow '{workflow}' not found for role '{role}'")
+        return 1, 0.0
+
+    pytest_args = WORKFLOWS_BY_ROLE[role][workflow]['pytest_args'].copy()
+    if html_report:
+        # One report per step - concurrent steps must not overwrite each other
+        report_name = f"report-{node['scenario']}-{node['index']}.html"
+        pytest_args.extend([f"--html={report_name}", "--self-contained-html"])
+
+    cmd = [get_python_executable(), "-m", "pytest"] + pytest_args
+    with _print_lock:
+        print(f"▶️  {label} START: {step['description']} ({role})")
+
+    started = time.monotonic()
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                            env=scenario_env(node['scenario']))
+    duration = time.monotonic() - started
+
+    with _print_lock:
+        print(f"\n{'─'*80}")
+        print(f"{label} {step['description']} | Role: {role} | Workflow: {workflow}")
+        print(f"   Command: {' '.join(cmd)}")
+        print(f"{'─'*80}")
+        print(result.stdout)
+        status = "✅ COMPLETED" if result.returncode == 0 else "❌ FAILED"
+        print(f"{status} {label} in {duration:.1f}s")
+    return result.returncode, duration
+
+
+def print_parallel_summary(scenario_names, nodes, status, durations, elapsed, title="PARALLEL SCENARIO SUMMARY"):
+    """Per-scenario step status, as collected by the parallel engine or the coordinator."""
+    print("\n" + "="*80)
+    print(f"📊 {title}")
+    print("="*80)
+    icons = {"passed": "✅", "failed": "❌", "skipped": "⏭️ "}
+    for name in scenario_names:
+        scenario_nodes = [node for node in nodes if node['scenario'] == name]
+        ok = all(status.get(node['id']) == "passed" for node in scenario_nodes)
+        print(f"\n  {'✅' if ok else '❌'} {name}")
+        for node in scenario_nodes:
+            state = status.get(node['id'], "skipped")
+            took = f" ({durations[node['id']]:.1f}s)" if node['id'] in durations else ""
+            print(f"     {icons[state]} {node['index']}. {node['step']['description']}{took}")
+    serial = sum(durations.values())
+    print(f"\n⏱️  Wall clock: {elapsed:.1f}s | Sum of steps: {serial:.1f}s")
+    print("="*80 + "\n")
+
+
+def _run_step_node_with_policy(node, html_report, policy):
+    """_run_step_node, retried under the retry policy; the duration covers every attempt."""
+    total = 0.0
+
+    def run_once():
+        nonlocal total
+        returncode, duration = _run_step_node(node, html_report)
+        total += duration
+        return returncode
+
+    label = f"[{node['scenario']} {node['index']}/{node['total']}]"
+    return run_with_policy(run_once, label, policy), total
+
+
+def run_scenarios_parallel(scenario_names, workers=2, html_report=False, policy=None, resume=False):
+    """Run several scenarios on a bounded worker pool.
+
+    Independent steps (different scenarios) run concurrently; steps that hand an
+    RFI to the next role run in order. A failed step skips the rest of its chain,
+    unless the policy is "continue". Passed steps are checkpointed per scenario.
+    """
+    unknown = [name for name in scenario_names if name not in SCENARIOS]
+    if unknown:
+        print(f"❌ Error: Scenario(s) not found: {', '.join(unknown)}")
+        print("\nAvailable scenarios:")
+        for name in SCENARIOS.keys():
+            print(f"  - {name}")
+        return 1
+
+    policy = policy or failure_policy()
+    nodes = build_step_graph(scenario_names)
+    checkpoints = {name: load_checkpoint(name, resume) for name in scenario_names}
+    status = {node['id']: "passed" for node in nodes
+              if checkpoints[node['scenario']].is_completed(node['index'])}
+    pending = {node['id']: node for node in nodes if node['id'] not in status}
+    durations = {}
+    # Dependency states that let a step start; "continue" runs past failed steps
+    ready = ("passed", "failed") if policy['on_failure'] == "continue" else ("passed",)
+
+    print("\n" + "="*80)
+    print(f"🎯 RUNNING {len(scenario_names)} SCENARIO(S) IN PARALLEL: {', '.join(scenario_names)}")
+    print(f"📊 Total Steps: {len(nodes)} | Workers: {workers}")
+    print("="*80)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+        while pending or running:
+            for node_id, node in list(pending.items()):
+                dep_states = [status.get(dep) for dep in node['depends_on']]
+                if any(state in ("failed", "skipped") and state not in ready for state in dep_states):
+                    status[node_id] = "skipped"
+                    del pending[node_id]
+                elif all(state in ready for state in dep_states):
+                    running[pool.submit(_run_step_node_with_policy, node, html_report, policy)] = node
+                    del pending[node_id]
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                returncode, duration = future.result()
+                status[node['id']] = "passed" if returncode == 0 else "failed"
+                durations[node['id']] = duration
+                if returncode == 0:
+                    handle = load_handle(_scenario_handle_file(node['scenario']))
+                    checkpoints[node['scenario']].mark_completed(node['index'], handle)
+    elapsed = time.monotonic() - started
+    discard_scenario_handles(scenario_names)
+    for name, checkpoint in checkpoints.items():
+        if all(status.get(node['id']) == "passed" for node in nodes if node['scenario'] == name):
+            checkpoint.clear()
+        else:
+            print(f"💾 Checkpoint: {checkpoint.path} - rerun with --resume to skip the completed steps")
+
+    print_parallel_summary(scenario_names, nodes, status, durations, elapsed)
+
+    return 0 if all(state == "passed" for state in status.values()) and len(status) == len(nodes) else 1
+
+
+# ============================================================================
+# IN-PROCESS MODE - every step in one pytest session
+# ============================================================================
+def run_scenarios_in_process(scenario_names, html_report=False):
+    """Run the steps of the given scenarios in this process, in one pytest session.
+
+    A subprocess per step re-imports selenium, re-collects the tests and,
+    since role drivers are session-scoped, boots Chrome and logs in again.
+    Here the steps share one session: each role logs in once and its driver
+    is reused by every later step, of any scenario, that runs as that role.
+    Scenarios run one after another; a failed step skips the rest of its
+    scenario. A test can only run once per session, so scenarios that share
+    a step (e.g. two that both create an RFI) must be run separately.
+    """
+    unknown = [name for name in scenario_names if name not in SCENARIOS]
+    if unknown:
+        print(f"❌ Error: Scenario(s) not found: {', '.join(unknown)}")
+        print("\nAvailable scenarios:")
+        for name in SCENARIOS.keys():
+            print(f"  - {name}")
+        return 1
+
+    nodes = build_step_graph(scenario_names)
+    steps = []
+    for node in nodes:
+        step = node['step']
+        workflow = WORKFLOWS_BY_ROLE.get(step['role'], {}).get(step['workflow'])
+        if workflow is None:
+            print(f"❌ Error: Workflow '{step['workflow']}' not found for role '{step['role']}'")
+            return 1
+        steps.append({
+            "id": node['id'],
+            "scenario": node['scenario'],
+            "pytest_args": workflow['pytest_args'],
+            "env": {HANDLE_FILE_ENV: _scenario_handle_file(node['scenario'])},
+        })
+
+    # Collect from the union of the steps' paths; a step without paths (e.g. "-m rfi")
+    # selects from the configured testpaths, so collect those instead
+    step_paths = [parse_selection(step['pytest_args'])[0] for step in steps]
+    pytest_args = [] if not all(step_paths) else sorted({path for paths in step_paths for path in paths})
+    if any("-v" in step['pytest_args'] for step in steps):
+        pytest_args.append("-v")
+    if os.environ.get("PULSE_PROFILE_SLEEPS") == "1":
+        # Config was imported before --profile-sleeps set the env var
+        pytest_args.append("--profile-sleeps")
+    if html_report:
+        pytest_args.extend(["--html=report.html", "--self-contained-html"])
+
+    print("\n" + "="*80)
+    print(f"🎯 RUNNING {len(scenario_names)} SCENARIO(S) IN ONE PYTEST SESSION: {', '.join(scenario_names)}")
+    print(f"📊 Total Steps: {len(nodes)}")
+    print(f"▶️  pytest {' '.join(pytest_args)}")
+    print("="*80)
+
+    plugin = ScenarioSelectionPlugin(steps)
+    started = time.monotonic()
+    exit_code = pytest.main(pytest_args, plugins=[plugin])
+    elapsed = time.monotonic() - started
+    discard_scenario_handles(scenario_names)
+
+    print_parallel_summary(scenario_names, nodes, plugin.status, plugin.durations, elapsed,
+                           title="IN-PROCESS SCENARIO SUMMARY")
+
+    passed = all(plugin.status.get(node['id']) == "passed" for node in nodes)
+    return 0 if passed and exit_code == 0 else 1
+
+
+# ============================================================================
+# DISTRIBUTED MODE - coordinator hands out steps, workers run them
+# ============================================================================
+# Settings the coordinator forwards to every worker's pytest run
+FORWARDED_ENV = ["PULSE_BASE_URL", "PULSE_TARGET", "PULSE_PROFILE_SLEEPS", "PULSE_CHECKLIST_FILL_MODE",
+                 "PULSE_BROWSER_PROFILE", "PULSE_LOG_LEVEL"]
+LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+
+def forwarded_env():
+    """FORWARDED_ENV values set here, minus targets that only resolve on this host.
+
+    A loopback PULSE_BASE_URL (e.g. from --local-server) would point every
+    remote worker at itself, so it is left to the workers' own environment,
+    and so is the PULSE_TARGET=local that goes with it.
+    """
+    env = {key: os.environ[key] for key in FORWARDED_ENV if key in os.environ}
+    base_url = env.get("PULSE_BASE_URL")
+    if base_url and urlparse(base_url).hostname in LOOPBACK_HOSTS:
+        print(f"⚠️  Not forwarding PULSE_BASE_URL={base_url} (loopback) - "
+              "workers use their own PULSE_BASE_URL")
+        del env["PULSE_BASE_URL"]
+        if env.get("PULSE_TARGET") == "local":
+            del env["PULSE_TARGET"]
+    return env
+
+
+def build_work_items(scenario_names=None, role=None, workflow=None, html_report=False):
+    """Expand scenarios (or one role workflow) into coordinator work items.
+
+    Scenario steps keep the dependencies of build_step_graph, so a worker only
+    gets a step once the step before it passed somewhere.
+    """
+    if scenario_names:
+        nodes = build_step_graph(scenario_names)
+    else:
+        nodes = [{
+            "id": f"{role}:{workflow}",
+            "scenario": f"{role}:{workflow}",
+            "index": 1,
+            "total": 1,
+            "step": {"role": role, "workflow": workflow,
+                     "description": WORKFLOWS_BY_ROLE[role][workflow]['description']},
+            "depends_on": [],
+        }]
+
+    env = forwarded_env()
+    items = []
+    for node in nodes:
+        step = node['step']
+        pytest_args = WORKFLOWS_BY_ROLE[step['role']][step['workflow']]['pytest_args'].copy()
+        if html_report:
+            pytest_args.extend([f"--html=report-{node['scenario']}-{node['index']}.html".replace(":", "-"),
+                                "--self-contained-html"])
+        items.append({
+            "id": node['id'],
+            "label": f"[{node['scenario']} {node['index']}/{node['total']}]",
+            "role": step['role'],
+            "workflow": step['workflow'],
+            "description": step['description'],
+            "pytest_args": pytest_args,
+            "env": env,
+            "depends_on": node['depends_on'],
+            "node": node,
+        })
+    return items
+
+
+def run_coordinator(args, scenario_names):
+    """Serve the selected steps to workers and collect their results."""
+    items = build_work_items(scenario_names, args.role, args.workflow, args.html_report)
+    host, _, port = args.bind.rpartition(":")
+    queue = WorkQueue(items, lease_timeout=Config.WORK_LEASE_TIMEOUT)
+    durations = {}
+
+    def report(item, result):
+        with _print_lock:
+            if result['status'] == SKIPPED:
+                print(f"⏭️  {item['label']} SKIPPED: {item['description']} (an earlier step failed)")
+                return
+            durations[item['id']] = result['duration']
+            print(f"\n{'─'*80}")
+            print(f"{item['label']} {item['description']} | Role: {item['role']} | Worker: {result['worker']}")
+            print(f"{'─'*80}")
+            print(result['output'])
+            status = "✅ COMPLETED" if result['status'] == PASSED else "❌ FAILED"
+            print(f"{status} {item['label']} in {result['duration']:.1f}s")
+
+    queue.on_result(report)
+    token = Config.COORDINATOR_TOKEN or secrets.token_urlsafe(24)
+    coordinator = CoordinatorServer(queue, token, host or "127.0.0.1", int(port)).start()
+
+    print("\n" + "="*80)
+    print(f"🛰️  COORDINATOR: {len(items)} step(s) waiting for workers")
+    if Config.COORDINATOR_TOKEN:
+        print("   Start workers with PULSE_COORDINATOR_TOKEN set to the same value:")
+        print(f"   python run_tests.py --worker {coordinator.address} --workers 2")
+    else:
+        print(f"   Start workers with: PULSE_COORDINATOR_TOKEN={token} "
+              f"python run_tests.py --worker {coordinator.address} --workers 2")
+    print("="*80)
+
+    started = time.monotonic()
+    try:
+        queue.wait()
+        # Keep answering /lease (410) until every worker has heard that the run is over
+        if not queue.wait_for_workers(timeout=Config.WORK_LEASE_TIMEOUT):
+            print("⚠️  Some workers did not poll again before shutdown")
+    finally:
+        coordinator.stop()
+    elapsed = time.monotonic() - started
+
+    nodes = [item['node'] for item in items]
+    names = scenario_names or [nodes[0]['scenario']]
+    print_parallel_summary(names, nodes, queue.status, durations, elapsed)
+    return 0 if all(state == PASSED for state in queue.status.values()) else 1
+
+
+def _run_work_item(item, lease_lost):
+    """Run one coordinator work item in a pytest subprocess (worker side).
+
+    The RFI handle of the item's scenario travels through the coordinator:
+    it is written to a local handle file before the run and read back after.
+    The subprocess is terminated if `lease_lost` is set (the item was handed
+    to another worker).
+    """
+    cmd = [get_python_executable(), "-m", "pytest"] + item['pytest_args']
+    handle_file = _scenario_handle_file(item['id'].replace('#', '-').replace(':', '-'))
+    inherited = item.get('data', {}).get('rfi_handle')
+    if inherited:
+        save_handle(RfiHandle.from_dict(inherited), handle_file)
+    forwarded = {key: value for key, value in item.get('env', {}).items() if key in FORWARDED_ENV}
+    rejected = sorted(set(item.get('env', {})) - set(forwarded))
+    env = dict(os.environ, **forwarded, **{HANDLE_FILE_ENV: handle_file})
+    with _print_lock:
+        if rejected:
+            print(f"⚠️  {item['label']} ignoring environment not in FORWARDED_ENV: {', '.join(rejected)}")
+        print(f"▶️  {item['label']} START: {item['description']} ({item['role']})")
+
+    started = time.monotonic()
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env) as proc:
+        while True:
+            try:
+                output, _ = proc.communicate(timeout=1)
+                break
+            except subprocess.TimeoutExpired:
+                if lease_lost.is_set():
+                    proc.terminate()
+                    try:
+                        output, _ = proc.communicate(timeout=10)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+                        output, _ = proc.communicate()
+                    break
+    duration = time.monotonic() - started
+
+    handle = load_handle(handle_file)
+    discard_scenario_handles([item['id'].replace('#', '-').replace(':', '-')])
+    with _print_lock:
+        if lease_lost.is_set():
+            status = "⏹️  ABORTED (lease lost)"
+        else:
+            status = "✅ COMPLETED" if proc.returncode == 0 else "❌ FAILED"
+        print(f"{status} {item['label']} in {duration:.1f}s")
+    return proc.returncode, duration, output, {"rfi_handle": handle.to_dict()} if handle else {}
+
+
+def run_worker(coordinator_url, workers=1):
+    """Pull steps from a coordinator until it has none left, `workers` at a time."""
+    if not Config.COORDINATOR_TOKEN:
+        print("❌ Error: set PULSE_COORDINATOR_TOKEN to the token printed by the coordinator")
+        return 1
+    print(f"\n🛠️  WORKER: pulling steps from {coordinator_url} ({workers} concurrent)")
+    host = socket.gethostname()
+    clients = [WorkerClient(coordinator_url, Config.COORDINATOR_TOKEN, name=f"{host}-{os.getpid()}-w{n}")
+               for n in range(1, workers + 1)]
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            processed = sum(pool.map(lambda client: client.run(_run_work_item), clients))
+    except urllib.error.HTTPError as e:
+        if e.code != 401:
+            raise
+        print("❌ Error: the coordinator rejected PULSE_COORDINATOR_TOKEN")
+        return 1
+    print(f"🏁 WORKER: coordinator finished - ran {processed} step(s)")
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run Selenium test scenarios and workflows",
@@ -356,11 +888,36 @@ Examples:
   python run_tests_enhanced.py --scenario rfi_rejection
   python run_tests_enhanced.py --scenario contractor_only
   
+  # Run independent scenarios concurrently on a bounded worker pool
+  python run_tests_enhanced.py --scenario contractor_only quality_inspector_only --workers 2
+  python run_tests_enhanced.py --all-scenarios --workers 4
+  
   # Run individual workflows
   python run_tests_enhanced.py --role contractor --workflow rfi
   python run_tests_enhanced.py --role block_engineer --workflow review_rfi
   python run_tests_enhanced.py --role quality_inspector --workflow inspect_rfi
   
+  # Run against the bundled stand-in app (offline, no backend latency)
+  python run_tests_enhanced.py --scenario rfi_complete --local-server
+  
+  # Unattended runs: retry a failed step twice (5s, 10s backoff), then resume later
+  python run_tests_enhanced.py --scenario rfi_complete --on-failure retry --retries 2
+  python run_tests_enhanced.py --scenario rfi_complete --resume
+  
+  # Run every step in one pytest session (one Chrome start and login per role)
+  python run_tests_enhanced.py --scenario rfi_complete --in-process
+  
+  # Distributed: one coordinator, any number of workers (same box or other hosts)
+  # (workers need the coordinator's PULSE_COORDINATOR_TOKEN)
+  python run_tests_enhanced.py --all-scenarios --coordinator --bind 0.0.0.0:8790
+  PULSE_COORDINATOR_TOKEN=... python run_tests_enhanced.py --worker http://coordinator-host:8790 --workers 2
+  
+  # Headless, lightweight Chrome (no images/fonts/extensions) for parallel CI runs
+  python run_tests_enhanced.py --all-scenarios --workers 4 --browser-profile performance
+  
+  # Rank where each pytest run spends idle time (sleeps, implicit waits)
+  python run_tests_enhanced.py --scenario rfi_complete --profile-sleeps
+  
   # List available options
   python run_tests_enhanced.py --list-scenarios
   python run_tests_enhanced.py --list-workflows
@@ -370,7 +927,55 @@ Examples:
     
     parser.add_argument(
         "--scenario", "-s",
-        help="Run a complete parent scenario (multi-step workflow)"
+        nargs="+",
+        help="Run one or more parent scenarios (multi-step workflows)"
+    )
+    
+    parser.add_argument(
+        "--all-scenarios",
+        action="store_true",
+        help="Run every parent scenario"
+    )
+    
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=1,
+        help="Number of scenario steps to run concurrently (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--on-failure",
+        choices=FAILURE_POLICIES,
+        default="fail-fast",
+        help="When a step fails: stop its scenario, continue with the next step, "
+             "or retry it with backoff (default: %(default)s)"
+    )
+    
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=Config.STEP_RETRIES,
+        help="Extra attempts per failed step with --on-failure retry (default: %(default)s)"
+    )
+    
+    parser.add_argument(
+        "--retry-backoff",
+        type=float,
+        default=Config.STEP_RETRY_BACKOFF,
+        help="Seconds before the first retry, doubled after each attempt (default: %(default)s)"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip the scenario steps that passed in the last run (from the checkpoint file)"
+    )
+    
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run all steps of the selected scenarios in one pytest session in this process"
     )
     
     parser.add_argument(
@@ -408,8 +1013,61 @@ Examples:
         help="Generate HTML report"
     )
     
+    parser.add_argument(
+        "--local-server",
+        action="store_true",
+        help="Run against the bundled Pulse stand-in app (one instance shared by all steps)"
+    )
+    
+    parser.add_argument(
+        "--local-latency-ms",
+        type=int,
+        default=Config.LOCAL_SERVER_LATENCY_MS,
+        help="Artificial API latency of the stand-in app (default: %(default)s)"
+    )
+    
+    parser.add_argument(
+        "--profile-sleeps",
+        action="store_true",
+        help="Print idle seconds (time.sleep and implicit-wait misses) per call site after each pytest run"
+    )
+    
+    parser.add_argument(
+        "--browser-profile",
+        choices=BROWSER_PROFILES,
+        help="Chrome profile for every step: standard (visible) or performance "
+             f"(headless, lightweight) (default: {Config.BROWSER_PROFILE})"
+    )
+    
+    parser.add_argument(
+        "--coordinator",
+        action="store_true",
+        help="Serve the selected scenarios/workflow to --worker processes instead of running them here"
+    )
+    
+    parser.add_argument(
+        "--bind",
+        default=f"127.0.0.1:{Config.COORDINATOR_PORT}",
+        help="HOST:PORT the coordinator listens on (default: %(default)s)"
+    )
+    
+    parser.add_argument(
+        "--worker",
+        metavar="COORDINATOR_URL",
+        help="Run steps handed out by the coordinator at COORDINATOR_URL (--workers sets concurrency)"
+    )
+    
     args = parser.parse_args()
     
+    if args.coordinator:
+        # Workers run each step once, in its own pytest process, in dependency order
+        if args.in_process:
+            parser.error("--coordinator cannot be combined with --in-process")
+        if args.resume:
+            parser.error("--coordinator cannot be combined with --resume")
+        if args.on_failure != "fail-fast":
+            parser.error("--coordinator only supports --on-failure fail-fast")
+    
     # Handle list commands
     if args.list_scenarios:
         print_scenarios()
@@ -424,9 +1082,62 @@ Examples:
         print_workflows()
         return 0
     
+    # Inherited by every pytest subprocess (see --profile-sleeps in conftest.py)
+    if args.profile_sleeps:
+        os.environ["PULSE_PROFILE_SLEEPS"] = "1"
+    if args.browser_profile:
+        os.environ["PULSE_BROWSER_PROFILE"] = args.browser_profile
+        Config.BROWSER_PROFILE = args.browser_profile
+    
+    # One stand-in app for the whole run, so every step sees the same RFIs
+    local_server = None
+    if args.local_server:
+        local_server = StubPulseServer(latency_ms=args.local_latency_ms).start()
+        os.environ["PULSE_BASE_URL"] = local_server.url
+        # Step subprocesses then seed RFIs and use the stand-in's detail routes
+        # (config.py keys both off PULSE_TARGET=local), like pytest --local-server
+        os.environ["PULSE_TARGET"] = "local"
+        # --in-process runs pytest here, where Config was already imported
+        Config.BASE_URL = local_server.url
+        Config.SEED_RFIS = os.environ.get("PULSE_SEED_RFIS", "1") == "1"
+        Config.RFI_DETAIL_PATH = Config.RFI_DETAIL_PATH or "/rfis"
+        Config.INSPECTION_DETAIL_PATH = Config.INSPECTION_DETAIL_PATH or "/inspections"
+    try:
+        return run_selected(args)
+    finally:
+        if local_server is not None:
+            local_server.stop()
+
+
+def run_selected(args):
+    """Run the scenarios or workflow selected on the command line."""
+    if args.worker:
+        return run_worker(args.worker, max(1, args.workers))
+    
     # Handle scenario execution (PARENT COMMAND)
-    if args.scenario:
-        return run_scenario(args.scenario, args.html_report)
+    scenario_names = list(SCENARIOS.keys()) if args.all_scenarios else args.scenario
+    if args.coordinator:
+        unknown = [name for name in scenario_names or [] if name not in SCENARIOS]
+        if unknown:
+            print(f"❌ Error: Scenario(s) not found: {', '.join(unknown)}")
+            return 1
+        if not scenario_names and not (args.role in WORKFLOWS_BY_ROLE
+                                       and args.workflow in WORKFLOWS_BY_ROLE[args.role]):
+            print("❌ Error: --coordinator needs --scenario/--all-scenarios or a valid --role with --workflow")
+            return 1
+        return run_coordinator(args, scenario_names)
+    
+    if scenario_names:
+        if args.in_process:
+            if args.workers > 1:
+                print("⚠️  --in-process runs steps one after another; --workers is ignored")
+            if args.resume or args.on_failure != "fail-fast":
+                print("⚠️  --in-process stops a scenario at its first failed step; --on-failure/--resume are ignored")
+            return run_scenarios_in_process(scenario_names, args.html_report)
+        policy = failure_policy(args.on_failure, max(0, args.retries), args.retry_backoff)
+        if len(scenario_names) == 1 and args.workers <= 1:
+            return run_scenario(scenario_names[0], args.html_report, policy, args.resume)
+        return run_scenarios_parallel(scenario_names, max(1, args.workers), args.html_report, policy, args.resume)
     
     # Handle individual workflow execution
     if args.role and args.workflow:
@@ -0,0 +1,13 @@
+"""Local stand-in for the Pulse web app.
+
+Lets the suite run offline and without backend latency:
+
+    python -m stub_server --port 8765 --latency-ms 50
+    PULSE_TARGET=local pytest
+
+or start it inside the pytest process with `pytest --local-server`.
+"""
+
+from stub_server.server import StubPulseServer
+
+__all__ = ["StubPulseServer"]
@@ -0,0 +1,26 @@
+import argparse
+
+from config.config import Config
+from stub_server.server import StubPulseServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the local Pulse stand-in app")
+    parser.add_argument("--host", default=Config.LOCAL_SERVER_HOST, help="Interface to bind (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=Config.LOCAL_SERVER_PORT, help="Port (default: %(default)s)")
+    parser.add_argument("--latency-ms", type=int, default=Config.LOCAL_SERVER_LATENCY_MS,
+                        help="Artificial delay added to every API response (default: %(default)s)")
+    parser.add_argument("--no-seed", action="store_true", help="Start without sample RFIs")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    parser.add_argument("--allow-reset", action="store_true",
+                        help="Let logged-in sessions wipe the data with POST /api/reset")
+    args = parser.parse_args()
+
+    StubPulseServer(
+        host=args.host, port=args.port, latency_ms=args.latency_ms,
+        seed=not args.no_seed, verbose=args.verbose, allow_reset=args.allow_reset,
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
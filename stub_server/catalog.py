@@ -0,0 +1,95 @@
+"""Master data served by the stand-in app's option API.
+
+Mirrors the cascade of the Create RFI form: each field's options depend on the
+value chosen in its parent field (plot -> block -> package -> ...). The values
+used by CreateRfiPage.fill_form are all present.
+"""
+
+TRACKER_CHECKPOINT = (
+    "If Tracker: Tracker Alignment, Tightening & Torquing up to Torque Tube incl. Transmission Shaft "
+    "If Fixed Tilt: Fixed Tilt Alignment, Tightening & Torquing up to bracing, perlin and all asembly parts"
+)
+
+BLOCKS = {
+    "S05a": ["BL01", "BL02", "BL03"],
+    "S05b": ["BL04", "BL05", "BL06"],
+    "S06": ["BL07", "BL08"],
+}
+
+PACKAGES = ["Civil", "Electrical", "Mechanical"]
+
+SUBPACKAGES = {
+    "Civil": ["MMS Installation", "Piling", "Fencing"],
+    "Electrical": ["DC Cabling", "Inverter Installation"],
+    "Mechanical": ["Module Mounting"],
+}
+
+ACTIVITIES = {
+    "MMS Installation": ["MMS Installation", "MMS Alignment"],
+}
+
+SUBACTIVITIES = {
+    "MMS Installation": ["MMS Installation", "Torque Marking"],
+}
+
+CHECKPOINTS = [TRACKER_CHECKPOINT, "Visual inspection of installed structure"]
+
+CHECKLISTS = [
+    "PV Module Mounting Structure Installation Protocol - Tracker",
+    "PV Module Mounting Structure Installation Protocol - Fixed Tilt",
+]
+
+UNITS = ["MTR", "NOS", "SQM", "CUM"]
+
+# Rows x tables per block, e.g. R01-T01 .. R12-T24 (hundreds of options)
+LOCATION_ROWS = 12
+LOCATION_TABLES = 24
+
+QUESTIONS = [
+    "Are all fasteners installed and torque marked?",
+    "Is the drive post installed within tolerance?",
+    "Is the slew drive seat installed at the correct angle?",
+    "Is the post seat installed with grounding cable?",
+    "Are the slew drives aligned with the motor facing south?",
+    "Is the correct torque tube installed and aligned?",
+    "Are purlins secured with torque marks and gaskets?",
+    "Is the transmission shaft assembly installed correctly?",
+    "Are tube covers placed on both ends?",
+    "Are grounding cables installed at both ends and control box?",
+    "Are AI controller box accessories installed and routed?",
+    "Are the communication box and wind sensor installed?",
+]
+
+
+def options_for(field, parent=None):
+    """Return the option labels for `field` given the value chosen in its parent field.
+
+    Returns None for an unknown field.
+    """
+    if field == "plot":
+        return list(BLOCKS)
+    if field == "block":
+        return BLOCKS.get(parent, [])
+    if field == "package":
+        return list(PACKAGES) if parent else []
+    if field == "subpackage":
+        return SUBPACKAGES.get(parent, [])
+    if field == "activity":
+        return ACTIVITIES.get(parent, [f"{parent} Work"] if parent else [])
+    if field == "subactivity":
+        return SUBACTIVITIES.get(parent, [parent] if parent else [])
+    if field == "location":
+        if not parent:
+            return []
+        return [
+            f"R{row:02d}-T{table:02d}"
+            for row in range(1, LOCATION_ROWS + 1)
+            for table in range(1, LOCATION_TABLES + 1)
+        ]
+    if field == "unit":
+        return list(UNITS)
+    if field == "checkpoint":
+        return list(CHECKPOINTS) if parent else []
+    if field == "checklist":
+        return list(CHECKLISTS) if parent else []
+    return None
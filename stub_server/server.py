@@ -0,0 +1,410 @@
+import json
+import mimetypes
+import os
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from config.test_data import TestData
+from stub_server import catalog
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+SESSION_COOKIE = "pulse_session"
+
+# RFI lifecycle: contractor submits -> block engineer reviews -> quality inspects
+# -> quality gives final approval. The block engineer's final approval is a
+# separate flag on reviewed RFIs.
+PENDING_REVIEW = "pending_review"
+CHANGES_REQUESTED = "changes_requested"
+PENDING_INSPECTION = "pending_inspection"
+INSPECTION_FAILED = "inspection_failed"
+INSPECTED = "inspected"
+CLOSED = "closed"
+
+# List views shown by the review/approval/inspection screens
+VIEWS = {
+    "pending_review": lambda rfi: rfi["status"] == PENDING_REVIEW,
+    "approved": lambda rfi: rfi["status"] in (PENDING_INSPECTION, INSPECTED, CLOSED) and not rfi["be_approved"],
+    "pending_inspection": lambda rfi: rfi["status"] == PENDING_INSPECTION,
+    "inspected": lambda rfi: rfi["status"] == INSPECTED,
+}
+
+# action -> (required status, new status, success message)
+ACTIONS = {
+    "review": (PENDING_REVIEW, None, "Review submitted successfully"),
+    "approve": (None, None, "RFI approved successfully"),
+    "inspect": (PENDING_INSPECTION, None, "Inspection completed successfully"),
+    "close": (INSPECTED, CLOSED, "RFI closed successfully"),
+}
+
+DEFAULT_FIELDS = {
+    "plot": "S05b",
+    "block": "BL05",
+    "package": "Civil",
+    "subpackage": "MMS Installation",
+    "activity": "MMS Installation",
+    "subactivity": "MMS Installation",
+    "location": ["R01-T01", "R01-T02"],
+    "quantity": "25",
+    "unit": "MTR",
+    "subcontractor": "TechBuild Contractors Pvt Ltd",
+    "checkpoint": catalog.TRACKER_CHECKPOINT,
+    "checklist": catalog.CHECKLISTS[0],
+}
+
+
+class PulseState:
+    """In-memory users, sessions and RFIs of the stand-in app (thread-safe)."""
+
+    def __init__(self, seed=True):
+        self._lock = threading.Lock()
+        self.users = {creds["username"]: dict(creds, role=role) for role, creds in TestData.ROLES.items()}
+        self.sessions = {}
+        self.rfis = {}
+        self._next_id = 1
+        if seed:
+            self.seed()
+
+    def seed(self, per_view=3):
+        """Create `per_view` RFIs for every list view so role flows can run standalone."""
+        for _ in range(per_view):
+            self.create_rfi(DEFAULT_FIELDS, [], 0, "seed")
+            self.update_rfi(self.create_rfi(DEFAULT_FIELDS, [], 0, "seed")["id"], status=PENDING_INSPECTION)
+            self.update_rfi(self.create_rfi(DEFAULT_FIELDS, [], 0, "seed")["id"], status=INSPECTED)
+
+    def reset(self, seed=True):
+        with self._lock:
+            self.rfis.clear()
+            self._next_id = 1
+        if seed:
+            self.seed()
+
+    # -----------------------------------------------------
+    # AUTH
+    # -----------------------------------------------------
+    def login(self, username, password):
+        """Return a new session token, or None for bad credentials."""
+        user = self.users.get(username)
+        if not user or user["password"] != password:
+            return None
+        token = secrets.token_hex(16)
+        with self._lock:
+            self.sessions[token] = username
+        return token
+
+    def user_for(self, token):
+        with self._lock:
+            username = self.sessions.get(token)
+        if username is None:
+            return None
+        user = self.users[username]
+        return {"username": username, "role": user["role"]}
+
+    def logout(self, token):
+        with self._lock:
+            self.sessions.pop(token, None)
+
+    # -----------------------------------------------------
+    # RFIs
+    # -----------------------------------------------------
+    def create_rfi(self, fields, observations, photos, created_by):
+        with self._lock:
+            rfi_id = f"RFI-{self._next_id:04d}"
+            self._next_id += 1
+            rfi = {
+                "id": rfi_id,
+                "status": PENDING_REVIEW,
+                "be_approved": False,
+                "created_by": created_by,
+                "created_at": time.time(),
+                "fields": dict(fields),
+                "observations": list(observations),
+                "photos": photos,
+                "history": [],
+            }
+            self.rfis[rfi_id] = rfi
+            return dict(rfi)
+
+    def update_rfi(self, rfi_id, **changes):
+        with self._lock:
+            self.rfis[rfi_id].update(changes)
+
+    def get_rfi(self, rfi_id):
+        with self._lock:
+            rfi = self.rfis.get(rfi_id)
+            return dict(rfi) if rfi else None
+
+    def list_rfis(self, view=None, query=None):
+        """RFIs in a list view, newest first, optionally filtered by id/subcontractor substring."""
+        matches = VIEWS.get(view, lambda rfi: True)
+        query = (query or "").lower()
+        with self._lock:
+            rfis = [dict(rfi) for rfi in self.rfis.values() if matches(rfi)]
+        if query:
+            rfis = [
+                rfi for rfi in rfis
+                if query in rfi["id"].lower() or query in rfi["fields"].get("subcontractor", "").lower()
+            ]
+        return rfis[::-1]
+
+    def apply_action(self, rfi_id, action, payload, user):
+        """Advance an RFI through its lifecycle. Returns (http status, body)."""
+        required, new_status, message = ACTIONS[action]
+        with self._lock:
+            rfi = self.rfis.get(rfi_id)
+            if rfi is None:
+                return 404, {"error": f"{rfi_id} not found"}
+            if required and rfi["status"] != required:
+                return 409, {"error": f"{rfi_id} is {rfi['status']}, expected {required}"}
+
+            if action == "review":
+                approved = payload.get("decision") == "approve"
+                new_status = PENDING_INSPECTION if approved else CHANGES_REQUESTED
+            elif action == "approve":
+                if rfi["be_approved"] or rfi["status"] not in (PENDING_INSPECTION, INSPECTED, CLOSED):
+                    return 409, {"error": f"{rfi_id} cannot be approved in status {rfi['status']}"}
+                rfi["be_approved"] = True
+            elif action == "inspect":
+                new_status = INSPECTED if payload.get("result") == "pass" else INSPECTION_FAILED
+
+            if new_status:
+                rfi["status"] = new_status
+            rfi["history"].append({
+                "action": action,
+                "by": user["username"],
+                "at": time.time(),
+                "payload": payload,
+            })
+            return 200, {"rfi": dict(rfi), "message": message}
+
+
+class PulseRequestHandler(BaseHTTPRequestHandler):
+    """Serves the SPA shell, its static assets and the JSON API."""
+
+    server_version = "PulseStandIn/1.0"
+
+    # -----------------------------------------------------
+    # PLUMBING
+    # -----------------------------------------------------
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _json(self, status, payload, headers=None):
+        self._send(status, json.dumps(payload).encode("utf-8"), headers=headers)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _token(self):
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            name, _, value = part.strip().partition("=")
+            if name == SESSION_COOKIE:
+                return value
+        return None
+
+    def _current_user(self):
+        token = self._token()
+        return self.state.user_for(token) if token else None
+
+    def _simulate_latency(self):
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000.0)
+
+    # -----------------------------------------------------
+    # ROUTING
+    # -----------------------------------------------------
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path.startswith("/api/"):
+            self._simulate_latency()
+            self._api_get(url.path, parse_qs(url.query))
+        elif url.path.startswith("/static/"):
+            self._static(url.path[len("/static/"):])
+        elif url.path == "/favicon.ico":
+            self._send(204, content_type="image/x-icon")
+        else:
+            # Client-side routes (/login, /welcome, /rfis/..., /inspections/...)
+            self._static("index.html")
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if not url.path.startswith("/api/"):
+            self._json(404, {"error": "not found"})
+            return
+        self._simulate_latency()
+        self._api_post(url.path, self._body())
+
+    def _static(self, name):
+        path = os.path.normpath(os.path.join(STATIC_DIR, name))
+        try:
+            # commonpath, not startswith: "static-old/..." must not pass for "static"
+            inside = os.path.commonpath([path, STATIC_DIR]) == STATIC_DIR
+        except ValueError:  # different drives
+            inside = False
+        if not inside or not os.path.isfile(path):
+            self._send(404, b"not found", "text/plain")
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        self._send(200, body, f"{content_type}; charset=utf-8")
+
+    def _api_get(self, path, query):
+        parts = path.strip("/").split("/")[1:]
+        if parts == ["health"]:
+            self._json(200, {"status": "ok"})
+            return
+
+        user = self._current_user()
+        if user is None:
+            self._json(401, {"error": "not authenticated"})
+            return
+
+        if parts == ["session"]:
+            self._json(200, user)
+        elif len(parts) == 2 and parts[0] == "options":
+            options = catalog.options_for(parts[1], query.get("parent", [None])[0])
+            if options is None:
+                self._json(404, {"error": f"unknown field {parts[1]}"})
+            else:
+                self._json(200, {"field": parts[1], "options": options})
+        elif parts == ["questions"]:
+            self._json(200, {"questions": catalog.QUESTIONS})
+        elif parts == ["rfis"]:
+            rfis = self.state.list_rfis(query.get("view", [None])[0], query.get("q", [None])[0])
+            self._json(200, {"rfis": rfis})
+        elif len(parts) == 2 and parts[0] == "rfis":
+            rfi = self.state.get_rfi(parts[1])
+            self._json(200 if rfi else 404, {"rfi": rfi} if rfi else {"error": f"{parts[1]} not found"})
+        else:
+            self._json(404, {"error": "not found"})
+
+    def _api_post(self, path, body):
+        parts = path.strip("/").split("/")[1:]
+        if parts == ["login"]:
+            token = self.state.login(body.get("username"), body.get("password"))
+            if token is None:
+                self._json(401, {"error": "Invalid email or password"})
+                return
+            user = self.state.user_for(token)
+            cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"
+            self._json(200, user, headers={"Set-Cookie": cookie})
+            return
+        user = self._current_user()
+        if user is None:
+            self._json(401, {"error": "not authenticated"})
+            return
+
+        if parts == ["reset"]:
+            # Wipes every RFI, so only on servers started with allow_reset
+            if not self.server.allow_reset:
+                self._json(404, {"error": "not found"})
+                return
+            self.state.reset(seed=body.get("seed", True))
+            self._json(200, {"status": "reset"})
+        elif parts == ["logout"]:
+            self.state.logout(self._token())
+            self._json(200, {"status": "logged out"},
+                       headers={"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+        elif parts == ["rfis"]:
+            observations = body.get("observations") or []
+            if len(observations) < len(catalog.QUESTIONS) or not all(o.strip() for o in observations):
+                self._json(400, {"error": "Answer all the questions"})
+                return
+            rfi = self.state.create_rfi(body.get("fields") or {}, observations, body.get("photos", 0), user["username"])
+            self._json(201, {"rfi": rfi, "message": f"RFI {rfi['id']} submitted successfully"})
+        elif len(parts) == 3 and parts[0] == "rfis" and parts[2] in ACTIONS:
+            status, payload = self.state.apply_action(parts[1], parts[2], body, user)
+            self._json(status, payload)
+        else:
+            self._json(404, {"error": "not found"})
+
+
+class StubPulseServer:
+    """Local stand-in for the Pulse app, served from a background thread.
+
+    Serves the login page, the /welcome Create RFI stepper, the inspection
+    checklist and the review / inspection / final-approval screens with the same
+    DOM contracts the page objects rely on, backed by an in-memory JSON API.
+    `latency_ms` delays every API response to model backend latency.
+    POST /api/reset (logged-in sessions only) exists only with `allow_reset`;
+    in-process callers can use `server.state.reset()` instead.
+
+    Usage:
+        server = StubPulseServer(latency_ms=50).start()
+        Config.BASE_URL = server.url
+        ...
+        server.stop()
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, seed=True, verbose=False, allow_reset=False):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.allow_reset = allow_reset
+        self.state = PulseState(seed=seed)
+        self.verbose = verbose
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), PulseRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = self.state
+        self._httpd.latency_ms = self.latency_ms
+        self._httpd.allow_reset = self.allow_reset
+        self._httpd.verbose = self.verbose
+        # Port 0 picks a free port
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="pulse-stand-in", daemon=True)
+        self._thread.start()
+        print(f"[STUB] Pulse stand-in serving {self.url} (latency {self.latency_ms} ms)")
+        return self
+
+    def serve_forever(self):
+        """Run in the foreground until interrupted (used by `python -m stub_server`)."""
+        self.start()
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            print("[STUB] Pulse stand-in stopped")
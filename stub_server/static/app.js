@@ -0,0 +1,882 @@
+/*
+ * Pulse stand-in app: a dependency-free single page app that reproduces the
+ * DOM contracts the page objects rely on (Ark-style data-scope/data-part
+ * attributes, label-relative form fields, dialog roles, table rows).
+ */
+(function () {
+    'use strict';
+
+    // -----------------------------------------------------
+    // DOM HELPERS
+    // -----------------------------------------------------
+    function h(tag, attrs, ...children) {
+        const node = document.createElement(tag);
+        Object.entries(attrs || {}).forEach(([key, value]) => {
+            if (value === null || value === undefined || value === false) return;
+            if (key.startsWith('on')) node.addEventListener(key.slice(2), value);
+            else if (key === 'value') node.value = value;
+            else node.setAttribute(key, value === true ? '' : value);
+        });
+        children.flat(Infinity).forEach((child) => {
+            if (child === null || child === undefined || child === false) return;
+            node.appendChild(child instanceof Node ? child : document.createTextNode(String(child)));
+        });
+        return node;
+    }
+
+    const SVG_NS = 'http://www.w3.org/2000/svg';
+    const SQUARE = 'M5 3h14a2 2 0 0 1 2 2v14a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2z';
+    const ICONS = {
+        'square-plus': [SQUARE, 'M8 12h8', 'M12 8v8'],
+        'square-minus': [SQUARE, 'M8 12h8'],
+        'camera': [
+            'M14.5 4h-5L7 7H4a2 2 0 0 0-2 2v9a2 2 0 0 0 2 2h16a2 2 0 0 0 2-2V9a2 2 0 0 0-2-2h-3l-2.5-3z',
+            'M12 17a4 4 0 1 0 0-8 4 4 0 0 0 0 8z',
+        ],
+    };
+
+    function icon(name) {
+        const svg = document.createElementNS(SVG_NS, 'svg');
+        svg.setAttribute('class', `lucide lucide-${name}`);
+        svg.setAttribute('viewBox', '0 0 24 24');
+        svg.setAttribute('width', '18');
+        svg.setAttribute('height', '18');
+        svg.setAttribute('fill', 'none');
+        svg.setAttribute('stroke', 'currentColor');
+        svg.setAttribute('stroke-width', '2');
+        ICONS[name].forEach((d) => {
+            const path = document.createElementNS(SVG_NS, 'path');
+            path.setAttribute('d', d);
+            svg.appendChild(path);
+        });
+        return svg;
+    }
+
+    function toast(message) {
+        const node = h('div', {class: 'toast', role: 'status'}, message);
+        document.body.appendChild(node);
+        setTimeout(() => node.remove(), 6000);
+    }
+
+    function showError(node, message) {
+        node.textContent = message;
+        node.hidden = false;
+    }
+
+    function confirmDialog(message, confirmLabel, confirmAttrs) {
+        const overlay = h('div', {class: 'overlay'},
+            h('div', {'data-scope': 'dialog', role: 'dialog', 'aria-modal': 'true', class: 'dialog'},
+                h('p', {class: 'dialog__title'}, message),
+                h('div', {class: 'dialog__actions'},
+                    h('button', {
+                        type: 'button', 'data-part': 'close-trigger', class: 'button button--variant_outline',
+                        onclick: () => overlay.remove(),
+                    }, 'Cancel'),
+                    h('button', Object.assign({class: 'button button--variant_gradient'}, confirmAttrs), confirmLabel))));
+        return overlay;
+    }
+
+    // -----------------------------------------------------
+    // API + ROUTING
+    // -----------------------------------------------------
+    const state = {user: null};
+
+    async function api(path, options = {}) {
+        const init = {method: options.method || 'GET', credentials: 'same-origin', headers: {}};
+        if (options.body !== undefined) {
+            init.headers['Content-Type'] = 'application/json';
+            init.body = JSON.stringify(options.body);
+        }
+        const response = await fetch(path, init);
+        let data = {};
+        try {
+            data = await response.json();
+        } catch (e) {
+            // empty body
+        }
+        if (response.status === 401 && !options.allowUnauthorized) {
+            state.user = null;
+            go('/login', true);
+            throw new Error('not authenticated');
+        }
+        return {ok: response.ok, status: response.status, data};
+    }
+
+    function go(path, replace) {
+        if (replace) history.replaceState({}, '', path);
+        else history.pushState({}, '', path);
+        render();
+    }
+
+    let renderSeq = 0;
+
+    async function render() {
+        const seq = ++renderSeq;
+        closeDropdown();
+        document.querySelectorAll('body > .overlay, body > .toast').forEach((node) => node.remove());
+
+        const path = location.pathname.replace(/\/+$/, '') || '/';
+        const root = document.getElementById('app');
+        if (path === '/login') {
+            root.replaceChildren(loginPage());
+            return;
+        }
+        if (!state.user) {
+            const {ok, data} = await api('/api/session', {allowUnauthorized: true});
+            if (seq !== renderSeq) return;
+            if (!ok) {
+                go('/login', true);
+                return;
+            }
+            state.user = data;
+        }
+
+        let match;
+        let page;
+        if (path === '/' || path === '/welcome') page = welcomePage();
+        else if (path === '/rfis') page = listPage(LISTS.rfis);
+        else if ((match = path.match(/^\/rfis\/([^/]+)$/))) page = detailPage(LISTS.rfis, decodeURIComponent(match[1]));
+        else if (path === '/inspections') page = listPage(LISTS.inspections);
+        else if ((match = path.match(/^\/inspections\/([^/]+)$/))) page = detailPage(LISTS.inspections, decodeURIComponent(match[1]));
+        else page = h('p', {class: 'not-found'}, 'Page not found');
+        root.replaceChildren(shell(page));
+    }
+
+    window.addEventListener('popstate', render);
+    document.addEventListener('click', (event) => {
+        const link = event.target.closest && event.target.closest('a[data-link]');
+        if (!link || event.defaultPrevented || event.button !== 0 || event.metaKey || event.ctrlKey) return;
+        event.preventDefault();
+        go(link.getAttribute('href'));
+    });
+
+    // -----------------------------------------------------
+    // LOGIN
+    // -----------------------------------------------------
+    function loginPage() {
+        const username = h('input', {
+            id: ':r1:', name: 'email', type: 'email', class: 'input',
+            placeholder: 'Enter your email', autocomplete: 'username',
+        });
+        const password = h('input', {
+            id: ':r2:', name: 'password', type: 'password', class: 'input',
+            placeholder: 'Enter your password', autocomplete: 'current-password',
+        });
+        const error = h('p', {class: 'error-message', hidden: true});
+        const card = h('div', {class: 'login__card'});
+
+        const submit = async () => {
+            error.hidden = true;
+            password.classList.remove('ring-c_destructive.9');
+            const spinner = h('div', {class: 'loading-spinner'});
+            card.appendChild(spinner);
+            const {ok, data} = await api('/api/login', {
+                method: 'POST',
+                body: {username: username.value.trim(), password: password.value},
+                allowUnauthorized: true,
+            });
+            spinner.remove();
+            if (!ok) {
+                showError(error, data.error || 'Login failed');
+                password.classList.add('ring-c_destructive.9');
+                return;
+            }
+            state.user = data;
+            localStorage.setItem('pulse_user', JSON.stringify(data));
+            go('/welcome');
+        };
+        password.addEventListener('keydown', (event) => {
+            if (event.key === 'Enter') submit();
+        });
+
+        card.append(
+            h('h1', {class: 'login__title'}, 'Pulse'),
+            h('p', {class: 'login__subtitle'}, 'Project Lifecycle Platform'),
+            h('label', {class: 'field__label', for: ':r1:'}, 'Email'),
+            username,
+            h('label', {class: 'field__label', for: ':r2:'}, 'Password'),
+            password,
+            error,
+            h('button', {type: 'button', class: 'button button--variant_gradient', onclick: submit}, 'Login'),
+        );
+        return h('div', {class: 'login'}, card);
+    }
+
+    // -----------------------------------------------------
+    // LAYOUT
+    // -----------------------------------------------------
+    function shell(page) {
+        const logout = async () => {
+            await api('/api/logout', {method: 'POST', allowUnauthorized: true});
+            state.user = null;
+            localStorage.removeItem('pulse_user');
+            go('/login');
+        };
+        return h('div', {class: 'layout'},
+            h('header', {class: 'topbar'},
+                h('span', {class: 'topbar__brand'}, 'AGEL Pulse'),
+                h('nav', {class: 'topbar__nav'},
+                    h('a', {href: '/welcome', 'data-link': true}, 'Home'),
+                    h('a', {href: '/rfis', 'data-link': true}, 'RFI Requests'),
+                    h('a', {href: '/inspections', 'data-link': true}, 'Inspection')),
+                h('span', {class: 'topbar__user'}, `${state.user.username} (${state.user.role})`),
+                h('button', {type: 'button', class: 'button button--variant_ghost', onclick: logout}, 'Logout')),
+            h('main', {class: 'main'}, page));
+    }
+
+    function welcomePage() {
+        const host = h('div', {class: 'welcome__form'});
+        return h('section', {class: 'welcome'},
+            h('div', {class: 'welcome__header'},
+                h('h1', {}, `Welcome, ${state.user.username}`),
+                h('button', {
+                    type: 'button', class: 'button button--variant_gradient',
+                    onclick: () => host.replaceChildren(createRfiStepper()),
+                }, 'Create RFI')),
+            host);
+    }
+
+    // -----------------------------------------------------
+    // DROPDOWNS (Ark-style select: trigger + positioned content + items)
+    // -----------------------------------------------------
+    let dropdown = null;
+
+    function closeDropdown() {
+        if (!dropdown) return;
+        const current = dropdown;
+        dropdown = null;
+        current.positioner.remove();
+        current.anchor.setAttribute('data-state', 'closed');
+        current.anchor.setAttribute('aria-expanded', 'false');
+        if (current.onClose) current.onClose();
+    }
+
+    async function openDropdown({anchor, field, parent, multi, selected, onPick, onClose}) {
+        closeDropdown();
+        const content = h('div', {
+            'data-scope': 'select', 'data-part': 'content', 'data-state': 'open', role: 'listbox',
+            'aria-multiselectable': multi ? 'true' : null, class: 'select__content',
+        }, h('div', {class: 'select__loading'}, 'Loading options...'));
+        const positioner = h('div', {'data-part': 'positioner', class: 'select__positioner'}, content);
+        const rect = anchor.getBoundingClientRect();
+        positioner.style.left = `${rect.left + window.scrollX}px`;
+        positioner.style.top = `${rect.bottom + window.scrollY + 4}px`;
+        positioner.style.minWidth = `${rect.width}px`;
+        document.body.appendChild(positioner);
+        anchor.setAttribute('data-state', 'open');
+        anchor.setAttribute('aria-expanded', 'true');
+        const current = dropdown = {anchor, positioner, content, onClose};
+
+        const {ok, data} = await api(`/api/options/${field}?parent=${encodeURIComponent(parent || '')}`);
+        if (dropdown !== current) return;
+
+        let chosen = [...selected];
+        const items = (ok ? data.options : []).map((option) => {
+            const item = h('div', {
+                'data-part': 'item', 'data-value': option, role: 'option', class: 'select__item',
+                onclick: () => {
+                    if (!multi) {
+                        onPick(option);
+                        closeDropdown();
+                        return;
+                    }
+                    chosen = chosen.includes(option) ? chosen.filter((o) => o !== option) : [...chosen, option];
+                    markItem(item, chosen.includes(option));
+                    onPick(chosen);
+                },
+            }, h('span', {class: 'select__item-text'}, option));
+            markItem(item, chosen.includes(option));
+            return item;
+        });
+        content.replaceChildren(...(items.length ? items : [h('div', {class: 'select__empty'}, 'No options')]));
+    }
+
+    function markItem(item, checked) {
+        item.setAttribute('data-state', checked ? 'checked' : 'unchecked');
+        item.setAttribute('aria-selected', String(checked));
+    }
+
+    document.addEventListener('click', (event) => {
+        if (!dropdown) return;
+        if (dropdown.content.contains(event.target) || dropdown.anchor.contains(event.target)) return;
+        closeDropdown();
+    });
+    document.addEventListener('keydown', (event) => {
+        if (event.key === 'Escape') closeDropdown();
+    });
+
+    // -----------------------------------------------------
+    // CREATE RFI STEPPER
+    // -----------------------------------------------------
+    // `after`: field that must be filled before this one is enabled (and whose
+    // change clears it); `parent`: field whose value scopes the options
+    // (defaults to `after`); `text`: free-text input with this placeholder
+    const FIELDS = [
+        {key: 'plot', label: 'Plot No. *'},
+        {key: 'block', label: 'Block No. *', after: 'plot'},
+        {key: 'package', label: 'Package *', after: 'block'},
+        {key: 'subpackage', label: 'Sub-Package *', after: 'package'},
+        {key: 'activity', label: 'Activity *', after: 'subpackage'},
+        {key: 'subactivity', label: 'Sub-Activity *', after: 'activity'},
+        {key: 'location', label: 'Location *', after: 'subactivity', parent: 'block', multi: true},
+        {key: 'quantity', label: 'Quantity *', after: 'location', text: 'Enter Quantity'},
+        {key: 'unit', label: 'Unit of Measurement *'},
+        {key: 'subcontractor', label: 'Sub Contractor *', text: 'Enter sub contractor name'},
+        {key: 'checkpoint', label: 'Inspection Checkpoint *', after: 'subactivity'},
+        {key: 'checklist', label: 'Inspection Checklist *', after: 'checkpoint'},
+    ];
+
+    const hasValue = (value) => Array.isArray(value) ? value.length > 0 : !!(value && String(value).trim());
+    const plainLabel = (field) => field.label.replace(/\s*\*$/, '');
+
+    function createRfiStepper() {
+        const form = {values: {}, photos: {}, questions: null, confirm: null};
+        const controls = {};
+        const indicators = ['RFI Details', 'Inspection Checklist'].map((title, i) =>
+            h('div', {class: 'steps__item', 'data-state': i === 0 ? 'current' : 'upcoming'},
+                h('span', {class: 'steps__number'}, String(i + 1)), h('span', {class: 'steps__label'}, title)));
+        const content = h('form', {
+            id: 'rfi-form', class: 'steps__content h_full ov_auto', novalidate: true,
+            onsubmit: (event) => {
+                event.preventDefault();
+                submitRfi();
+            },
+        });
+
+        let detailsView = null;
+        let page2View = null;
+
+        function show(view, step) {
+            indicators.forEach((node, i) => node.setAttribute(
+                'data-state', i < step ? 'complete' : i === step ? 'current' : 'upcoming'));
+            content.replaceChildren(view);
+            content.scrollTop = 0;
+        }
+
+        // ---------- step 1: RFI details ----------
+        function setValue(field, value) {
+            const wasFilled = hasValue(form.values[field.key]);
+            form.values[field.key] = value;
+            if (!field.multi || wasFilled !== hasValue(value)) clearDependents(field.key);
+            refresh();
+        }
+
+        function clearDependents(key) {
+            FIELDS.filter((f) => f.after === key || f.parent === key).forEach((f) => {
+                delete form.values[f.key];
+                if (f.text) controls[f.key].value = '';
+                clearDependents(f.key);
+            });
+        }
+
+        function refresh() {
+            FIELDS.forEach((field) => {
+                const control = controls[field.key];
+                control.disabled = !!field.after && !hasValue(form.values[field.after]);
+                if (field.text) return;
+                const value = form.values[field.key];
+                if (field.multi) {
+                    control.value = (value || []).join(', ');
+                } else {
+                    control.textContent = value || `Select ${plainLabel(field)}`;
+                    control.toggleAttribute('data-placeholder-shown', !value);
+                }
+            });
+        }
+
+        function buildField(field) {
+            let control;
+            if (field.text) {
+                control = h('input', {
+                    type: 'text', class: 'input', name: field.key, placeholder: field.text,
+                    oninput: () => { form.values[field.key] = control.value.trim(); },
+                });
+            } else {
+                const open = () => openDropdown({
+                    anchor: control,
+                    field: field.key,
+                    parent: form.values[field.parent || field.after],
+                    multi: !!field.multi,
+                    selected: [].concat(form.values[field.key] || []),
+                    onPick: (value) => setValue(field, value),
+                });
+                control = field.multi
+                    ? h('input', {type: 'text', class: 'input', name: field.key, placeholder: 'Select Location', readonly: true, onclick: open})
+                    : h('button', {
+                        type: 'button', class: 'select__trigger', 'data-scope': 'select', 'data-part': 'trigger',
+                        'data-field': field.key, 'aria-haspopup': 'listbox', onclick: open,
+                    });
+            }
+            controls[field.key] = control;
+            return h('div', {class: 'field'},
+                h('label', {class: 'field__label'}, h('span', {}, field.label)),
+                h('div', {class: 'field__control'}, control));
+        }
+
+        function buildDetails() {
+            const error = h('div', {class: 'form-error', hidden: true});
+            const view = h('div', {class: 'rfi-details'},
+                h('h2', {class: 'steps__title'}, 'RFI Details'),
+                h('div', {class: 'form-grid'}, FIELDS.map(buildField)),
+                error,
+                h('div', {class: 'steps__footer'},
+                    h('button', {
+                        type: 'button', class: 'button button--variant_gradient',
+                        onclick: () => {
+                            const missing = FIELDS.filter((f) => !hasValue(form.values[f.key])).map(plainLabel);
+                            if (missing.length) {
+                                showError(error, `Please fill: ${missing.join(', ')}`);
+                                return;
+                            }
+                            error.hidden = true;
+                            form.questions = form.questions || api('/api/questions').then(({data}) => data.questions);
+                            show(buildPage1(), 1);
+                        },
+                    }, 'Proceed')));
+            refresh();
+            return view;
+        }
+
+        // ---------- step 2: inspection checklist ----------
+        function checklistHeader(page) {
+            return h('div', {class: 'checklist__header'},
+                h('p', {class: 'checklist__title'}, 'Inspection Checklist'),
+                h('p', {class: 'checklist__page'}, `Page ${page}/2`));
+        }
+
+        function footer(onBack, label, onNext) {
+            return h('div', {class: 'steps__footer'},
+                h('button', {type: 'button', class: 'button button--variant_outline steps__prev-trigger', onclick: onBack}, 'Back'),
+                h('button', {type: 'button', class: 'button button--variant_gradient', onclick: onNext}, label));
+        }
+
+        function buildPage1() {
+            const summary = FIELDS.map((field) => [
+                h('dt', {}, plainLabel(field)),
+                h('dd', {}, [].concat(form.values[field.key]).join(', ')),
+            ]);
+            return h('div', {class: 'checklist'},
+                checklistHeader(1),
+                h('dl', {class: 'summary'}, summary),
+                footer(() => show(detailsView, 0), 'Proceed', async (event) => {
+                    event.currentTarget.disabled = true;
+                    const questions = await form.questions;
+                    page2View = page2View || buildPage2(questions);
+                    show(page2View, 1);
+                }));
+        }
+
+        function buildPage2(questions) {
+            const error = h('div', {class: 'form-error', hidden: true});
+            const sections = questions.map((question, index) => buildQuestion(question, index + 1));
+            const setAll = (open) => sections.forEach((s) => s.setAttribute('data-state', open ? 'open' : 'closed'));
+            const inputs = () => sections.map((s) => s.querySelector('input[name^="observation-"]'));
+
+            return h('div', {class: 'checklist'},
+                checklistHeader(2),
+                h('div', {class: 'checklist__toolbar'},
+                    h('p', {class: 'checklist__hint'}, 'Answer all the questions'),
+                    h('button', {
+                        type: 'button', class: 'button button--variant_ghost button--size_xs',
+                        'aria-label': 'Expand all', onclick: () => setAll(true),
+                    }, icon('square-plus')),
+                    h('button', {
+                        type: 'button', class: 'button button--variant_ghost button--size_icon',
+                        'aria-label': 'Collapse all', onclick: () => setAll(false),
+                    }, icon('square-minus'))),
+                sections,
+                error,
+                footer(() => show(buildPage1(), 1), 'Submit', () => {
+                    const unanswered = inputs().map((input, i) => (input.value.trim() ? null : i + 1)).filter(Boolean);
+                    if (unanswered.length) {
+                        showError(error, `Observation missing for question(s) ${unanswered.join(', ')}`);
+                        sections[unanswered[0] - 1].setAttribute('data-state', 'open');
+                        return;
+                    }
+                    error.hidden = true;
+                    if (form.confirm && form.confirm.isConnected) return;
+                    form.observations = inputs().map((input) => input.value.trim());
+                    form.confirm = confirmDialog('Are you sure you want to Submit RFI?', 'Submit', {type: 'submit', form: 'rfi-form'});
+                    document.body.appendChild(form.confirm);
+                }));
+        }
+
+        function buildQuestion(question, number) {
+            const photo = h('span', {class: 'question__photo'});
+            const section = h('div', {'data-scope': 'collapsible', 'data-part': 'root', 'data-state': 'closed', class: 'question'},
+                h('button', {
+                    type: 'button', 'data-part': 'trigger', class: 'collapsible__trigger',
+                    onclick: () => section.setAttribute('data-state', section.getAttribute('data-state') === 'open' ? 'closed' : 'open'),
+                }, h('span', {}, `${number}. ${question}`)),
+                h('div', {class: 'collapsible__content'},
+                    h('div', {class: 'question__field'},
+                        h('label', {}, 'Observation/Measured Value'),
+                        h('input', {type: 'text', class: 'input', name: `observation-${number}`, placeholder: 'Enter observation'})),
+                    h('div', {class: 'question__media'},
+                        h('div', {
+                            class: 'cursor_pointer',
+                            onclick: () => openCamera((size) => {
+                                form.photos[number] = size;
+                                photo.textContent = 'Photo captured';
+                            }),
+                        }, icon('camera'), h('p', {}, 'Use Camera')),
+                        photo)));
+            return section;
+        }
+
+        async function submitRfi() {
+            const dialog = form.confirm;
+            if (!dialog || !dialog.isConnected) return;  // implicit submission outside the confirm dialog
+            dialog.querySelector('button[type="submit"]').disabled = true;
+            const {ok, data} = await api('/api/rfis', {
+                method: 'POST',
+                body: {fields: form.values, observations: form.observations, photos: Object.keys(form.photos).length},
+            });
+            dialog.remove();
+            form.confirm = null;
+            if (!ok) {
+                toast(data.error || 'Could not submit RFI');
+                return;
+            }
+            toast(data.message);
+            indicators.forEach((node) => node.setAttribute('data-state', 'complete'));
+            content.replaceChildren(h('div', {class: 'steps__done'},
+                h('h2', {}, data.rfi.id),
+                h('span', {}, 'Sent to the block engineer for review')));
+        }
+
+        detailsView = buildDetails();
+        show(detailsView, 0);
+        return h('div', {class: 'steps', 'data-scope': 'steps'}, h('div', {class: 'steps__list'}, indicators), content);
+    }
+
+    // -----------------------------------------------------
+    // CAMERA
+    // -----------------------------------------------------
+    // Uses the (fake) camera when available; otherwise a canvas-generated
+    // stream, so capture works in headless browsers without media devices.
+    function syntheticStream() {
+        const canvas = h('canvas', {width: 320, height: 240});
+        const ctx = canvas.getContext('2d');
+        let frame = 0;
+        const draw = () => {
+            ctx.fillStyle = `hsl(${(frame++ * 7) % 360}, 60%, 45%)`;
+            ctx.fillRect(0, 0, 320, 240);
+            ctx.fillStyle = '#fff';
+            ctx.fillText(new Date().toISOString(), 12, 120);
+        };
+        draw();
+        const timer = setInterval(draw, 66);
+        const stream = canvas.captureStream(15);
+        return {stream, stop: () => clearInterval(timer)};
+    }
+
+    async function openCamera(onCaptured) {
+        const video = h('video', {autoplay: true, muted: true, playsinline: true, class: 'camera__video'});
+        video.muted = true;
+        let source = null;
+
+        const close = () => {
+            if (source) {
+                source.stream.getTracks().forEach((track) => track.stop());
+                if (source.stop) source.stop();
+            }
+            overlay.remove();
+        };
+        const capture = () => {
+            const canvas = h('canvas', {width: video.videoWidth || 320, height: video.videoHeight || 240});
+            canvas.getContext('2d').drawImage(video, 0, 0, canvas.width, canvas.height);
+            onCaptured(canvas.toDataURL('image/jpeg', 0.6).length);
+            close();
+        };
+        const overlay = h('div', {class: 'overlay'},
+            h('div', {class: 'camera', role: 'dialog', 'aria-label': 'Camera'},
+                video,
+                h('div', {class: 'camera__actions'},
+                    h('button', {type: 'button', class: 'button button--variant_outline', onclick: close}, 'Cancel'),
+                    h('button', {type: 'button', class: 'button button--variant_gradient', onclick: capture}, 'Capture'))));
+        document.body.appendChild(overlay);
+
+        try {
+            source = {stream: await navigator.mediaDevices.getUserMedia({video: true, audio: false})};
+        } catch (e) {
+            source = syntheticStream();
+        }
+        if (!overlay.isConnected) {
+            close();
+            return;
+        }
+        video.srcObject = source.stream;
+        video.play().catch(() => {});
+    }
+
+    // -----------------------------------------------------
+    // RFI LISTS (review / approval / inspection queues)
+    // -----------------------------------------------------
+    const LISTS = {
+        rfis: {
+            path: '/rfis',
+            title: 'RFI Requests',
+            tabs: [['pending_review', 'Pending Review'], ['approved', 'Approved']],
+        },
+        inspections: {
+            path: '/inspections',
+            title: 'Quality Inspection',
+            tabs: [['pending_inspection', 'Pending Inspection'], ['inspected', 'Inspected']],
+        },
+    };
+
+    const STATUS_LABELS = {
+        pending_review: 'Pending Review',
+        changes_requested: 'Changes Requested',
+        pending_inspection: 'Pending Inspection',
+        inspection_failed: 'Inspection Failed',
+        inspected: 'Inspected',
+        closed: 'Closed',
+    };
+
+    function listPage(list) {
+        const params = new URLSearchParams(location.search);
+        let view = params.get('view') || list.tabs[0][0];
+        let query = params.get('q') || '';
+        let seq = 0;
+        let searchTimer = null;
+
+        const tbody = h('tbody');
+        const tabs = list.tabs.map(([key, label]) => h('button', {
+            type: 'button', role: 'tab', class: 'tabs__trigger', 'data-view': key,
+            onclick: () => {
+                view = key;
+                load();
+            },
+        }, label));
+        const search = h('input', {
+            type: 'search', class: 'input search', placeholder: 'Search RFI', value: query,
+            oninput: () => {
+                clearTimeout(searchTimer);
+                searchTimer = setTimeout(() => {
+                    query = search.value.trim();
+                    load();
+                }, 150);
+            },
+        });
+
+        async function load() {
+            const mine = ++seq;
+            tabs.forEach((tab) => {
+                const active = tab.getAttribute('data-view') === view;
+                tab.setAttribute('data-state', active ? 'active' : 'inactive');
+                tab.setAttribute('aria-selected', String(active));
+            });
+            // Drop the previous rows right away so nobody clicks a stale row
+            tbody.replaceChildren(h('tr', {class: 'table-loading'}, h('td', {colspan: 6}, 'Loading...')));
+            const filters = new URLSearchParams({view});
+            if (query) filters.set('q', query);
+            history.replaceState({}, '', `${list.path}?${filters}`);
+
+            const {data} = await api(`/api/rfis?${filters}`);
+            if (mine !== seq) return;
+            const rows = data.rfis.map((rfi) => h('tr', {
+                class: 'table-row', 'data-testid': 'rfi-row', 'data-rfi-id': rfi.id,
+                onclick: () => go(`${list.path}/${encodeURIComponent(rfi.id)}`),
+            },
+                h('td', {}, rfi.id),
+                h('td', {}, `${rfi.fields.plot || ''} / ${rfi.fields.block || ''}`),
+                h('td', {}, rfi.fields.subactivity || ''),
+                h('td', {}, rfi.fields.subcontractor || ''),
+                h('td', {}, [].concat(rfi.fields.location || []).length),
+                h('td', {}, h('span', {class: `badge badge--${rfi.status}`}, STATUS_LABELS[rfi.status]))));
+            tbody.replaceChildren(...(rows.length ? rows : [
+                h('tr', {class: 'table-empty'}, h('td', {colspan: 6}, 'No RFIs found')),
+            ]));
+        }
+
+        load();
+        return h('section', {class: 'rfi-list'},
+            h('h1', {}, list.title),
+            h('div', {class: 'rfi-list__toolbar'}, h('div', {class: 'tabs', role: 'tablist'}, tabs), search),
+            h('table', {class: 'table'},
+                h('thead', {}, h('tr', {},
+                    ['RFI No.', 'Plot / Block', 'Sub-Activity', 'Sub Contractor', 'Locations', 'Status'].map((t) => h('th', {}, t)))),
+                tbody));
+    }
+
+    // -----------------------------------------------------
+    // RFI DETAIL + ACTION PANELS
+    // -----------------------------------------------------
+    const SUMMARY_FIELDS = FIELDS.filter((f) => f.key !== 'checkpoint');
+    const QUALITY_CHECKS = [
+        ['quality_alignment', 'Alignment within tolerance'],
+        ['quality_torque', 'Torque marks verified'],
+        ['quality_grounding', 'Grounding continuity checked'],
+        ['quality_documents', 'Documentation reviewed'],
+    ];
+
+    function detailPage(list, id) {
+        const body = h('div', {class: 'rfi-detail__body'}, 'Loading...');
+        api(`/api/rfis/${encodeURIComponent(id)}`).then(({ok, data}) => {
+            body.replaceChildren(...(ok ? detailContent(list, data.rfi) : [h('p', {class: 'form-error'}, `${id} not found`)]));
+        });
+        return h('section', {class: 'rfi-detail'},
+            h('a', {href: list.path, 'data-link': true, class: 'rfi-detail__back'}, '← Back'),
+            body);
+    }
+
+    function detailContent(list, rfi) {
+        const observations = h('div', {class: 'rfi-observations', hidden: true},
+            h('table', {class: 'table'}, h('tbody', {},
+                rfi.observations.map((text, i) => h('tr', {}, h('td', {}, `Q${i + 1}`), h('td', {}, text))))));
+        return [
+            h('div', {class: 'rfi-detail__header'},
+                h('h2', {}, rfi.id),
+                h('span', {class: `badge badge--${rfi.status}`}, STATUS_LABELS[rfi.status])),
+            h('dl', {class: 'summary'}, SUMMARY_FIELDS.map((field) => [
+                h('dt', {}, plainLabel(field)),
+                h('dd', {}, [].concat(rfi.fields[field.key] || []).join(', ')),
+            ])),
+            h('button', {
+                type: 'button', class: 'button button--variant_outline',
+                onclick: () => { observations.hidden = !observations.hidden; },
+            }, 'View Details'),
+            observations,
+            actionPanel(list, rfi),
+        ];
+    }
+
+    function actionPanel(list, rfi) {
+        const role = state.user.role;
+        if (list === LISTS.rfis && (role === 'block_engineer' || role === 'admin')) {
+            if (rfi.status === 'pending_review') return reviewPanel(rfi);
+            if (['pending_inspection', 'inspected', 'closed'].includes(rfi.status) && !rfi.be_approved) return approvalPanel(rfi);
+        }
+        if (list === LISTS.inspections && (role === 'quality_inspector' || role === 'admin')) {
+            if (rfi.status === 'pending_inspection') return inspectionPanel(rfi);
+            if (rfi.status === 'inspected') return closePanel(rfi);
+        }
+        return null;
+    }
+
+    async function runAction(rfi, action, payload, panel, error) {
+        const {ok, data} = await api(`/api/rfis/${encodeURIComponent(rfi.id)}/${action}`, {method: 'POST', body: payload});
+        if (!ok) {
+            panel.querySelectorAll('.overlay').forEach((node) => node.remove());
+            showError(error, data.error || 'Request failed');
+            return;
+        }
+        panel.replaceChildren(h('p', {class: 'toast toast--inline', role: 'status'}, data.message));
+    }
+
+    function reviewPanel(rfi) {
+        let decision = null;
+        const error = h('div', {class: 'form-error', hidden: true});
+        const comments = h('textarea', {name: 'comments', class: 'textarea', rows: 4, placeholder: 'Enter review comments'});
+        const decisions = [['approve', 'Approve'], ['request_changes', 'Request Changes']].map(([value, label]) =>
+            h('button', {
+                type: 'button', class: 'button button--variant_outline', 'data-decision': value,
+                onclick: () => {
+                    decision = value;
+                    decisions.forEach((b) => b.setAttribute('data-state', b.getAttribute('data-decision') === value ? 'on' : 'off'));
+                },
+            }, label));
+        const panel = h('form', {
+            class: 'panel',
+            onsubmit: (event) => {
+                event.preventDefault();
+                if (!decision) {
+                    showError(error, 'Choose a review decision first');
+                    return;
+                }
+                runAction(rfi, 'review', {decision, comments: comments.value}, panel, error);
+            },
+        },
+            h('h3', {}, 'Review'),
+            comments,
+            h('div', {class: 'panel__decision'}, decisions),
+            error,
+            h('button', {type: 'submit', class: 'button button--variant_gradient'}, 'Submit Review'));
+        return panel;
+    }
+
+    // Shared by the block engineer's approval and the quality team's closure:
+    // notes + "Final Approve" button opening a confirm dialog inside the form
+    function finalPanel(rfi, {title, name, placeholder, action, question, confirmLabel}) {
+        const error = h('div', {class: 'form-error', hidden: true});
+        const notes = h('textarea', {name, class: 'textarea', rows: 4, placeholder});
+        const panel = h('form', {
+            class: 'panel',
+            onsubmit: (event) => {
+                event.preventDefault();
+                runAction(rfi, action, {[name]: notes.value}, panel, error);
+            },
+        },
+            h('h3', {}, title),
+            notes,
+            error,
+            h('button', {
+                type: 'button', class: 'button button--variant_gradient',
+                onclick: () => {
+                    if (!panel.querySelector('.overlay')) panel.appendChild(confirmDialog(question, confirmLabel, {type: 'submit'}));
+                },
+            }, 'Final Approve'));
+        return panel;
+    }
+
+    function approvalPanel(rfi) {
+        return finalPanel(rfi, {
+            title: 'Block Engineer Sign-off', name: 'notes', placeholder: 'Enter approval notes', action: 'approve',
+            question: `Give final approval to ${rfi.id}?`, confirmLabel: 'Confirm Approval',
+        });
+    }
+
+    function closePanel(rfi) {
+        return finalPanel(rfi, {
+            title: 'Quality Sign-off', name: 'remarks', placeholder: 'Enter final remarks', action: 'close',
+            question: `Close ${rfi.id} after inspection?`, confirmLabel: 'Confirm',
+        });
+    }
+
+    function inspectionPanel(rfi) {
+        const error = h('div', {class: 'form-error', hidden: true});
+        const findings = h('textarea', {name: 'findings', class: 'textarea', rows: 4, placeholder: 'Enter inspection findings'});
+        const panel = h('form', {
+            class: 'panel', hidden: true,
+            onsubmit: (event) => {
+                event.preventDefault();
+                const result = panel.querySelector('input[name="result"]:checked');
+                if (!result) {
+                    showError(error, 'Mark the inspection as Pass or Fail');
+                    return;
+                }
+                if (panel.querySelector('.overlay')) return;
+                const checks = Array.from(panel.querySelectorAll('input[type="checkbox"]:checked')).map((c) => c.name);
+                panel.appendChild(confirmDialog(`Submit inspection result for ${rfi.id}?`, 'Confirm', {
+                    type: 'button',
+                    onclick: (e) => {
+                        e.currentTarget.disabled = true;
+                        runAction(rfi, 'inspect', {result: result.value, findings: findings.value, checks}, wrapper, error);
+                    },
+                }));
+            },
+        },
+            h('h3', {}, 'Quality Checklist'),
+            h('fieldset', {class: 'panel__checks'},
+                QUALITY_CHECKS.map(([name, label]) => h('label', {class: 'check'}, h('input', {type: 'checkbox', name}), label))),
+            findings,
+            h('div', {class: 'panel__result', role: 'radiogroup'},
+                h('label', {class: 'check'}, h('input', {type: 'radio', name: 'result', value: 'pass'}), 'Pass'),
+                h('label', {class: 'check'}, h('input', {type: 'radio', name: 'result', value: 'fail'}), 'Fail')),
+            error,
+            h('button', {type: 'submit', class: 'button button--variant_gradient'}, 'Submit Inspection'));
+        const start = h('button', {
+            type: 'button', class: 'button button--variant_gradient',
+            onclick: () => {
+                start.hidden = true;
+                panel.hidden = false;
+            },
+        }, 'Start Inspection');
+        const wrapper = h('div', {class: 'panel-wrapper'}, start, panel);
+        return wrapper;
+    }
+
+    render();
+})();
@@ -6,7 +6,7 @@ from pages.block_engineer.approve_rfi_page import ApproveRfiPage
 class TestApproveRfi:
     """Block Engineer - RFI Final Approval Tests"""
 
-    def test_approve_rfi_workflow(self, block_engineer_driver, base_url):
+    def test_approve_rfi_workflow(self, block_engineer_driver, base_url, rfi_pending_approval):
         """Test: Block Engineer gives final approval to RFI
         
         Workflow:
@@ -26,7 +26,8 @@ class TestApproveRfi:
         
         # Complete approval workflow
         approve_page.approve_rfi(
-            notes="All requirements met. Quality standards verified. Final approval granted."
+            notes="All requirements met. Quality standards verified. Final approval granted.",
+            handle=rfi_pending_approval
         )
         
         # Verify success
@@ -34,7 +35,7 @@ class TestApproveRfi:
         print("✅ RFI Final Approval Granted Successfully")
         print("="*60)
 
-    def test_approve_rfi_with_conditions(self, block_engineer_driver, base_url):
+    def test_approve_rfi_with_conditions(self, block_engineer_driver, base_url, rfi_pending_approval):
         """Test: Block Engineer approves RFI with conditions
         
         Workflow:
@@ -53,7 +54,8 @@ class TestApproveRfi:
         
         # Complete approval with conditions
         approve_page.approve_rfi(
-            notes="Approved with conditions: Monitor progress for next 2 weeks and submit progress report."
+            notes="Approved with conditions: Monitor progress for next 2 weeks and submit progress report.",
+            handle=rfi_pending_approval
         )
         
         # Verify success
@@ -6,7 +6,7 @@ from pages.block_engineer.review_rfi_page import ReviewRfiPage
 class TestReviewRfi:
     """Block Engineer - RFI Review Tests"""
 
-    def test_review_rfi_workflow(self, block_engineer_driver, base_url):
+    def test_review_rfi_workflow(self, block_engineer_driver, base_url, rfi_pending_review):
         """Test: Block Engineer reviews and approves RFI submission
         
         Workflow:
@@ -27,7 +27,8 @@ class TestReviewRfi:
         # Complete review workflow
         review_page.review_rfi(
             comments="Reviewed all documentation and inspection checklist. Everything meets the requirements.",
-            approve=True
+            approve=True,
+            handle=rfi_pending_review
         )
         
         # Verify success
@@ -35,7 +36,7 @@ class TestReviewRfi:
         print("✅ RFI Reviewed and Approved Successfully")
         print("="*60)
 
-    def test_review_rfi_request_changes(self, block_engineer_driver, base_url):
+    def test_review_rfi_request_changes(self, block_engineer_driver, base_url, rfi_pending_review):
         """Test: Block Engineer requests changes to RFI
         
         Workflow:
@@ -56,7 +57,8 @@ class TestReviewRfi:
         # Complete review workflow with changes requested
         review_page.review_rfi(
             comments="Issues found: Missing documentation in sections 3 and 5. Please resubmit after corrections.",
-            approve=False
+            approve=False,
+            handle=rfi_pending_review
         )
         
         # Verify success
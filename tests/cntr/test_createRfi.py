@@ -2,12 +2,13 @@ import pytest
 from selenium.webdriver.common.by import By
 from pages.cntr.createRfi_page import CreateRfiPage
 from pages.cntr.inspectionChecklist_page import InspectionChecklistPage
-import time
+from utils.rfi_handle import save_handle
 
 
 @pytest.mark.rfi
 @pytest.mark.smoke
 class TestCreateRfi:
+    @pytest.mark.camera
     def test_create_rfi_complete(self, contractor_driver, base_url):
         """Test: Fill all RFI fields, submit, and complete inspection checklist."""
         try:
@@ -15,12 +16,13 @@ class TestCreateRfi:
             print("\n🔷 STEP 1: Filling RFI form...")
             rfi_page = CreateRfiPage(contractor_driver)
             rfi_page.navigate()
-            rfi_page.create_rfi()
+            handle = rfi_page.create_rfi()
 
             print("\n✅ RFI form filled and Proceed clicked - now on Inspection Checklist page.")
             
             # Step 2: Wait for transition to Inspection Checklist page
-            time.sleep(2)
+            checklist_page = InspectionChecklistPage(contractor_driver)
+            checklist_page.wait_for_form_visible()
             
             # Debug: Check current page state
             print("\n🔍 DEBUG: Checking page state...")
@@ -32,26 +34,23 @@ class TestCreateRfi:
             
             # Step 3: Complete Inspection Checklist and submit
             print("\n🔷 STEP 2: Starting Inspection Checklist workflow...")
-            checklist_page = InspectionChecklistPage(contractor_driver)
             # Set capture_photos=True to enable camera capture for each question
             # Set capture_photos=False to skip camera (faster testing)
-            checklist_page.complete_inspection_checklist(capture_photos=True)
+            checklist_page.complete_inspection_checklist(capture_photos=True, handle=handle)
             
             # Verify final success
             assert checklist_page.is_element_visible(InspectionChecklistPage.SUCCESS_TOAST), \
                 "Inspection checklist not submitted or success message missing."
+            # Later scenario steps open this RFI instead of the first one in their list
+            save_handle(handle)
             
             print("\n✅ Complete RFI workflow finished (RFI + Inspection Checklist).")
             
         except Exception as e:
             print(f"\n❌ TEST FAILED: {str(e)}")
-            # Take screenshot on failure
-            try:
-                contractor_driver.save_screenshot("test_failure.png")
-                print("📸 Screenshot saved as test_failure.png")
-            except:
-                pass
+            # Screenshot, DOM and console are saved by the failure hook (conftest.py)
             raise
+    @pytest.mark.camera
     def test_contractor_incharge_workflow(self, contractor_incharge_driver, base_url):
         """
         Test Workflow for Contractor Incharge:
@@ -67,10 +66,9 @@ class TestCreateRfi:
             print("\n🔷 STEP 1: Filling RFI form...")
             rfi_page = CreateRfiPage(driver)
             rfi_page.navigate()
-            rfi_page.create_rfi()
+            handle = rfi_page.create_rfi()
             
             print("\n✅ RFI form submitted. Transitioning to Inspection Checklist...")
-            time.sleep(2) # Wait for transition
             
             # Step 2: Inspection Checklist
             print("\n🔷 STEP 2: Filling Inspection Checklist...")
@@ -80,19 +78,16 @@ class TestCreateRfi:
             assert checklist_page.is_element_visible(InspectionChecklistPage.FORM_TITLE), "Not on Inspection Checklist page"
             
             # Complete checklist with camera (optional, set to False for speed if needed)
-            checklist_page.complete_inspection_checklist(capture_photos=True)
+            checklist_page.complete_inspection_checklist(capture_photos=True, handle=handle)
             
             # Verify final success
             assert checklist_page.is_element_visible(InspectionChecklistPage.SUCCESS_TOAST), \
                 "Workflow failed: Success message not found."
+            save_handle(handle)
                 
             print("\n✅ Contractor Incharge Workflow COMPLETED successfully.")
             
         except Exception as e:
             print(f"\n❌ WORKFLOW FAILED: {str(e)}")
-            try:
-                driver.save_screenshot("errors/cntr_incharge_failure.png")
-                print("📸 Screenshot saved as errors/cntr_incharge_failure.png")
-            except:
-                pass
+            # Screenshot, DOM and console are saved by the failure hook (conftest.py)
             raise
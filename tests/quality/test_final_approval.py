@@ -6,7 +6,7 @@ from pages.quality.final_approval_page import FinalApprovalPage
 class TestFinalApproval:
     """Quality Inspector - Final Approval Tests"""
 
-    def test_final_approval_workflow(self, quality_inspector_driver, base_url):
+    def test_final_approval_workflow(self, quality_inspector_driver, base_url, rfi_inspected):
         """Test: Quality Inspector gives final approval and closes RFI
         
         Workflow:
@@ -26,7 +26,8 @@ class TestFinalApproval:
         
         # Complete final approval workflow
         final_approval_page.give_final_approval(
-            remarks="Quality inspection passed. All requirements met. RFI closed successfully."
+            remarks="Quality inspection passed. All requirements met. RFI closed successfully.",
+            handle=rfi_inspected
         )
         
         # Verify success
@@ -34,7 +35,7 @@ class TestFinalApproval:
         print("✅ Final Approval Granted & RFI Closed")
         print("="*60)
 
-    def test_final_approval_with_recommendations(self, quality_inspector_driver, base_url):
+    def test_final_approval_with_recommendations(self, quality_inspector_driver, base_url, rfi_inspected):
         """Test: Quality Inspector gives final approval with recommendations
         
         Workflow:
@@ -53,7 +54,8 @@ class TestFinalApproval:
         
         # Final approval with recommendations
         final_approval_page.give_final_approval(
-            remarks="Approved with recommendations: Consider implementing preventive measures for future similar work."
+            remarks="Approved with recommendations: Consider implementing preventive measures for future similar work.",
+            handle=rfi_inspected
         )
         
         # Verify success
@@ -61,7 +63,7 @@ class TestFinalApproval:
         print("✅ Final Approval with Recommendations Granted")
         print("="*60)
 
-    def test_final_approval_detailed_report(self, quality_inspector_driver, base_url):
+    def test_final_approval_detailed_report(self, quality_inspector_driver, base_url, rfi_inspected):
         """Test: Quality Inspector gives final approval with detailed report
         
         Workflow:
@@ -96,7 +98,8 @@ class TestFinalApproval:
         """
         
         final_approval_page.give_final_approval(
-            remarks=detailed_report.strip()
+            remarks=detailed_report.strip(),
+            handle=rfi_inspected
         )
         
         # Verify success
@@ -6,7 +6,7 @@ from pages.quality.inspect_rfi_page import InspectRfiPage
 class TestInspectRfi:
     """Quality Inspector - RFI Inspection Tests"""
 
-    def test_inspect_rfi_pass_workflow(self, quality_inspector_driver, base_url):
+    def test_inspect_rfi_pass_workflow(self, quality_inspector_driver, base_url, rfi_pending_inspection):
         """Test: Quality Inspector performs inspection and marks as PASS
         
         Workflow:
@@ -28,7 +28,8 @@ class TestInspectRfi:
         # Complete inspection workflow
         inspect_page.perform_inspection(
             findings="All quality standards met. Materials verified. Workmanship excellent.",
-            passed=True
+            passed=True,
+            handle=rfi_pending_inspection
         )
         
         # Verify success
@@ -36,7 +37,7 @@ class TestInspectRfi:
         print("✅ RFI Inspection Completed - PASSED")
         print("="*60)
 
-    def test_inspect_rfi_fail_workflow(self, quality_inspector_driver, base_url):
+    def test_inspect_rfi_fail_workflow(self, quality_inspector_driver, base_url, rfi_pending_inspection):
         """Test: Quality Inspector performs inspection and marks as FAIL
         
         Workflow:
@@ -58,7 +59,8 @@ class TestInspectRfi:
         # Complete inspection workflow with failure
         inspect_page.perform_inspection(
             findings="Quality issues found: Material does not meet specifications. Rework required.",
-            passed=False
+            passed=False,
+            handle=rfi_pending_inspection
         )
         
         # Verify success
@@ -66,7 +68,7 @@ class TestInspectRfi:
         print("✅ RFI Inspection Completed - FAILED (Rework Required)")
         print("="*60)
 
-    def test_inspect_rfi_with_detailed_findings(self, quality_inspector_driver, base_url):
+    def test_inspect_rfi_with_detailed_findings(self, quality_inspector_driver, base_url, rfi_pending_inspection):
         """Test: Quality Inspector performs detailed inspection
         
         Workflow:
@@ -101,7 +103,8 @@ class TestInspectRfi:
         
         inspect_page.perform_inspection(
             findings=detailed_findings.strip(),
-            passed=True
+            passed=True,
+            handle=rfi_pending_inspection
         )
         
         # Verify success
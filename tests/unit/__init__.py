@@ -0,0 +1 @@
+# Framework helper tests (no browser)
@@ -0,0 +1,79 @@
+import pytest
+
+from benchmarks.harness import compare, percentile, summarize
+
+
+def report(**flows):
+    """report(create_rfi=(p50, p95, commands)) -> a report dict as saved by the harness."""
+    return {"flows": {name: {"wall": {"p50": p50, "p95": p95}, "commands": {"mean": commands}}
+                      for name, (p50, p95, commands) in flows.items()}}
+
+
+def row(rows, metric):
+    return next(r for r in rows if r["metric"] == metric)
+
+
+@pytest.mark.unit
+class TestPercentile:
+    """percentile / summarize - interpolated statistics"""
+
+    def test_interpolates_between_ranks(self):
+        values = [4.0, 1.0, 3.0, 2.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile(values, 95) == pytest.approx(3.85)
+
+    def test_single_and_empty_inputs(self):
+        assert percentile([7.0], 99) == 7.0
+        assert percentile([], 50) is None
+        assert summarize([]) is None
+
+    def test_summarize(self):
+        stats = summarize([1.0, 2.0, 3.0])
+        assert stats["mean"] == 2.0 and stats["min"] == 1.0 and stats["max"] == 3.0
+        assert stats["p50"] == 2.0
+
+
+@pytest.mark.unit
+class TestCompare:
+    """compare - regression threshold against a baseline"""
+
+    def test_change_above_threshold_regresses(self):
+        rows = compare(report(create_rfi=(1.2, 2.0, 100)), report(create_rfi=(1.0, 2.0, 100)), threshold=0.10)
+
+        p50 = row(rows, "wall.p50")
+        assert p50["change"] == pytest.approx(0.20)
+        assert p50["regressed"]
+        assert not row(rows, "wall.p95")["regressed"]
+
+    def test_change_within_threshold_is_ok(self):
+        rows = compare(report(create_rfi=(1.05, 2.0, 109)), report(create_rfi=(1.0, 2.0, 100)), threshold=0.10)
+
+        assert not any(r["regressed"] for r in rows)
+
+    def test_exactly_at_threshold_is_ok(self):
+        rows = compare(report(create_rfi=(1.0, 2.0, 125)), report(create_rfi=(1.0, 2.0, 100)), threshold=0.25)
+
+        assert not row(rows, "commands.mean")["regressed"]
+
+    def test_threshold_is_configurable(self):
+        current, baseline = report(create_rfi=(1.2, 2.0, 100)), report(create_rfi=(1.0, 2.0, 100))
+
+        assert row(compare(current, baseline, threshold=0.10), "wall.p50")["regressed"]
+        assert not row(compare(current, baseline, threshold=0.30), "wall.p50")["regressed"]
+
+    def test_improvement_never_regresses(self):
+        rows = compare(report(create_rfi=(0.5, 1.0, 50)), report(create_rfi=(1.0, 2.0, 100)))
+
+        assert all(r["change"] < 0 and not r["regressed"] for r in rows)
+
+    def test_flows_or_metrics_missing_from_the_baseline_are_skipped(self):
+        current = report(create_rfi=(1.0, 2.0, 100), login=(0.5, 0.6, 20))
+        baseline = report(create_rfi=(1.0, 2.0, 0))
+        # A flow that failed every iteration has no statistics
+        current["flows"]["create_rfi"]["wall"] = None
+
+        rows = compare(current, baseline)
+
+        assert rows == []
@@ -0,0 +1,110 @@
+import json
+import os
+
+import pytest
+
+import run_tests
+from config.config import Config
+from utils.checkpoint import ScenarioCheckpoint
+from utils.rfi_handle import HANDLE_FILE_ENV, RfiHandle, load_handle, save_handle
+
+STEPS = ["contractor:rfi", "block_engineer:review_rfi", "quality_inspector:inspect_rfi"]
+
+
+@pytest.mark.unit
+class TestScenarioCheckpoint:
+    """ScenarioCheckpoint - saved steps and handles"""
+
+    def test_completed_steps_survive_a_reload(self, tmp_path):
+        path = str(tmp_path / "rfi_complete.json")
+        checkpoint = ScenarioCheckpoint.load(path, STEPS)
+        checkpoint.mark_completed(1, RfiHandle("AT-1"))
+        checkpoint.mark_completed(2, RfiHandle("AT-1", rfi_id="RFI-7"))
+
+        resumed = ScenarioCheckpoint.load(path, STEPS)
+
+        assert resumed.is_completed(1) and resumed.is_completed(2)
+        assert not resumed.is_completed(3)
+        assert resumed.last_handle()["rfi_id"] == "RFI-7"
+
+    def test_checkpoint_for_other_steps_is_ignored(self, tmp_path):
+        path = str(tmp_path / "rfi_complete.json")
+        ScenarioCheckpoint.load(path, STEPS).mark_completed(1)
+
+        edited = ScenarioCheckpoint.load(path, STEPS[:2])
+
+        assert edited.completed == {}
+
+    def test_clear_removes_the_file(self, tmp_path):
+        path = str(tmp_path / "rfi_complete.json")
+        checkpoint = ScenarioCheckpoint.load(path, STEPS)
+        checkpoint.mark_completed(1)
+
+        checkpoint.clear()
+
+        assert not os.path.exists(path)
+        assert ScenarioCheckpoint.load(path, STEPS).completed == {}
+
+
+@pytest.mark.unit
+class TestScenarioResume:
+    """run_scenario --resume - completed steps are skipped"""
+
+    @pytest.fixture
+    def pytest_runs(self, tmp_path, monkeypatch):
+        """Replaces the pytest subprocess; records the workflow each step runs."""
+        monkeypatch.setattr(Config, "CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+        monkeypatch.setattr(Config, "RFI_HANDLE_DIR", str(tmp_path / "handles"))
+        workflows = {tuple(workflow["pytest_args"]): f"{role}:{name}"
+                     for role, by_name in run_tests.WORKFLOWS_BY_ROLE.items()
+                     for name, workflow in by_name.items()}
+        runs = {"steps": [], "handles": [], "failing": set()}
+
+        def fake_run_tests(pytest_args, env=None):
+            step = workflows[tuple(pytest_args)]
+            handle_file = env[HANDLE_FILE_ENV]
+            runs["steps"].append(step)
+            runs["handles"].append(load_handle(handle_file))
+            if step == "contractor:rfi":
+                save_handle(RfiHandle("AT-RESUME", rfi_id="RFI-42"), handle_file)
+            return 1 if step in runs["failing"] else 0
+
+        monkeypatch.setattr(run_tests, "run_tests", fake_run_tests)
+        return runs
+
+    def test_resume_skips_completed_steps(self, pytest_runs):
+        pytest_runs["failing"].add("quality_inspector:inspect_rfi")
+        assert run_tests.run_scenario("rfi_complete") == 1
+        assert pytest_runs["steps"] == ["contractor:rfi", "block_engineer:review_rfi", "quality_inspector:inspect_rfi"]
+
+        pytest_runs["steps"].clear()
+        pytest_runs["handles"].clear()
+        pytest_runs["failing"].clear()
+        assert run_tests.run_scenario("rfi_complete", resume=True) == 0
+
+        assert pytest_runs["steps"] == ["quality_inspector:inspect_rfi", "quality_inspector:final_approval"]
+        # The resumed steps work on the RFI the skipped contractor step created
+        assert [handle.rfi_id for handle in pytest_runs["handles"]] == ["RFI-42", "RFI-42"]
+
+    def test_checkpoint_is_cleared_after_a_full_pass(self, pytest_runs):
+        pytest_runs["failing"].add("quality_inspector:final_approval")
+        run_tests.run_scenario("rfi_complete")
+        path = os.path.join(Config.CHECKPOINT_DIR, "rfi_complete.json")
+        with open(path, encoding="utf-8") as f:
+            assert sorted(json.load(f)["completed"]) == ["1", "2", "3"]
+
+        pytest_runs["failing"].clear()
+        run_tests.run_scenario("rfi_complete", resume=True)
+
+        assert not os.path.exists(path)
+
+    def test_without_resume_every_step_runs_again(self, pytest_runs):
+        pytest_runs["failing"].add("quality_inspector:inspect_rfi")
+        run_tests.run_scenario("rfi_complete")
+
+        pytest_runs["steps"].clear()
+        pytest_runs["failing"].clear()
+        run_tests.run_scenario("rfi_complete")
+
+        assert pytest_runs["steps"] == ["contractor:rfi", "block_engineer:review_rfi",
+                                        "quality_inspector:inspect_rfi", "quality_inspector:final_approval"]
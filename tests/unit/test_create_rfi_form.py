@@ -0,0 +1,103 @@
+import pytest
+
+from pages.cntr.createRfi_page import CreateRfiPage
+from utils.rfi_handle import RfiHandle
+from utils.rfi_record import RfiRecord
+
+PAGE = CreateRfiPage
+
+
+class FakeFormPage(CreateRfiPage):
+    """CreateRfiPage with the browser calls replaced: form_values() returns `shown`,
+    and every field fill_form enters is recorded in `entered` (in order)."""
+
+    def __init__(self, shown):
+        self.shown = shown
+        self.entered = []
+
+    def field(self, target, clickable=True):
+        return None
+
+    def wait_for_element_stable(self, element, timeout=None):
+        return element
+
+    def form_values(self):
+        return dict(self.shown)
+
+    def safe_input(self, locator, text):
+        self.entered.append(locator)
+
+    def select_dropdown_with_dependency_wait(self, trigger_locator, option_text, is_multiselect=False):
+        self.entered.append(trigger_locator)
+
+
+def showing(record, subcontractor):
+    """form_values() of a form that still holds `record`'s selections."""
+    return {
+        PAGE.PLOT_FIELD: record.plot,
+        PAGE.BLOCK_FIELD: record.block,
+        PAGE.PACKAGE_FIELD: record.package,
+        PAGE.SUBPACKAGE_FIELD: record.subpackage,
+        PAGE.ACTIVITY_FIELD: record.activity,
+        PAGE.SUBACTIVITY_FIELD: record.subactivity,
+        PAGE.LOCATION_FIELD: ", ".join(record.locations),
+        PAGE.QUANTITY_FIELD: record.quantity,
+        PAGE.UNIT_FIELD: record.unit,
+        PAGE.SUBCONTRACTOR_FIELD: subcontractor,
+        PAGE.INSPECTION_CHECKPOINT_FIELD: record.checkpoint,
+        PAGE.INSPECTION_CHECKLIST_FIELD: record.checklist,
+    }
+
+
+ALL_FIELDS = [label for label, _ in PAGE.FORM_CASCADE]
+
+
+@pytest.mark.unit
+class TestFillFormCascade:
+    """fill_form - only fields that differ, plus everything the app clears below them"""
+
+    def test_empty_form_fills_every_field(self):
+        page = FakeFormPage({})
+
+        page.fill_form(record=RfiRecord(), debug=False)
+
+        assert page.entered == ALL_FIELDS
+
+    def test_form_already_showing_the_record_is_left_alone(self):
+        record = RfiRecord()
+        page = FakeFormPage(showing(record, record.subcontractor))
+
+        page.fill_form(record=record, debug=False)
+
+        assert page.entered == []
+
+    def test_changed_field_refills_its_dependents(self):
+        previous = RfiRecord()
+        page = FakeFormPage(showing(previous, previous.subcontractor))
+
+        page.fill_form(record=RfiRecord(activity="Pile Installation"), debug=False)
+
+        # Activity clears Sub-Activity, which clears Location (-> Quantity) and the checkpoint (-> checklist);
+        # Unit of Measurement and Sub Contractor do not depend on it
+        assert page.entered == [PAGE.ACTIVITY_FIELD, PAGE.SUBACTIVITY_FIELD, PAGE.LOCATION_FIELD,
+                                PAGE.QUANTITY_FIELD, PAGE.INSPECTION_CHECKPOINT_FIELD,
+                                PAGE.INSPECTION_CHECKLIST_FIELD]
+
+    def test_locations_compare_as_a_set(self):
+        record = RfiRecord(locations=["R01-T02", "R01-T01"])
+        shown = showing(record, record.subcontractor)
+        shown[PAGE.LOCATION_FIELD] = "R01-T01, R01-T02"
+        page = FakeFormPage(shown)
+
+        page.fill_form(record=record, debug=False)
+
+        assert page.entered == []
+
+    def test_each_handle_rewrites_only_the_sub_contractor(self):
+        record = RfiRecord()
+        previous = RfiHandle.new(created_by="contractor")
+        page = FakeFormPage(showing(record, f"{record.subcontractor} {previous.reference}"))
+
+        page.fill_form(RfiHandle.new(created_by="contractor"), record, debug=False)
+
+        assert page.entered == [PAGE.SUBCONTRACTOR_FIELD]
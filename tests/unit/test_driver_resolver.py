@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from config.config import Config
+from utils import driver_resolver
+
+
+@pytest.fixture
+def resolver(tmp_path, monkeypatch):
+    """A fresh resolver state with a cache dir and a chromedriver on PATH only."""
+    monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+    monkeypatch.setattr(Config, "DRIVER_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(driver_resolver, "_resolved_paths", {})
+    monkeypatch.setattr(driver_resolver, "_chrome_version", driver_resolver._NOT_DETECTED)
+    binary = tmp_path / "chromedriver"
+    binary.write_text("")
+    binary.chmod(0o755)
+    monkeypatch.setattr(driver_resolver.shutil, "which", lambda name: str(binary))
+    return str(binary)
+
+
+@pytest.mark.unit
+class TestResolveChromedriver:
+    """resolve_chromedriver - per-mode cache and a single version probe"""
+
+    def test_online_and_offline_are_cached_separately(self, resolver, monkeypatch):
+        monkeypatch.setattr(driver_resolver, "_resolve", lambda offline: "offline" if offline else "online")
+
+        assert driver_resolver.resolve_chromedriver(offline=True) == "offline"
+        assert driver_resolver.resolve_chromedriver(offline=False) == "online"
+        assert driver_resolver.resolve_chromedriver(offline=True) == "offline"
+
+    def test_unknown_chrome_version_is_probed_once(self, resolver, monkeypatch):
+        probes = []
+
+        class FailingManager:
+            def get_browser_version_from_os(self, chrome_type):
+                probes.append(chrome_type)
+                raise OSError("no chrome")
+
+        import webdriver_manager.core.os_manager as os_manager
+        monkeypatch.setattr(os_manager, "OperationSystemManager", FailingManager)
+
+        assert driver_resolver.resolve_chromedriver(offline=True) == resolver
+        assert driver_resolver._detect_chrome_version() is None
+        assert len(probes) == 1
+
+    def test_environment_override_wins(self, resolver, monkeypatch):
+        monkeypatch.setenv("CHROMEDRIVER_PATH", os.path.join("opt", "chromedriver"))
+
+        assert driver_resolver.resolve_chromedriver(offline=True) == os.path.join("opt", "chromedriver")
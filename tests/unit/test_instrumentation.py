@@ -0,0 +1,105 @@
+import json
+import time
+
+import pytest
+
+from benchmarks.harness import CommandProbe
+from utils.instrumentation import subscribe_execute, subscribe_sleep
+from utils.sleep_profiler import SleepProfiler
+from utils.webdriver_tracer import WebDriverTracer
+
+
+class FakeDriver:
+    """Answers every command; find commands match nothing."""
+
+    def execute(self, driver_command, params=None):
+        if driver_command == "findElements":
+            return {"value": []}
+        return {"value": None}
+
+
+@pytest.mark.unit
+class TestInstrumentation:
+    """subscribe_execute / subscribe_sleep - one shared patch"""
+
+    def test_execute_is_wrapped_once_and_restored(self):
+        driver = FakeDriver()
+        seen = []
+        first = subscribe_execute(driver, lambda command, *rest: seen.append(("first", command)))
+        second = subscribe_execute(driver, lambda command, *rest: seen.append(("second", command)))
+        wrapped = driver.execute
+
+        driver.execute("getTitle")
+        first()
+        assert driver.execute is wrapped
+        driver.execute("getUrl")
+        second()
+
+        assert seen == [("first", "getTitle"), ("second", "getTitle"), ("second", "getUrl")]
+        assert "execute" not in vars(driver)
+
+    def test_failed_command_reports_the_error(self):
+        driver = FakeDriver()
+        driver.execute = lambda driver_command, params=None: 1 / 0
+        errors = []
+        unsubscribe = subscribe_execute(driver, lambda command, params, response, error, *rest: errors.append(error))
+
+        with pytest.raises(ZeroDivisionError):
+            driver.execute("click")
+        unsubscribe()
+
+        assert isinstance(errors[0], ZeroDivisionError)
+        # An execute set on the instance is put back, not deleted
+        assert "execute" in vars(driver)
+
+    def test_sleep_is_patched_only_while_subscribed(self):
+        original = time.sleep
+        slept = []
+        unsubscribe = subscribe_sleep(lambda seconds, *rest: slept.append(seconds))
+
+        time.sleep(0)
+        unsubscribe()
+        time.sleep(0)
+
+        assert slept == [0]
+        assert time.sleep is original
+
+
+@pytest.mark.unit
+class TestObserversShareThePatch:
+    """SleepProfiler, WebDriverTracer and CommandProbe on one driver"""
+
+    def test_all_observers_see_the_same_commands(self, tmp_path):
+        driver = FakeDriver()
+        profiler = SleepProfiler().start()
+        tracer = WebDriverTracer(str(tmp_path))
+        profiler.attach(driver)
+        tracer.attach(driver)
+        tracer.begin_test("tests/test_x.py::test_x")
+
+        with CommandProbe(driver) as probe:
+            driver.execute("findElements", {"using": "css selector", "value": ".missing"})
+            driver.execute("getTitle")
+            time.sleep(0)
+
+        trace_path = tracer.end_test()
+        profiler.stop()
+
+        assert probe.commands == 2
+        assert {kind for kind, _, _ in profiler.ranked()} == {"implicit_wait", "sleep"}
+        with open(trace_path, encoding="utf-8") as f:
+            assert json.load(f)["otherData"]["commands"] == 2
+
+
+@pytest.mark.unit
+class TestTraceFiles:
+    """WebDriverTracer - trace file names"""
+
+    def test_trace_files_carry_the_process_id(self, tmp_path):
+        first, second = WebDriverTracer(str(tmp_path)), WebDriverTracer(str(tmp_path))
+        second._pid = first._pid + 1  # a parallel run of the same test
+
+        names = {tracer._file_name("tests/test_login.py::test_valid_login[chrome]") for tracer in (first, second)}
+
+        assert names == {f"tests_test_login.py_test_valid_login_chrome.{pid}.json"
+                         for pid in (first._pid, first._pid + 1)}
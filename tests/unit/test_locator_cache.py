@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from utils.locator_cache import LocatorStrategyCache
+
+BUTTON = ("xpath", "//button[normalize-space()='Login']")
+SPAN = ("xpath", "//span[normalize-space()='Login']/ancestor::button")
+CSS = ("css selector", "button[type='submit']")
+
+
+@pytest.mark.unit
+class TestLocatorStrategyCache:
+    """LocatorStrategyCache - learned locators, matched by value"""
+
+    def test_learned_locator_is_tried_first_after_a_reload(self, tmp_path):
+        path = str(tmp_path / "locators.json")
+        LocatorStrategyCache(path).record("login.button", SPAN)
+
+        assert LocatorStrategyCache(path).order("login.button", [BUTTON, SPAN, CSS]) == [1, 0, 2]
+
+    def test_learned_locator_follows_a_reordered_list(self, tmp_path):
+        cache = LocatorStrategyCache(str(tmp_path / "locators.json"))
+        cache.record("login.button", SPAN)
+
+        assert cache.order("login.button", [SPAN, CSS, BUTTON]) == [0, 1, 2]
+        assert cache.order("login.button", [CSS, BUTTON, SPAN]) == [2, 0, 1]
+
+    def test_locator_no_longer_in_the_list_is_ignored(self, tmp_path):
+        cache = LocatorStrategyCache(str(tmp_path / "locators.json"))
+        cache.record("login.button", SPAN)
+
+        assert cache.order("login.button", [BUTTON, CSS]) == [0, 1]
+
+    def test_index_entries_from_older_caches_are_ignored(self, tmp_path):
+        path = tmp_path / "locators.json"
+        path.write_text(json.dumps({"login.button": 2}))
+
+        assert LocatorStrategyCache(str(path)).order("login.button", [BUTTON, SPAN, CSS]) == [0, 1, 2]
+
+    def test_unchanged_locator_is_not_rewritten(self, tmp_path):
+        path = tmp_path / "locators.json"
+        cache = LocatorStrategyCache(str(path))
+        cache.record("login.button", BUTTON)
+        path.write_text(json.dumps({"login.button": list(BUTTON), "marker": True}))
+
+        cache.record("login.button", BUTTON)
+
+        assert "marker" in json.loads(path.read_text())
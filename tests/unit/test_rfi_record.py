@@ -0,0 +1,110 @@
+import json
+import os
+
+import pytest
+
+from utils.rfi_record import RfiRecord, load_records, DEFAULTS
+
+HEADER = "plot,block,package,activity,locations,quantity"
+SAMPLE_DATASET = os.path.join(os.path.dirname(__file__), "..", "..", "bulk_rfi", "sample_rfis.csv")
+
+
+def write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content if isinstance(content, str) else json.dumps(content), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.unit
+class TestLoadRecords:
+    """load_records - CSV/JSON datasets and their errors"""
+
+    def test_csv_rows_become_records(self, tmp_path):
+        path = write(tmp_path, "rfis.csv", f"{HEADER},unit\nS05b,BL05,Civil,MMS Installation,R01-T01; R01-T02 | R01-T03,40,MTR\n")
+
+        [record] = load_records(path)
+
+        assert record.locations == ["R01-T01", "R01-T02", "R01-T03"]
+        assert record.quantity == "40"
+        assert record.subactivity == "MMS Installation"
+        assert record.subcontractor == DEFAULTS["subcontractor"]
+
+    def test_json_list_becomes_records(self, tmp_path):
+        path = write(tmp_path, "rfis.json", [{"plot": "S05b", "block": "BL05", "package": "Civil",
+                                              "activity": "MMS Installation", "locations": ["R02-T01"],
+                                              "quantity": 12}])
+
+        [record] = load_records(path)
+
+        assert record.locations == ["R02-T01"]
+        assert record.quantity == "12"
+
+    def test_headers_are_trimmed_and_case_insensitive(self, tmp_path):
+        path = write(tmp_path, "rfis.csv", " Plot , BLOCK,Package,Activity,Locations,Quantity\nS05b,BL05,Civil,MMS,R01-T01,5\n")
+
+        assert load_records(path)[0].block == "BL05"
+
+    def test_missing_required_value_names_the_row(self, tmp_path):
+        path = write(tmp_path, "rfis.csv", f"{HEADER}\nS05b,BL05,Civil,MMS,R01-T01,5\nS05b,BL05,Civil,MMS,,\n")
+
+        with pytest.raises(ValueError, match=r"rfis\.csv row 2: missing locations, quantity"):
+            load_records(path)
+
+    def test_missing_required_column(self, tmp_path):
+        path = write(tmp_path, "rfis.csv", "plot,block,package,activity,locations\nS05b,BL05,Civil,MMS,R01-T01\n")
+
+        with pytest.raises(ValueError, match="row 1: missing quantity"):
+            load_records(path)
+
+    def test_unknown_column_names_the_row(self, tmp_path):
+        path = write(tmp_path, "rfis.json", [{"plot": "S05b", "block": "BL05", "package": "Civil",
+                                              "activity": "MMS", "locations": "R01-T01", "quantity": 5,
+                                              "colour": "red"}])
+
+        with pytest.raises(ValueError, match=r"rfis\.json row 1: Unknown RFI field\(s\): colour"):
+            load_records(path)
+
+    def test_unsupported_extension(self, tmp_path):
+        path = write(tmp_path, "rfis.xlsx", "")
+
+        with pytest.raises(ValueError, match=r"Unsupported dataset format '\.xlsx'"):
+            load_records(path)
+
+    def test_extra_csv_values_name_the_row(self, tmp_path):
+        path = write(tmp_path, "rfis.csv", f"{HEADER}\nS05b,BL05,Civil,MMS,R01-T01,5,oops\n")
+
+        with pytest.raises(ValueError, match="row 1: more values than columns"):
+            load_records(path)
+
+    def test_malformed_json_names_the_file(self, tmp_path):
+        path = write(tmp_path, "rfis.json", "[{\"plot\": ")
+
+        with pytest.raises(ValueError, match=r"rfis\.json: invalid JSON"):
+            load_records(path)
+
+    def test_json_must_be_a_list_of_objects(self, tmp_path):
+        with pytest.raises(ValueError, match="expected a list of RFI objects"):
+            load_records(write(tmp_path, "object.json", {"plot": "S05b"}))
+        valid = dict(zip(HEADER.split(","), ["S05b", "BL05", "Civil", "MMS", "R01-T01", "5"]))
+        with pytest.raises(ValueError, match="row 2: expected an object, got str"):
+            load_records(write(tmp_path, "mixed.json", [valid, "S05b"]))
+
+    def test_sample_dataset_loads(self):
+        records = load_records(SAMPLE_DATASET)
+
+        assert records and all(isinstance(record, RfiRecord) for record in records)
+
+
+@pytest.mark.unit
+class TestRfiRecord:
+    """RfiRecord - defaults and validation"""
+
+    def test_defaults_are_the_suite_standard_rfi(self):
+        record = RfiRecord()
+
+        assert record.to_dict()["plot"] == DEFAULTS["plot"]
+        assert record.subactivity == record.activity
+
+    def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown RFI field"):
+            RfiRecord(colour="red")
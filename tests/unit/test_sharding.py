@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from utils.sharding import DurationHistory, plan_shards, DEFAULT_TEST_SECONDS
+
+
+def shard_of(shards, nodeid):
+    return next(index for index, shard in enumerate(shards) if nodeid in shard["nodeids"])
+
+
+@pytest.mark.unit
+class TestPlanShards:
+    """plan_shards - LPT balance and role groups"""
+
+    def test_every_test_lands_in_exactly_one_shard(self):
+        tests = [(f"t{n}", ("contractor",), 10.0) for n in range(7)]
+        shards = plan_shards(tests, 3, login_seconds=0)
+
+        placed = [nodeid for shard in shards for nodeid in shard["nodeids"]]
+        assert sorted(placed) == sorted(nodeid for nodeid, _, _ in tests)
+
+    def test_longest_first_balances_the_shards(self):
+        # LPT: 8 | 7 | 6, then each next-longest test onto the least loaded shard:
+        # 5 -> 6 (11), 4 -> 7 (11), 3 -> 8 (11), 2 -> 8+3 (13)
+        tests = [(f"t{seconds}", (), float(seconds)) for seconds in (8, 7, 6, 5, 4, 3, 2)]
+        shards = plan_shards(tests, 3, login_seconds=0)
+
+        assert sorted(shard["seconds"] for shard in shards) == [11.0, 11.0, 13.0]
+        assert {"t8", "t3", "t2"} in [shard["nodeids"] for shard in shards]
+
+    def test_small_role_groups_stay_on_one_shard(self):
+        tests = [("review_1", ("block_engineer",), 5.0), ("review_2", ("block_engineer",), 5.0),
+                 ("inspect_1", ("quality_inspector",), 5.0), ("inspect_2", ("quality_inspector",), 5.0)]
+        shards = plan_shards(tests, 2, login_seconds=8)
+
+        assert shard_of(shards, "review_1") == shard_of(shards, "review_2")
+        assert shard_of(shards, "inspect_1") == shard_of(shards, "inspect_2")
+        assert shard_of(shards, "review_1") != shard_of(shards, "inspect_1")
+        assert [sorted(shard["roles"]) for shard in shards] in (
+            [["block_engineer"], ["quality_inspector"]], [["quality_inspector"], ["block_engineer"]])
+
+    def test_login_cost_is_charged_once_per_role_and_shard(self):
+        tests = [("a", ("contractor",), 10.0), ("b", ("contractor",), 10.0)]
+        shards = plan_shards(tests, 1, login_seconds=8)
+
+        assert shards[0]["seconds"] == 28.0
+        assert shards[0]["roles"] == {"contractor"}
+
+    def test_oversized_role_group_is_split_across_shards(self):
+        # One role holds all the work: it must not pin a single shard
+        tests = [(f"t{n}", ("contractor",), 10.0) for n in range(6)]
+        shards = plan_shards(tests, 3, login_seconds=0)
+
+        assert [len(shard["nodeids"]) for shard in shards] == [2, 2, 2]
+
+    def test_same_input_gives_the_same_plan(self):
+        tests = [(f"t{n}", (("contractor",), ("quality_inspector",), ())[n % 3], float(n % 4 + 1))
+                 for n in range(12)]
+        first = plan_shards(tests, 3, login_seconds=8)
+        second = plan_shards(list(reversed(tests)), 3, login_seconds=8)
+
+        assert [shard["nodeids"] for shard in first] == [shard["nodeids"] for shard in second]
+
+
+@pytest.mark.unit
+class TestDurationHistory:
+    """DurationHistory - estimates and EMA-smoothed saves"""
+
+    def test_estimate_falls_back_to_median_then_default(self, tmp_path):
+        history = DurationHistory(str(tmp_path / "durations.json"))
+        assert history.estimate("new") == DEFAULT_TEST_SECONDS
+
+        history.durations = {"a": 10.0, "b": 20.0, "c": 60.0}
+        assert history.estimate("a") == 10.0
+        assert history.estimate("new") == 20.0
+
+    def test_save_adds_up_phases_and_smooths_with_ema(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({"a": 10.0}))
+        history = DurationHistory(str(path), alpha=0.5)
+
+        history.add("a", 15.0)
+        history.add("a", 5.0)  # teardown of the same test
+        history.add("b", 4.0)
+        history.save()
+
+        assert json.loads(path.read_text()) == {"a": 15.0, "b": 4.0}
+
+    def test_save_keeps_updates_from_other_shards(self, tmp_path):
+        path = tmp_path / "durations.json"
+        shard_one = DurationHistory(str(path))
+        shard_two = DurationHistory(str(path))
+
+        shard_one.add("a", 3.0)
+        shard_one.save()
+        shard_two.add("b", 4.0)
+        shard_two.save()
+
+        assert json.loads(path.read_text()) == {"a": 3.0, "b": 4.0}
+
+    def test_unreadable_file_starts_empty(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text("not json")
+
+        assert DurationHistory(str(path)).durations == {}
@@ -0,0 +1,173 @@
+import pytest
+
+from utils import work_queue
+from utils.work_queue import WorkQueue, PENDING, LEASED, PASSED, FAILED, SKIPPED
+
+
+class FakeClock:
+    """Stands in for the time module so lease expiry needs no real waiting."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(work_queue, "time", fake)
+    return fake
+
+
+def items(*specs):
+    """items(("a", []), ("b", ["a"])) -> work items with dependencies."""
+    return [{"id": item_id, "depends_on": deps} for item_id, deps in specs]
+
+
+@pytest.mark.unit
+class TestWorkQueueLeases:
+    """WorkQueue - lease expiry and re-queue"""
+
+    def test_expired_lease_is_requeued_for_another_worker(self, clock):
+        queue = WorkQueue(items(("a", [])), lease_timeout=10)
+        assert queue.lease("w1")["id"] == "a"
+        assert queue.lease("w2") is None
+
+        clock.now += 11
+        item = queue.lease("w2")
+
+        assert item["id"] == "a"
+        assert queue.status["a"] == LEASED
+
+    def test_lease_is_kept_until_the_timeout(self, clock):
+        queue = WorkQueue(items(("a", [])), lease_timeout=10)
+        queue.lease("w1")
+
+        clock.now += 9
+        assert queue.lease("w2") is None
+
+    def test_heartbeat_extends_the_lease(self, clock):
+        queue = WorkQueue(items(("a", [])), lease_timeout=10)
+        queue.lease("w1")
+
+        clock.now += 8
+        assert queue.heartbeat("a", "w1")
+        clock.now += 8
+
+        assert queue.lease("w2") is None
+        assert queue.status["a"] == LEASED
+
+    def test_result_from_expired_lease_is_ignored(self, clock):
+        queue = WorkQueue(items(("a", [])), lease_timeout=10)
+        queue.lease("w1")
+        clock.now += 11
+        queue.lease("w2")
+
+        assert not queue.heartbeat("a", "w1")
+        assert not queue.complete("a", "w1", returncode=0)
+        assert queue.complete("a", "w2", returncode=0)
+        assert queue.status["a"] == PASSED
+
+    def test_expired_item_goes_back_to_pending(self, clock):
+        queue = WorkQueue(items(("a", []), ("b", ["a"])), lease_timeout=10)
+        queue.lease("w1")
+
+        clock.now += 11
+        # "b" still waits for "a", so nothing is handed out, but "a" is free again
+        assert queue.summary()[LEASED] == 1
+        assert queue.lease("w2")["id"] == "a"
+        assert queue.summary()[PENDING] == 1
+
+
+@pytest.mark.unit
+class TestWorkQueueDependencies:
+    """WorkQueue - dependency order, skips and inherited data"""
+
+    def test_dependent_item_waits_for_its_dependency(self, clock):
+        queue = WorkQueue(items(("a", []), ("b", ["a"])))
+        assert queue.lease("w1")["id"] == "a"
+        assert queue.lease("w2") is None
+
+        queue.complete("a", "w1", returncode=0, data={"rfi_handle": {"reference": "AT-1"}})
+        item = queue.lease("w2")
+
+        assert item["id"] == "b"
+        assert item["data"] == {"rfi_handle": {"reference": "AT-1"}}
+
+    def test_failed_dependency_skips_the_rest(self, clock):
+        queue = WorkQueue(items(("a", []), ("b", ["a"]), ("c", ["b"])))
+        queue.lease("w1")
+        queue.complete("a", "w1", returncode=1)
+
+        with pytest.raises(StopIteration):
+            queue.lease("w1")
+        assert queue.status == {"a": FAILED, "b": SKIPPED, "c": SKIPPED}
+        assert queue.wait(timeout=0)
+
+
+@pytest.mark.unit
+class TestWorkQueueShutdown:
+    """WorkQueue - every polling worker hears that the run is over"""
+
+    def test_waits_for_every_worker_that_polled(self, clock):
+        queue = WorkQueue(items(("a", [])))
+        queue.lease("w1")
+        assert queue.lease("w2") is None
+        queue.complete("a", "w1", returncode=0)
+
+        with pytest.raises(StopIteration):
+            queue.lease("w1")
+        assert not queue.wait_for_workers(timeout=0)
+
+        with pytest.raises(StopIteration):
+            queue.lease("w2")
+        assert queue.wait_for_workers(timeout=0)
+
+
+class ScriptedWorker(work_queue.WorkerClient):
+    """WorkerClient talking to a scripted coordinator instead of HTTP."""
+
+    def __init__(self, heartbeat_ok):
+        super().__init__("http://coordinator", "token", name="w1")
+        self.heartbeat_ok = heartbeat_ok
+        self.replies = [{"item": {"id": "a"}, "heartbeat": 0.01}]
+        self.posted = []
+
+    def _lease(self):
+        if not self.replies:
+            raise StopIteration
+        return self.replies.pop(0)
+
+    def _post(self, path, body):
+        self.posted.append(path)
+        return {"ok": self.heartbeat_ok} if path == "/heartbeat" else {"accepted": True}
+
+
+@pytest.mark.unit
+class TestWorkerClient:
+    """WorkerClient - a lost lease aborts the running item"""
+
+    def test_lost_lease_aborts_the_item_and_drops_its_result(self):
+        worker = ScriptedWorker(heartbeat_ok=False)
+        aborted = []
+
+        def run_item(item, lease_lost):
+            aborted.append(lease_lost.wait(timeout=5))
+            return 1, 0.0, "terminated", {}
+
+        assert worker.run(run_item) == 0
+        assert aborted == [True]
+        assert "/result" not in worker.posted
+
+    def test_kept_lease_reports_the_result(self):
+        worker = ScriptedWorker(heartbeat_ok=True)
+
+        def run_item(item, lease_lost):
+            assert not lease_lost.wait(timeout=0.05)
+            return 0, 0.05, "passed", {}
+
+        worker.run(run_item)
+
+        assert worker.posted[-1] == "/result"
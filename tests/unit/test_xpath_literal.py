@@ -0,0 +1,23 @@
+import pytest
+
+from pages.base_page import xpath_literal
+
+
+@pytest.mark.unit
+class TestXpathLiteral:
+    """xpath_literal - search text as a quote-safe XPath string"""
+
+    def test_plain_text_is_single_quoted(self):
+        assert xpath_literal("RFI-42") == "'RFI-42'"
+
+    def test_apostrophe_switches_to_double_quotes(self):
+        assert xpath_literal("O'Brien AT-1") == '"O\'Brien AT-1"'
+
+    def test_double_quotes_stay_single_quoted(self):
+        assert xpath_literal('12" pipe') == "'12\" pipe'"
+
+    def test_both_quote_kinds_use_concat(self):
+        assert xpath_literal("it's 12\" wide") == "concat('it', \"'\", 's 12\" wide')"
+
+    def test_non_strings_are_converted(self):
+        assert xpath_literal(42) == "'42'"
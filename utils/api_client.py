@@ -0,0 +1,72 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.config import Config
+from config.test_data import TestData
+
+
+class ApiError(Exception):
+    """A Pulse API call answered with an error status."""
+
+    def __init__(self, method, path, status, message):
+        super().__init__(f"{method} {path} -> {status}: {message}")
+        self.status = status
+        self.message = message
+
+
+def api_url():
+    """Base URL of the Pulse JSON API (Config.API_URL, else BASE_URL/api)."""
+    return (Config.API_URL or f"{Config.BASE_URL}/api").rstrip("/")
+
+
+class PulseApiClient:
+    """requests.Session against the Pulse JSON API, logged in as one role.
+
+    Keeps its connections alive (HTTPAdapter pool) and its session cookie, so
+    repeated calls cost one round trip each. Idempotent GETs are retried on
+    connection errors and 502/503/504.
+
+    Usage:
+        client = PulseApiClient().login("block_engineer")
+        client.post(f"/rfis/{rfi_id}/review", {"decision": "approve"})
+        client.close()
+    """
+
+    def __init__(self, base_url=None, pool_size=None, timeout=None):
+        self.base_url = (base_url or api_url()).rstrip("/")
+        self.timeout = timeout or Config.API_TIMEOUT
+        self.role = None
+        self.session = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset({"GET"}))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size or Config.API_POOL_SIZE,
+                              max_retries=retries)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _request(self, method, path, **kwargs):
+        response = self.session.request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+        try:
+            body = response.json() if response.content else {}
+        except ValueError:
+            body = {"error": response.text[:200]}
+        if not response.ok:
+            raise ApiError(method, path, response.status_code, body.get("error") or response.reason)
+        return body
+
+    def get(self, path, **params):
+        return self._request("GET", path, params=params or None)
+
+    def post(self, path, body=None):
+        return self._request("POST", path, json=body or {})
+
+    def login(self, role):
+        """Log in with the role's TestData credentials; returns self."""
+        credentials = TestData.get_credentials(role)
+        self.post("/login", {"username": credentials["username"], "password": credentials["password"]})
+        self.role = role
+        return self
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,163 @@
+import atexit
+import base64
+import gzip
+import json
+import os
+import queue
+import re
+import tempfile
+import threading
+import time
+
+from config.config import Config
+
+# Label for captures made outside any test (bulk runs, benchmarks, fixtures)
+SESSION_ARTIFACTS = "session"
+
+
+class ArtifactPipeline:
+    """Failure evidence (screenshot, DOM, browser console) written off the test thread.
+
+    `capture()` only grabs the raw data from the browser - a JPEG encoded by
+    Chrome itself where CDP is available, the page source and the console
+    log - and returns. Decoding, gzip compression and the file writes happen
+    on one background thread. Every capture gets its own directory under
+    `<root>/<test>/`, created atomically, so parallel workers and repeated
+    failures never overwrite each other's files.
+
+    Usage:
+        pipeline = ArtifactPipeline("artifacts")
+        pipeline.current_test = item.nodeid
+        pipeline.capture(driver, "submit_error")
+        pipeline.close()    # waits until everything is on disk
+    """
+
+    def __init__(self, root=None, jpeg_quality=None):
+        self.root = root or Config.ARTIFACT_DIR
+        self.jpeg_quality = jpeg_quality or Config.ARTIFACT_JPEG_QUALITY
+        self.current_test = None
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------
+    # CAPTURE (caller's thread)
+    # -----------------------------------------------------
+    def capture(self, driver, label, test=None):
+        """Queue the browser's current state for writing; returns the artifact directory."""
+        directory = self._new_directory(test or self.current_test or SESSION_ARTIFACTS, label)
+        job = {"directory": directory, "label": label, "test": test or self.current_test, "captured_at": time.time()}
+        for name, grab in (("screenshot", self._grab_screenshot), ("dom", lambda d: d.page_source),
+                           ("console", self._grab_console), ("url", lambda d: d.current_url)):
+            try:
+                job[name] = grab(driver)
+            except Exception as e:
+                job.setdefault("errors", {})[name] = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+        self._ensure_writer()
+        self._jobs.put(job)
+        print(f"[ARTIFACT] Capturing {label} into {directory}")
+        return directory
+
+    def _grab_screenshot(self, driver):
+        """(extension, base64 data): JPEG via CDP where available, else the standard PNG."""
+        try:
+            data = driver.execute_cdp_cmd("Page.captureScreenshot",
+                                          {"format": "jpeg", "quality": self.jpeg_quality})["data"]
+            return "jpg", data
+        except Exception:
+            return "png", driver.get_screenshot_as_base64()
+
+    @staticmethod
+    def _grab_console(driver):
+        # Needs goog:loggingPrefs (set by create_chrome_driver); drains the buffer
+        return driver.get_log("browser")
+
+    def _new_directory(self, test, label):
+        parent = os.path.join(self.root, _safe_name(test))
+        os.makedirs(parent, exist_ok=True)
+        return tempfile.mkdtemp(prefix=f"{time.strftime('%Y%m%d-%H%M%S')}-{_safe_name(label)}-", dir=parent)
+
+    # -----------------------------------------------------
+    # WRITING (background thread)
+    # -----------------------------------------------------
+    def _ensure_writer(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._write_loop, name="artifact-writer", daemon=True)
+                self._thread.start()
+
+    def _write_loop(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                if job is None:
+                    return
+                self._write(job)
+            except Exception as e:
+                print(f"[ARTIFACT] [WARN] Could not write {job['directory']}: {e}")
+            finally:
+                self._jobs.task_done()
+
+    def _write(self, job):
+        directory = job["directory"]
+        if "screenshot" in job:
+            extension, data = job["screenshot"]
+            with open(os.path.join(directory, f"screenshot.{extension}"), "wb") as f:
+                f.write(base64.b64decode(data))
+        if "dom" in job:
+            with gzip.open(os.path.join(directory, "dom.html.gz"), "wt", encoding="utf-8") as f:
+                f.write(job["dom"])
+        if "console" in job:
+            with open(os.path.join(directory, "console.json"), "w", encoding="utf-8") as f:
+                json.dump(job["console"], f, indent=2)
+        meta = {key: job.get(key) for key in ("test", "label", "url", "captured_at", "errors") if job.get(key)}
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+    def flush(self, timeout=None):
+        """Block until every queued capture is written (timeout in seconds)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._jobs.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout=30):
+        if self._thread is not None and self._thread.is_alive():
+            if not self.flush(timeout):
+                print(f"[ARTIFACT] [WARN] {self._jobs.unfinished_tasks} capture(s) not written within {timeout}s")
+            self._jobs.put(None)
+
+
+def _safe_name(name):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or SESSION_ARTIFACTS
+
+
+# Process-wide pipeline used by page objects and the pytest failure hook
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+
+def artifact_pipeline():
+    """The process-wide ArtifactPipeline (created on first use)."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = ArtifactPipeline()
+            # Don't lose queued captures when the process exits (daemon writer thread)
+            atexit.register(_pipeline.close)
+        return _pipeline
+
+
+def capture_failure(driver, label):
+    """Save failure evidence for the current test without blocking on disk I/O.
+
+    Never raises: a failed capture must not hide the original error.
+    Returns the artifact directory, or None.
+    """
+    try:
+        return artifact_pipeline().capture(driver, label)
+    except Exception as e:
+        print(f"[ARTIFACT] [WARN] Could not capture {label}: {e}")
+        return None
@@ -0,0 +1,156 @@
+import queue
+import threading
+
+
+class BrowserPool:
+    """Pool of warm Chrome instances shared by the driver fixtures.
+
+    Chrome cold start is the biggest fixed cost of a short run, so the pool
+    spawns browsers in the background (while pytest is still collecting tests)
+    and hands them out on demand. A released browser is reset - cookies and
+    storage cleared, extra tabs closed, navigated to about:blank - and goes back
+    to the pool instead of being quit.
+
+    Usage:
+        pool = BrowserPool(_create_driver, size=2)
+        pool.prewarm()
+        driver = pool.acquire()
+        ...
+        pool.release(driver)
+        pool.shutdown()
+    """
+
+    def __init__(self, factory, size=2):
+        self.factory = factory
+        self.size = size
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+
+    # -----------------------------------------------------
+    # SPAWNING
+    # -----------------------------------------------------
+    def prewarm(self, count=None):
+        """Start `count` (default: pool size) browsers on background threads."""
+        count = self.size if count is None else count
+        for _ in range(count):
+            with self._lock:
+                self._pending += 1
+            threading.Thread(target=self._spawn, name="browser-pool-spawn", daemon=True).start()
+        if count:
+            print(f"[POOL] Pre-spawning {count} Chrome instance(s) in the background")
+
+    def _spawn(self):
+        """Create one browser and park it in the idle queue."""
+        try:
+            driver = self._create()
+        except Exception as e:
+            print(f"[POOL] [WARN] Background Chrome start failed: {e}")
+            driver = None
+        if driver is not None and self._closed:
+            # Session ended while this browser was still starting up
+            self._quit(driver)
+            driver = None
+        with self._lock:
+            self._pending -= 1
+        # None wakes up a waiting acquire() so it can start a browser itself
+        self._idle.put(driver)
+
+    def _create(self):
+        driver = self.factory()
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    # -----------------------------------------------------
+    # LEASING
+    # -----------------------------------------------------
+    def acquire(self):
+        """Lease a browser: an idle one, one still starting up, or a new one."""
+        if self._closed:
+            raise RuntimeError("Browser pool has been shut down")
+
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    starting = self._pending > 0
+                if not starting:
+                    return self._create()
+                driver = self._idle.get()
+
+            if driver is not None and self._is_alive(driver):
+                return driver
+            self._discard(driver)
+
+    def release(self, driver):
+        """Reset a leased browser and return it to the pool (quit it if reset fails)."""
+        if driver is None:
+            return
+        if self._closed or not self._reset(driver):
+            self._quit(driver)
+            return
+        self._idle.put(driver)
+
+    def _reset(self, driver):
+        """Clear session state so the next lease starts clean. Returns True on success."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # about:blank and data: pages have no storage
+
+            try:
+                # Clears cookies of every domain, not just the current one
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"[POOL] [WARN] Could not reset browser, discarding it: {e}")
+            return False
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    # -----------------------------------------------------
+    # TEARDOWN
+    # -----------------------------------------------------
+    def _discard(self, driver):
+        if driver is not None:
+            self._quit(driver)
+
+    def _quit(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def shutdown(self):
+        """Quit every browser the pool has started."""
+        self._closed = True
+        with self._lock:
+            drivers = list(self._drivers)
+        for driver in drivers:
+            self._quit(driver)
+        if drivers:
+            print(f"[POOL] Shut down {len(drivers)} Chrome instance(s)")
@@ -0,0 +1,38 @@
+import os
+
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Frames from this directory are the "page-object methods" work is attributed to
+_PAGES_DIR = os.path.join(_ROOT_DIR, "pages") + os.sep
+# Instrumentation wrappers (tracer, profiler) never count as the call site
+_SKIPPED_FILES = {os.path.abspath(__file__)}
+
+
+def skip_file(path):
+    """Never report frames from `path` (call from wrapper modules with __file__)."""
+    _SKIPPED_FILES.add(os.path.abspath(path))
+
+
+def call_site(frame):
+    """file:line of the innermost frame that belongs to this repo (not selenium)."""
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(_ROOT_DIR) and filename not in _SKIPPED_FILES
+                and "site-packages" not in filename):
+            return f"{os.path.relpath(filename, _ROOT_DIR)}:{frame.f_lineno}"
+        frame = frame.f_back
+    return None
+
+
+def page_stack(frame):
+    """Page-object frames on the stack, outermost first."""
+    stack = []
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(_PAGES_DIR):
+            stack.append(frame)
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def frame_name(frame):
+    return getattr(frame.f_code, "co_qualname", frame.f_code.co_name)
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import time
+
+
+class ScenarioCheckpoint:
+    """Records which steps of a scenario passed, so a failed run can resume.
+
+    Stored as JSON per scenario. Along with the step index, a completed step
+    keeps the scenario's RFI handle at that point, so resumed steps still
+    work on the RFI the skipped steps created. A checkpoint written for a
+    different step list (the scenario was edited) is ignored.
+
+    Usage:
+        checkpoint = ScenarioCheckpoint.load(path, ["contractor:rfi", ...])
+        if not checkpoint.is_completed(1): ...
+        checkpoint.mark_completed(1, handle)
+        checkpoint.clear()   # scenario finished
+    """
+
+    def __init__(self, path, steps):
+        self.path = path
+        self.steps = list(steps)
+        self.completed = {}  # step index -> {"rfi_handle", "finished_at"}
+
+    @classmethod
+    def load(cls, path, steps):
+        checkpoint = cls(path, steps)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return checkpoint
+        if data.get("steps") != checkpoint.steps:
+            print(f"[CHECKPOINT] [WARN] {path} was written for other steps - ignoring it")
+            return checkpoint
+        checkpoint.completed = {int(index): entry for index, entry in data.get("completed", {}).items()}
+        return checkpoint
+
+    def is_completed(self, index):
+        return index in self.completed
+
+    def last_handle(self):
+        """RFI handle (dict) saved with the latest completed step, or None."""
+        for index in sorted(self.completed, reverse=True):
+            if self.completed[index].get("rfi_handle"):
+                return self.completed[index]["rfi_handle"]
+        return None
+
+    def mark_completed(self, index, handle=None):
+        self.completed[index] = {
+            "rfi_handle": handle.to_dict() if handle else None,
+            "finished_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self._save()
+
+    def clear(self):
+        self.completed = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"steps": self.steps, "completed": self.completed}, f, indent=2)
+        os.replace(tmp, self.path)
@@ -0,0 +1,77 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+from config.config import Config
+from utils.driver_resolver import resolve_chromedriver
+
+# Browser profiles (Config.BROWSER_PROFILE / --browser-profile)
+STANDARD = "standard"
+PERFORMANCE = "performance"
+BROWSER_PROFILES = [STANDARD, PERFORMANCE]
+
+
+def create_chrome_driver(headless=False, profile=None, camera=False):
+    """Create a Chrome driver with the suite's standard options.
+
+    Args:
+        headless: Run without a visible window (benchmarks, CI)
+        profile: "standard" - full-featured 1920x1080 window, or "performance" -
+                 headless, no images/remote fonts/extensions/background
+                 networking, smaller window, "eager" page loads (parallel CI).
+                 Default: Config.BROWSER_PROFILE
+        camera: Fake camera/microphone that is allowed without a prompt
+                (only tests that capture photos need it)
+    """
+    profile = profile or Config.BROWSER_PROFILE
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile '{profile}' (expected one of {', '.join(BROWSER_PROFILES)})")
+    performance = profile == PERFORMANCE
+
+    chrome_options = Options()
+    # Note: Running in visible mode (not headless) by default - browser window will be visible
+    if headless or performance:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+
+    # Set preferences for automatic permissions
+    prefs = {
+        "profile.default_content_setting_values.geolocation": 1,          # Allow geolocation
+        "profile.default_content_setting_values.notifications": 1         # Allow notifications
+    }
+
+    if camera:
+        # Allow camera and geolocation permissions automatically
+        chrome_options.add_argument("--use-fake-ui-for-media-stream")  # Auto-allow camera/mic
+        chrome_options.add_argument("--use-fake-device-for-media-stream")  # Use fake camera device
+        prefs["profile.default_content_setting_values.media_stream_camera"] = 1  # Allow camera
+        prefs["profile.default_content_setting_values.media_stream_mic"] = 1     # Allow microphone
+
+    if performance:
+        chrome_options.add_argument(f"--window-size={Config.PERFORMANCE_WINDOW_SIZE}")
+        # Skip work the tests never look at: images, web fonts, extensions, background traffic
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-remote-fonts")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
+        chrome_options.add_argument("--disable-component-update")
+        chrome_options.add_argument("--disable-default-apps")
+        chrome_options.add_argument("--disable-sync")
+        chrome_options.add_argument("--mute-audio")
+        prefs["profile.managed_default_content_settings.images"] = 2
+        # Return from get() at DOMContentLoaded; page objects wait for their elements anyway
+        chrome_options.page_load_strategy = "eager"
+    else:
+        chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_experimental_option("prefs", prefs)
+    # Keep the browser console readable for failure artifacts (utils/artifacts.py)
+    chrome_options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+
+    # Resolved once per process, cached on disk per Chrome version
+    service = Service(resolve_chromedriver())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver.implicitly_wait(Config.IMPLICIT_WAIT)
+    if not performance:
+        driver.maximize_window()
+    return driver
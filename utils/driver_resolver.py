@@ -0,0 +1,143 @@
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+
+from config.config import Config
+
+MANIFEST_NAME = "chromedriver_manifest.json"
+
+_resolved_paths = {}  # offline flag -> chromedriver path
+_resolve_lock = threading.Lock()
+# Installed Chrome version, None once detection failed (probed once per process)
+_NOT_DETECTED = object()
+_chrome_version = _NOT_DETECTED
+
+
+def resolve_chromedriver(offline=None):
+    """Return the chromedriver path, resolving it at most once per process and mode.
+
+    Resolution order:
+    1. CHROMEDRIVER_PATH environment variable
+    2. Path already resolved in this process for the same `offline` value
+    3. On-disk manifest entry for the installed Chrome version (shared across
+       processes and pytest sessions)
+    4. ChromeDriverManager().install() - skipped in offline mode, where the newest
+       manifest entry or a chromedriver on PATH is used instead
+
+    Args:
+        offline: Never touch the network (default: Config.DRIVER_OFFLINE)
+    """
+    offline = Config.DRIVER_OFFLINE if offline is None else offline
+
+    override = os.environ.get("CHROMEDRIVER_PATH")
+    if override:
+        return override
+
+    offline = bool(offline)
+    with _resolve_lock:
+        if offline not in _resolved_paths:
+            _resolved_paths[offline] = _resolve(offline)
+        return _resolved_paths[offline]
+
+
+def _resolve(offline):
+    manifest = _load_manifest()
+    version = _detect_chrome_version()
+
+    entry = manifest.get(version) if version else None
+    if entry and _is_executable(entry["path"]):
+        print(f"[DRIVER] Using cached chromedriver for Chrome {version}: {entry['path']}")
+        return entry["path"]
+
+    if offline:
+        return _resolve_offline(manifest, version)
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver_path = _fix_driver_path(ChromeDriverManager().install())
+    if version:
+        _save_manifest_entry(version, driver_path)
+    print(f"[DRIVER] Resolved chromedriver for Chrome {version or 'unknown'}: {driver_path}")
+    return driver_path
+
+
+def _resolve_offline(manifest, version):
+    """Pick a chromedriver without any network access."""
+    cached = sorted(
+        (entry for entry in manifest.values() if _is_executable(entry["path"])),
+        key=lambda entry: entry.get("resolved_at", 0),
+        reverse=True,
+    )
+    if cached:
+        print(f"[DRIVER] [OFFLINE] Chrome {version or 'unknown'} not in manifest, "
+              f"using newest cached chromedriver: {cached[0]['path']}")
+        return cached[0]["path"]
+
+    on_path = shutil.which("chromedriver")
+    if on_path:
+        print(f"[DRIVER] [OFFLINE] Using chromedriver from PATH: {on_path}")
+        return on_path
+
+    raise RuntimeError(
+        "Offline driver mode: no cached chromedriver found. Run once online, "
+        "set CHROMEDRIVER_PATH, or put chromedriver on PATH."
+    )
+
+
+def _fix_driver_path(driver_path):
+    """webdriver-manager sometimes returns the THIRD_PARTY_NOTICES file instead of the binary."""
+    if "THIRD_PARTY_NOTICES" in driver_path:
+        binary = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+        driver_path = os.path.join(os.path.dirname(driver_path), binary)
+    return driver_path
+
+
+def _detect_chrome_version():
+    """Return the installed Chrome version, or None when it cannot be determined.
+
+    The answer (including None) is kept for the process: the probe shells out
+    to the browser, and a failed resolve must not repeat it on every pool thread.
+    """
+    global _chrome_version
+    if _chrome_version is _NOT_DETECTED:
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+            _chrome_version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+        except Exception:
+            _chrome_version = None
+    return _chrome_version
+
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+# -----------------------------------------------------
+# MANIFEST
+# -----------------------------------------------------
+def _manifest_path():
+    return os.path.join(Config.DRIVER_CACHE_DIR, MANIFEST_NAME)
+
+
+def _load_manifest():
+    try:
+        with open(_manifest_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest_entry(version, driver_path):
+    """Merge one entry into the manifest; the write is atomic so parallel runs never see a partial file."""
+    try:
+        os.makedirs(Config.DRIVER_CACHE_DIR, exist_ok=True)
+        manifest = _load_manifest()
+        manifest[version] = {"path": driver_path, "resolved_at": time.time()}
+        tmp_path = f"{_manifest_path()}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, _manifest_path())
+    except OSError as e:
+        print(f"[DRIVER] [WARN] Could not write chromedriver manifest: {e}")
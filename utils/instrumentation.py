@@ -0,0 +1,114 @@
+import sys
+import threading
+import time
+
+from utils.call_site import skip_file
+
+# The one patch of time.sleep and driver.execute that every observer (sleep
+# profiler, WebDriver tracer, benchmark probe) subscribes to. Hooks are kept in
+# tuples that are replaced, never mutated, so the hot path reads them unlocked.
+
+skip_file(__file__)
+
+_lock = threading.Lock()
+_sleep_hooks = ()
+_real_sleep = time.sleep
+
+
+def _instrumented_sleep(seconds):
+    frame = sys._getframe(1)
+    started = time.perf_counter()
+    try:
+        return _real_sleep(seconds)
+    finally:
+        elapsed = time.perf_counter() - started
+        for hook in _sleep_hooks:
+            hook(seconds, started, elapsed, frame)
+
+
+def subscribe_sleep(callback):
+    """Call `callback(seconds, started, elapsed, frame)` after every time.sleep in the process.
+
+    `started` is a time.perf_counter() value, `frame` the caller of sleep.
+    time.sleep is patched while at least one callback is subscribed.
+    Returns a function that unsubscribes the callback.
+    """
+    global _sleep_hooks, _real_sleep
+    with _lock:
+        if not _sleep_hooks and time.sleep is not _instrumented_sleep:
+            _real_sleep = time.sleep
+            time.sleep = _instrumented_sleep
+        _sleep_hooks += (callback,)
+
+    def unsubscribe():
+        global _sleep_hooks
+        with _lock:
+            if callback not in _sleep_hooks:
+                return
+            hooks = list(_sleep_hooks)
+            hooks.remove(callback)
+            _sleep_hooks = tuple(hooks)
+            if not _sleep_hooks and time.sleep is _instrumented_sleep:
+                time.sleep = _real_sleep
+
+    return unsubscribe
+
+
+class _ExecuteHooks:
+    """The instance-level execute wrapper installed on one driver."""
+
+    def __init__(self, driver):
+        self.hooks = ()
+        self.original = driver.execute
+        # Restore an execute set on the instance itself; otherwise drop ours
+        self.restore = "execute" in vars(driver)
+        hooks = self
+
+        def instrumented_execute(driver_command, params=None):
+            frame = sys._getframe(1)
+            started = time.perf_counter()
+            response = error = None
+            try:
+                response = hooks.original(driver_command, params)
+                return response
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                for hook in hooks.hooks:
+                    hook(driver_command, params, response, error, started, elapsed, frame)
+
+        driver.execute = instrumented_execute
+
+
+def subscribe_execute(driver, callback):
+    """Call `callback(command, params, response, error, started, elapsed, frame)` after every command `driver` sends.
+
+    `driver.execute` is the funnel for every WebDriver command. It is wrapped
+    on the instance while at least one callback is subscribed. `error` is the
+    exception the command raised (None on success); `started` is a
+    time.perf_counter() value, `frame` the caller of execute.
+    Returns a function that unsubscribes the callback.
+    """
+    with _lock:
+        state = vars(driver).get("_pulse_execute_hooks")
+        if state is None:
+            state = driver._pulse_execute_hooks = _ExecuteHooks(driver)
+        state.hooks += (callback,)
+
+    def unsubscribe():
+        with _lock:
+            if callback not in state.hooks:
+                return
+            hooks = list(state.hooks)
+            hooks.remove(callback)
+            state.hooks = tuple(hooks)
+            if not state.hooks and vars(driver).get("_pulse_execute_hooks") is state:
+                if state.restore:
+                    driver.execute = state.original
+                else:
+                    del driver.execute
+                del driver._pulse_execute_hooks
+
+    return unsubscribe
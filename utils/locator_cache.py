@@ -0,0 +1,74 @@
+import json
+import os
+import threading
+
+from config.config import Config
+
+
+class LocatorStrategyCache:
+    """Persistent record of which fallback locator worked for each logical element.
+
+    Page objects that keep an ordered list of fallback locators (login button,
+    camera trigger, expand-all button, ...) look up the strategy that won last
+    time and try it first. The map ({name: [by, value]}) survives across runs
+    in a small JSON file.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or Config.LOCATOR_CACHE_FILE
+        self._lock = threading.Lock()
+        self._strategies = None
+
+    def _load(self):
+        if self._strategies is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._strategies = json.load(f)
+            except (OSError, ValueError):
+                self._strategies = {}
+        return self._strategies
+
+    def preferred(self, name):
+        """Return the (By, value) locator that last worked for `name`, or None."""
+        with self._lock:
+            locator = self._load().get(name)
+        return tuple(locator) if isinstance(locator, list) else None
+
+    def record(self, name, locator):
+        """Remember that `locator` worked for `name` (written only when it changes)."""
+        locator = list(locator)
+        with self._lock:
+            strategies = self._load()
+            if strategies.get(name) == locator:
+                return
+            strategies[name] = locator
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(strategies, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                print(f"[LOCATOR] [WARN] Could not save locator cache: {e}")
+
+    def order(self, name, locators):
+        """Indexes into `locators` to try, the learned one first.
+
+        The learned locator is matched by value, not position, so reordering
+        or editing a page object's list never promotes a different strategy;
+        a learned locator no longer in the list is ignored.
+        """
+        preferred = self.preferred(name)
+        indexes = list(range(len(locators)))
+        for index, locator in enumerate(locators):
+            if tuple(locator) == preferred:
+                indexes.remove(index)
+                indexes.insert(0, index)
+                break
+        return indexes
+
+
+# Shared by all page objects in this process
+locator_cache = LocatorStrategyCache()
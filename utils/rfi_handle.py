@@ -0,0 +1,70 @@
+import json
+import os
+import uuid
+
+# Env var naming the file a scenario's steps share their RFI handle through
+HANDLE_FILE_ENV = "PULSE_RFI_HANDLE_FILE"
+
+
+class RfiHandle:
+    """Identifies one RFI across the roles of a lifecycle scenario.
+
+    `reference` is a unique token the contractor writes into the RFI (it is
+    appended to the sub contractor name), so the RFI can be found through the
+    list search before its number is known. `rfi_id` is the number the app
+    assigned, captured from the submit confirmation when available.
+    """
+
+    def __init__(self, reference, rfi_id=None, created_by=None):
+        self.reference = reference
+        self.rfi_id = rfi_id
+        self.created_by = created_by
+
+    @classmethod
+    def new(cls, created_by=None):
+        return cls(f"AT-{uuid.uuid4().hex[:10].upper()}", created_by=created_by)
+
+    @property
+    def search_text(self):
+        """What to type into the RFI list search: the number if known, else the reference."""
+        return self.rfi_id or self.reference
+
+    def to_dict(self):
+        return {"reference": self.reference, "rfi_id": self.rfi_id, "created_by": self.created_by}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["reference"], data.get("rfi_id"), data.get("created_by"))
+
+    def __repr__(self):
+        return f"RfiHandle(reference={self.reference!r}, rfi_id={self.rfi_id!r})"
+
+
+def save_handle(handle, path=None):
+    """Publish `handle` to the later steps of this scenario.
+
+    Written to `path` (default: $PULSE_RFI_HANDLE_FILE), which run_tests.py
+    sets per scenario. Without a file nothing is shared: a plain pytest run
+    would otherwise hand one RFI to several independent tests.
+    """
+    path = path or os.environ.get(HANDLE_FILE_ENV)
+    if not path:
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(handle.to_dict(), f, indent=2)
+    print(f"[HANDLE] Saved {handle} to {path}")
+
+
+def load_handle(path=None):
+    """The scenario's current RFI handle, or None (steps then fall back to the first row)."""
+    path = path or os.environ.get(HANDLE_FILE_ENV)
+    if not path:
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            return RfiHandle.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError):
+        return None
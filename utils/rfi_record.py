@@ -0,0 +1,95 @@
+import csv
+import json
+import os
+
+# Tracker checkpoint used by the suite's default RFI
+TRACKER_CHECKPOINT = (
+    "If Tracker: Tracker Alignment, Tightening & Torquing up to Torque Tube incl. Transmission Shaft "
+    "If Fixed Tilt: Fixed Tilt Alignment, Tightening & Torquing up to bracing, perlin and all asembly parts"
+)
+
+# Dataset columns a row must have; everything else falls back to DEFAULTS
+REQUIRED_FIELDS = ["plot", "block", "package", "activity", "locations", "quantity"]
+
+DEFAULTS = {
+    "plot": "S05b",
+    "block": "BL05",
+    "package": "Civil",
+    "subpackage": "MMS Installation",
+    "activity": "MMS Installation",
+    "subactivity": None,  # same as activity
+    "locations": ["R01-T01", "R01-T02"],
+    "quantity": "25",
+    "unit": "MTR",
+    "subcontractor": "TechBuild Contractors Pvt Ltd",
+    "checkpoint": TRACKER_CHECKPOINT,
+    "checklist": "PV Module Mounting Structure Installation Protocol - Tracker",
+}
+
+
+class RfiRecord:
+    """The values CreateRfiPage.fill_form enters for one RFI.
+
+    `RfiRecord()` is the suite's standard RFI; datasets override any field.
+    Locations are a list (in CSV: separated by ';' or '|').
+    """
+
+    FIELDS = list(DEFAULTS)
+
+    def __init__(self, **values):
+        unknown = set(values) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown RFI field(s): {', '.join(sorted(unknown))}")
+        for name in self.FIELDS:
+            value = values.get(name)
+            setattr(self, name, DEFAULTS[name] if value in (None, "", []) else value)
+        if isinstance(self.locations, str):
+            self.locations = [loc.strip() for loc in self.locations.replace("|", ";").split(";") if loc.strip()]
+        self.quantity = str(self.quantity)
+        self.subactivity = self.subactivity or self.activity
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __repr__(self):
+        return (f"RfiRecord({self.plot}/{self.block}/{self.package}/{self.activity}, "
+                f"{len(self.locations)} location(s), {self.quantity} {self.unit})")
+
+
+def load_records(path):
+    """Read RfiRecords from a .csv (header row) or .json (list of objects) file.
+
+    Raises ValueError naming the file (and the row, where there is one) for
+    malformed files, missing or empty required columns and unknown columns.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding="utf-8", newline="") as f:
+        if extension == ".json":
+            try:
+                rows = json.load(f)
+            except ValueError as e:
+                raise ValueError(f"{path}: invalid JSON ({e})")
+            if not isinstance(rows, list):
+                raise ValueError(f"{path}: expected a list of RFI objects")
+        elif extension == ".csv":
+            rows = list(csv.DictReader(f))
+        else:
+            raise ValueError(f"Unsupported dataset format '{extension}' (use .csv or .json)")
+
+    records = []
+    for number, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            raise ValueError(f"{path} row {number}: expected an object, got {type(row).__name__}")
+        if None in row:
+            # csv.DictReader files values beyond the header under the key None
+            raise ValueError(f"{path} row {number}: more values than columns")
+        row = {key.strip().lower(): value.strip() if isinstance(value, str) else value
+               for key, value in row.items() if key}
+        missing = [name for name in REQUIRED_FIELDS if row.get(name) in (None, "", [])]
+        if missing:
+            raise ValueError(f"{path} row {number}: missing {', '.join(missing)}")
+        try:
+            records.append(RfiRecord(**row))
+        except ValueError as e:
+            raise ValueError(f"{path} row {number}: {e}")
+    return records
@@ -0,0 +1,86 @@
+import threading
+
+from utils.api_client import PulseApiClient
+from utils.rfi_handle import RfiHandle
+from utils.rfi_record import RfiRecord
+
+# Lifecycle stages RfiSeeder.seed() can prepare, named after the screen that
+# works on them next, and the API actions (role, action, payload) that lead there
+STAGES = {
+    "pending_review": [],
+    "pending_approval": [
+        ("block_engineer", "review", {"decision": "approve", "comments": "Seeded through the API"}),
+    ],
+    "pending_inspection": [
+        ("block_engineer", "review", {"decision": "approve", "comments": "Seeded through the API"}),
+    ],
+    "inspected": [
+        ("block_engineer", "review", {"decision": "approve", "comments": "Seeded through the API"}),
+        ("quality_inspector", "inspect", {"result": "pass", "findings": "Seeded through the API", "checks": []}),
+    ],
+}
+
+
+class RfiSeeder:
+    """Creates RFIs and advances them through the lifecycle via the JSON API.
+
+    Replaces the UI precondition chain (create -> review -> inspect) for tests
+    of a single role: each step is one API call made as the role that owns it.
+    One logged-in PulseApiClient per role is kept for the whole run.
+
+    Usage:
+        seeder = RfiSeeder()
+        handle = seeder.seed("pending_inspection")   # RfiHandle with rfi_id set
+        seeder.close()
+    """
+
+    def __init__(self, base_url=None):
+        self.base_url = base_url
+        self._clients = {}
+        self._questions = None
+        self._lock = threading.Lock()
+
+    def client(self, role):
+        """The logged-in API client for `role` (logs in on first use)."""
+        with self._lock:
+            if role not in self._clients:
+                self._clients[role] = PulseApiClient(self.base_url).login(role)
+            return self._clients[role]
+
+    def create(self, record=None, handle=None):
+        """Submit a new RFI as the contractor; returns its RfiHandle."""
+        record = record or RfiRecord()
+        handle = handle or RfiHandle.new(created_by="contractor")
+        client = self.client("contractor")
+        if self._questions is None:
+            self._questions = client.get("/questions")["questions"]
+        fields = record.to_dict()
+        fields["location"] = fields.pop("locations")
+        # Same reference the UI flow appends, so list searches find the RFI either way
+        fields["subcontractor"] = f"{record.subcontractor} {handle.reference}"
+        body = client.post("/rfis", {
+            "fields": fields,
+            "observations": [f"Q{number}: OK - seeded through the API" for number in range(1, len(self._questions) + 1)],
+            "photos": 0,
+        })
+        handle.rfi_id = body["rfi"]["id"]
+        return handle
+
+    def advance(self, handle, role, action, payload=None):
+        """Run one lifecycle action on the RFI as `role`; returns the updated RFI."""
+        return self.client(role).post(f"/rfis/{handle.rfi_id}/{action}", payload)["rfi"]
+
+    def seed(self, stage, record=None):
+        """A new RFI at `stage` (see STAGES); returns its RfiHandle."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown RFI stage '{stage}' (expected one of {', '.join(STAGES)})")
+        handle = self.create(record)
+        for role, action, payload in STAGES[stage]:
+            self.advance(handle, role, action, payload)
+        print(f"[SEED] {handle} is {stage}")
+        return handle
+
+    def close(self):
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
@@ -0,0 +1,174 @@
+import os
+import re
+
+import pytest
+
+# Step states, as reported by ScenarioSelectionPlugin.status
+PASSED = "passed"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+def parse_selection(pytest_args):
+    """Split a step's pytest args into (paths, keyword expr, marker expr)."""
+    paths, keyword, marker = [], None, None
+    args = iter(pytest_args)
+    for arg in args:
+        if arg == "-k":
+            keyword = next(args, None)
+        elif arg == "-m":
+            marker = next(args, None)
+        elif not arg.startswith("-"):
+            paths.append(arg.replace(os.sep, "/"))
+    return paths, keyword, marker
+
+
+_TOKEN = re.compile(r"\s*(\(|\)|[^\s()]+)")
+
+
+def evaluate(expression, matches):
+    """Evaluate a -k/-m style expression ("a and not (b or c)").
+
+    `matches(name)` decides each bare name. Supports the and/or/not and
+    parentheses grammar the step selections use; raises ValueError on
+    anything else. Kept local because pytest's own parser is private API.
+    """
+    tokens = _TOKEN.findall(expression)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        token = peek()
+        if token is None:
+            raise ValueError(f"unexpected end of expression: {expression!r}")
+        position += 1
+        return token
+
+    def parse_or():
+        result = parse_and()
+        while peek() == "or":
+            take()
+            result = parse_and() or result
+        return result
+
+    def parse_and():
+        result = parse_not()
+        while peek() == "and":
+            take()
+            result = parse_not() and result
+        return result
+
+    def parse_not():
+        token = take()
+        if token == "not":
+            return not parse_not()
+        if token == "(":
+            result = parse_or()
+            if take() != ")":
+                raise ValueError(f"expected ')' in expression: {expression!r}")
+            return result
+        if token in (")", "and", "or"):
+            raise ValueError(f"unexpected {token!r} in expression: {expression!r}")
+        return bool(matches(token))
+
+    result = parse_or()
+    if peek() is not None:
+        raise ValueError(f"unexpected {peek()!r} in expression: {expression!r}")
+    return result
+
+
+def selects(item, paths, keyword, marker):
+    """True when a step with this selection would run `item` on its own."""
+    nodeid = item.nodeid
+    if paths and not any(nodeid == path or nodeid.startswith(path.rstrip("/") + "/")
+                         or nodeid.startswith(path + "::") for path in paths):
+        return False
+    if keyword and not evaluate(keyword, lambda name: any(name.lower() in word.lower() for word in item.keywords)):
+        return False
+    if marker and not evaluate(marker, lambda name: item.get_closest_marker(name) is not None):
+        return False
+    return True
+
+
+class ScenarioSelectionPlugin:
+    """pytest plugin: run the steps of one or more scenarios in a single session.
+
+    Each step is {"id", "scenario", "pytest_args", "env"} - the pytest args a
+    step would get as its own subprocess, and extra environment for its tests
+    (the scenario's RFI handle file). The collected tests are narrowed to the
+    steps' selections and put in step order, so session-scoped role drivers
+    log in once and are reused by every step. Before each test its step's env
+    is applied; once a step fails, the later steps of its scenario are skipped.
+
+    Usage:
+        plugin = ScenarioSelectionPlugin(steps)
+        pytest.main(["tests/", "-v"], plugins=[plugin])
+        plugin.status, plugin.durations
+    """
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.status = {}
+        self.durations = {}
+        self._step_of = {}
+        self._failed_scenarios = set()
+        self._saved_env = {}
+
+    def pytest_collection_modifyitems(self, config, items):
+        selected = []
+        for step in self.steps:
+            paths, keyword, marker = parse_selection(step["pytest_args"])
+            mine = [item for item in items if selects(item, paths, keyword, marker)]
+            taken = [item for item in mine if item.nodeid in self._step_of]
+            if taken:
+                # One session runs a test once; it can't serve two steps
+                print(f"[SCENARIO] [ERROR] {step['id']}: {taken[0].nodeid} already runs "
+                      f"in {self._step_of[taken[0].nodeid]['id']} - run these scenarios separately")
+                self.status[step["id"]] = FAILED
+                self._failed_scenarios.add(step["scenario"])
+                continue
+            if not mine:
+                print(f"[SCENARIO] [ERROR] {step['id']}: no tests selected by {' '.join(step['pytest_args'])}")
+                self.status[step["id"]] = FAILED
+                self._failed_scenarios.add(step["scenario"])
+                continue
+            for item in mine:
+                self._step_of[item.nodeid] = step
+            selected.extend(mine)
+
+        deselected = [item for item in items if item.nodeid not in self._step_of]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        # Runs before fixture setup, so fixtures like rfi_handle see the step's env
+        step = self._step_of[item.nodeid]
+        for key, value in step.get("env", {}).items():
+            self._saved_env.setdefault(key, os.environ.get(key))
+            os.environ[key] = value
+        if step["scenario"] in self._failed_scenarios and self.status.get(step["id"]) != FAILED:
+            self.status[step["id"]] = SKIPPED
+            pytest.skip(f"an earlier step of {step['scenario']} failed")
+
+    def pytest_runtest_logreport(self, report):
+        step = self._step_of.get(report.nodeid)
+        if step is None or self.status.get(step["id"]) == SKIPPED:
+            return
+        self.durations[step["id"]] = self.durations.get(step["id"], 0.0) + report.duration
+        if report.failed:
+            self.status[step["id"]] = FAILED
+            self._failed_scenarios.add(step["scenario"])
+        else:
+            self.status.setdefault(step["id"], PASSED)
+
+    def pytest_sessionfinish(self, session):
+        for key, value in self._saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
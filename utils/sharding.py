@@ -0,0 +1,172 @@
+import json
+import os
+import statistics
+import tempfile
+import threading
+
+# Used for tests with no recorded duration while nothing is known yet
+DEFAULT_TEST_SECONDS = 30.0
+
+
+class DurationHistory:
+    """Per-test durations, smoothed with an exponential moving average.
+
+    Stored as {"nodeid": seconds} in a JSON file that every shard reads, so
+    all shards compute the same split. Saving re-reads the file first, so
+    shards finishing at different times don't drop each other's updates.
+    """
+
+    def __init__(self, path, alpha=0.3):
+        self.path = path
+        self.alpha = alpha
+        self.durations = self._read()
+        self._updates = {}
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {nodeid: float(seconds) for nodeid, seconds in data.items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def estimate(self, nodeid):
+        """Expected seconds for `nodeid`: its history, else the median of known tests."""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return DEFAULT_TEST_SECONDS
+
+    def add(self, nodeid, seconds):
+        """Accumulate time for a test (setup, call and teardown are added up)."""
+        with self._lock:
+            self._updates[nodeid] = self._updates.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        with self._lock:
+            updates, self._updates = self._updates, {}
+        if not updates:
+            return
+        durations = self._read()
+        for nodeid, seconds in updates.items():
+            previous = durations.get(nodeid)
+            durations[nodeid] = seconds if previous is None else \
+                self.alpha * seconds + (1 - self.alpha) * previous
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(durations.items())), f, indent=2)
+        os.replace(tmp, self.path)
+        self.durations = durations
+
+
+def plan_shards(tests, shard_count, login_seconds):
+    """Split tests into `shard_count` shards, keeping role groups together.
+
+    Args:
+        tests: [(nodeid, role_key, seconds)] - role_key is the (sorted) tuple
+               of roles the test logs in as; () for tests without a login
+        shard_count: number of shards
+        login_seconds: estimated cost of logging a shard in as a role
+
+    Groups bigger than an even share are split into chunks so one role can't
+    pin a single shard. Chunks are then placed longest first (LPT) on the
+    shard where they finish earliest, counting a login only when the shard
+    doesn't have that role yet.
+
+    Returns [{"nodeids": set, "roles": set, "seconds": float}] per shard.
+    """
+    groups = {}
+    for nodeid, role_key, seconds in tests:
+        groups.setdefault(role_key, []).append((nodeid, seconds))
+
+    total = sum(seconds for _, _, seconds in tests)
+    target = total / shard_count if shard_count else total
+
+    chunks = []
+    for role_key, members in groups.items():
+        size = sum(seconds for _, seconds in members)
+        parts = max(1, min(len(members), shard_count, int(size // target) if target else 1))
+        buckets = [[0.0, []] for _ in range(parts)]
+        for nodeid, seconds in sorted(members, key=lambda m: (-m[1], m[0])):
+            bucket = min(buckets, key=lambda b: b[0])
+            bucket[0] += seconds
+            bucket[1].append(nodeid)
+        chunks.extend((seconds, role_key, nodeids) for seconds, nodeids in buckets if nodeids)
+
+    shards = [{"nodeids": set(), "roles": set(), "seconds": 0.0} for _ in range(shard_count)]
+    for seconds, role_key, nodeids in sorted(chunks, key=lambda c: (-c[0], c[1], sorted(c[2]))):
+        def finish(index):
+            shard = shards[index]
+            logins = sum(login_seconds for role in role_key if role not in shard["roles"])
+            return shard["seconds"] + seconds + logins, index
+
+        best = min(range(shard_count), key=finish)
+        shard = shards[best]
+        shard["seconds"] = finish(best)[0]
+        shard["roles"].update(role_key)
+        shard["nodeids"].update(nodeids)
+    return shards
+
+
+class ShardingPlugin:
+    """pytest plugin: run only this process's shard of the collected tests.
+
+    Role fixtures are session-scoped, so every role a shard touches costs a
+    browser login; tests are grouped by the role fixtures they request and
+    balanced with the recorded durations from DurationHistory.
+    """
+
+    def __init__(self, shard_index, shard_count, history, role_fixtures, login_seconds):
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.history = history
+        self.role_fixtures = role_fixtures
+        self.login_seconds = login_seconds
+        self.shards = None
+
+    def role_key(self, item):
+        fixtures = getattr(item, "fixturenames", ())
+        return tuple(sorted({self.role_fixtures[name] for name in fixtures if name in self.role_fixtures}))
+
+    def pytest_collection_modifyitems(self, config, items):
+        tests = [(item.nodeid, self.role_key(item), self.history.estimate(item.nodeid)) for item in items]
+        self.shards = plan_shards(tests, self.shard_count, self.login_seconds)
+        mine = self.shards[self.shard_index]["nodeids"]
+
+        selected = [item for item in items if item.nodeid in mine]
+        deselected = [item for item in items if item.nodeid not in mine]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        # Collection order is kept so class/module fixtures stay grouped
+        items[:] = selected
+
+    def pytest_report_collectionfinish(self, config, startdir, items):
+        if self.shards is None:
+            return None
+        shard = self.shards[self.shard_index]
+        roles = ", ".join(sorted(shard["roles"])) or "none"
+        plan = " | ".join(f"{s['seconds']:.0f}s" for s in self.shards)
+        return [
+            f"[SHARD] {self.shard_index + 1}/{self.shard_count}: {len(items)} test(s), "
+            f"roles: {roles}, estimated {shard['seconds']:.0f}s",
+            f"[SHARD] Estimated shard durations: {plan}",
+        ]
+
+
+class DurationRecorder:
+    """pytest plugin: feeds setup/call/teardown durations into DurationHistory."""
+
+    def __init__(self, history):
+        self.history = history
+
+    def pytest_runtest_logreport(self, report):
+        if report.outcome != "skipped":
+            self.history.add(report.nodeid, report.duration)
+
+    def pytest_sessionfinish(self, session):
+        self.history.save()
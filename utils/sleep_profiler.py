@@ -0,0 +1,116 @@
+import threading
+from collections import defaultdict
+
+from utils.call_site import call_site, skip_file
+from utils.instrumentation import subscribe_execute, subscribe_sleep
+
+# Find commands that block for the driver's implicit wait when nothing matches
+_FIND_COMMANDS = {"findElement", "findElements", "findChildElement", "findChildElements"}
+# Label for idle time outside any test (fixture-less helpers, pool threads)
+OUTSIDE_TESTS = "(outside tests)"
+
+skip_file(__file__)
+
+
+class _Site:
+    """Idle time accumulated at one call site."""
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.by_test = defaultdict(float)
+
+
+class SleepProfiler:
+    """Accounts for idle wall-clock time: time.sleep and implicit-wait misses.
+
+    `start()` subscribes to time.sleep for the whole process (through
+    utils.instrumentation), so explicit sleeps in page objects and
+    WebDriverWait polling are both caught. `attach(driver)` subscribes to the
+    driver's commands to catch find commands that came back empty -
+    those blocked for the full implicit wait (Config.IMPLICIT_WAIT). Each idle
+    period is attributed to the innermost repo file:line and the current test.
+
+    Usage:
+        profiler = SleepProfiler().start()
+        driver = profiler.attach(create_chrome_driver())
+        profiler.current_test = "tests/test_login.py::test_valid_login"
+        ...
+        profiler.stop()
+        for line in profiler.report_lines(): print(line)
+    """
+
+    def __init__(self):
+        self.current_test = None
+        self._sites = defaultdict(_Site)
+        self._lock = threading.Lock()
+        self._unsubscribe_sleep = None
+
+    def start(self):
+        self._unsubscribe_sleep = subscribe_sleep(self._on_sleep)
+        return self
+
+    def stop(self):
+        if self._unsubscribe_sleep is not None:
+            self._unsubscribe_sleep()
+            self._unsubscribe_sleep = None
+
+    def attach(self, driver):
+        """Account implicit-wait misses of `driver`; returns the driver."""
+        subscribe_execute(driver, self._on_command)
+        return driver
+
+    def _on_command(self, command, params, response, error, started, elapsed, frame):
+        if command not in _FIND_COMMANDS:
+            return
+        if error is not None:
+            if type(error).__name__ == "NoSuchElementException":
+                self._record("implicit_wait", elapsed, frame)
+        elif isinstance(response, dict) and response.get("value") == []:
+            self._record("implicit_wait", elapsed, frame)
+
+    def _on_sleep(self, seconds, started, elapsed, frame):
+        self._record("sleep", elapsed, frame)
+
+    def _record(self, kind, seconds, frame):
+        site = call_site(frame) or "(library)"
+        test = self.current_test or OUTSIDE_TESTS
+        with self._lock:
+            entry = self._sites[(kind, site)]
+            entry.calls += 1
+            entry.seconds += seconds
+            entry.by_test[test] += seconds
+
+    # -----------------------------------------------------
+    # REPORTING
+    # -----------------------------------------------------
+    def total(self, kind=None):
+        with self._lock:
+            return sum(entry.seconds for (k, _), entry in self._sites.items() if kind in (None, k))
+
+    def ranked(self):
+        """[(kind, site, _Site)] sorted by idle seconds, largest first."""
+        with self._lock:
+            items = [(kind, site, entry) for (kind, site), entry in self._sites.items()]
+        return sorted(items, key=lambda item: item[2].seconds, reverse=True)
+
+    def report_lines(self, top=25):
+        ranked = self.ranked()
+        if not ranked:
+            return ["No sleeps or implicit-wait misses recorded."]
+        calls = sum(entry.calls for _, _, entry in ranked)
+        lines = [
+            f"Total idle: {self.total():.2f}s in {calls} calls "
+            f"(time.sleep {self.total('sleep'):.2f}s, implicit wait {self.total('implicit_wait'):.2f}s)",
+            "",
+            f"{'#':>3}  {'idle s':>8}  {'calls':>6}  {'kind':<13}  {'site':<48}  top test",
+        ]
+        for rank, (kind, site, entry) in enumerate(ranked[:top], 1):
+            test, seconds = max(entry.by_test.items(), key=lambda item: item[1])
+            more = f" +{len(entry.by_test) - 1} more" if len(entry.by_test) > 1 else ""
+            lines.append(f"{rank:>3}  {entry.seconds:>8.2f}  {entry.calls:>6}  {kind:<13}  {site:<48}  "
+                         f"{test} ({seconds:.1f}s){more}")
+        if len(ranked) > top:
+            rest = sum(entry.seconds for _, _, entry in ranked[top:])
+            lines.append(f"     ... {len(ranked) - top} more call sites, {rest:.2f}s")
+        return lines
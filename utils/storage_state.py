@@ -0,0 +1,135 @@
+import json
+import os
+import time
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config import Config
+
+# Same-origin URL loaded before injecting state; it only needs to put the
+# browser on the app's origin, not render the app
+BOOTSTRAP_PATH = "/favicon.ico"
+
+_DUMP_STORAGE_JS = """
+const dump = (storage) => {
+    const data = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        data[key] = storage.getItem(key);
+    }
+    return data;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_LOAD_STORAGE_JS = """
+const [local, session] = arguments;
+Object.entries(local).forEach(([k, v]) => window.localStorage.setItem(k, v));
+Object.entries(session).forEach(([k, v]) => window.sessionStorage.setItem(k, v));
+"""
+
+_APP_SETTLED_JS = """
+return document.readyState === 'complete'
+    && !!document.body && document.body.innerText.trim().length > 0;
+"""
+
+
+class StorageStateCache:
+    """Per-role snapshot of cookies, localStorage and sessionStorage.
+
+    After the first successful UI login for a role the session state is saved to
+    disk. Later fixtures - in this or any other pytest process - inject it into a
+    fresh driver instead of driving the login form again. A snapshot is dropped
+    when it is older than `ttl` seconds, contains expired cookies, or the app
+    rejects it (redirects back to /login).
+    """
+
+    def __init__(self, directory=None, ttl=None):
+        self.directory = directory or Config.STORAGE_STATE_DIR
+        self.ttl = Config.STORAGE_STATE_TTL if ttl is None else ttl
+
+    def _path(self, role):
+        return os.path.join(self.directory, f"{role}.json")
+
+    # -----------------------------------------------------
+    # PERSISTENCE
+    # -----------------------------------------------------
+    def load(self, role, username):
+        """Return the saved state for `role`, or None if missing, stale or for another user."""
+        try:
+            with open(self._path(role), encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if state.get("base_url") != Config.BASE_URL or state.get("username") != username:
+            return None
+
+        now = time.time()
+        expired_cookie = any(cookie.get("expiry", now + 1) <= now for cookie in state.get("cookies", []))
+        if now - state.get("saved_at", 0) > self.ttl or expired_cookie:
+            print(f"[AUTH] Storage state for '{role}' expired")
+            self.invalidate(role)
+            return None
+        return state
+
+    def save(self, driver, role, username):
+        """Snapshot the session state of a logged-in driver."""
+        try:
+            storage = driver.execute_script(_DUMP_STORAGE_JS)
+            state = {
+                "base_url": Config.BASE_URL,
+                "username": username,
+                "saved_at": time.time(),
+                "cookies": driver.get_cookies(),
+                "local_storage": storage["local"],
+                "session_storage": storage["session"],
+            }
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self._path(role)}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self._path(role))
+            print(f"[AUTH] Saved storage state for '{role}'")
+        except Exception as e:
+            print(f"[AUTH] [WARN] Could not save storage state for '{role}': {e}")
+
+    def invalidate(self, role):
+        try:
+            os.remove(self._path(role))
+        except OSError:
+            pass
+
+    # -----------------------------------------------------
+    # INJECTION
+    # -----------------------------------------------------
+    def restore(self, driver, role, username):
+        """Inject the saved state into `driver`. Returns True if the app accepted it."""
+        state = self.load(role, username)
+        if state is None:
+            return False
+
+        try:
+            driver.get(f"{Config.BASE_URL}{BOOTSTRAP_PATH}")
+            for cookie in state["cookies"]:
+                cookie = dict(cookie)
+                if "expiry" in cookie:
+                    cookie["expiry"] = int(cookie["expiry"])
+                driver.add_cookie(cookie)
+            driver.execute_script(_LOAD_STORAGE_JS, state["local_storage"], state["session_storage"])
+
+            driver.get(f"{Config.BASE_URL}/welcome")
+            WebDriverWait(driver, Config.EXPLICIT_WAIT).until(
+                lambda d: "/login" in d.current_url.lower() or d.execute_script(_APP_SETTLED_JS)
+            )
+            if "/login" in driver.current_url.lower():
+                print(f"[AUTH] Storage state for '{role}' rejected by the app")
+                self.invalidate(role)
+                return False
+        except Exception as e:
+            print(f"[AUTH] [WARN] Could not restore storage state for '{role}': {e}")
+            self.invalidate(role)
+            return False
+
+        print(f"[AUTH] Restored '{role}' session from storage state (UI login skipped)")
+        return True
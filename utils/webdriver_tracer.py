@@ -0,0 +1,201 @@
+import json
+import os
+import re
+import threading
+import time
+
+from utils.call_site import call_site, frame_name, page_stack, skip_file
+from utils.instrumentation import subscribe_execute, subscribe_sleep
+
+# Label for commands issued outside any test (pool prewarm, session teardown)
+SESSION_TRACE = "session"
+
+skip_file(__file__)
+
+
+class _ThreadSpans:
+    """Page-object method spans currently open on one thread.
+
+    Spans are derived from the commands themselves: a method's span starts at
+    its first command and ends at its last one, so nested calls nest in the
+    trace without instrumenting every page-object method.
+    """
+
+    def __init__(self):
+        self.open = []  # [frame, name, start_us, end_us]
+
+
+class WebDriverTracer:
+    """Records every WebDriver command as a Chrome trace event.
+
+    `attach(driver)` subscribes to the driver's `execute` - the funnel for
+    every command - through utils.instrumentation and records the command's duration, the page-object method it
+    came from, the calling file:line and the current test. While a test runs,
+    `time.sleep` calls on the test thread (including WebDriverWait polling)
+    are recorded as well. Each test's events are written to
+    `<trace_dir>/<test>.<pid>.json` (the pid keeps parallel runs of the same
+    test apart), which opens in chrome://tracing or Perfetto.
+
+    Usage:
+        tracer = WebDriverTracer("traces")
+        driver = tracer.attach(create_chrome_driver())
+        tracer.begin_test("tests/test_login.py::test_valid_login")
+        ...
+        tracer.end_test()
+    """
+
+    def __init__(self, trace_dir="traces"):
+        self.trace_dir = trace_dir
+        self.current_test = None
+        self._events = []
+        # Commands recorded outside tests, written once by close()
+        self._session_events = []
+        self._lock = threading.Lock()
+        self._spans = {}
+        self._pid = os.getpid()
+        self._origin = time.perf_counter()
+        self._test_thread = None
+        self._unsubscribe_sleep = None
+
+    # -----------------------------------------------------
+    # INSTRUMENTATION
+    # -----------------------------------------------------
+    def attach(self, driver):
+        """Trace every command `driver` sends; returns the driver."""
+        subscribe_execute(driver, self._on_command)
+        return driver
+
+    def _on_command(self, command, params, response, error, started, elapsed, frame):
+        start = (started - self._origin) * 1_000_000
+        self._record_command(command, params, start, start + elapsed * 1_000_000,
+                             type(error).__name__ if error is not None else None, frame)
+
+    def _record_command(self, command, params, start, end, error, frame):
+        pages = page_stack(frame)
+        args = {"test": self.current_test or SESSION_TRACE}
+        if pages:
+            args["page_method"] = frame_name(pages[-1])
+        caller = call_site(frame)
+        if caller:
+            args["caller"] = caller
+        if command == "findElement" or command == "findElements":
+            args["locator"] = f"{params.get('using')}={params.get('value')}" if params else None
+        if error:
+            args["error"] = error
+
+        tid = threading.get_ident()
+        with self._lock:
+            self._update_spans(tid, pages, start, end)
+            self._events.append({
+                "name": command, "cat": "webdriver", "ph": "X",
+                "ts": start, "dur": end - start,
+                "pid": self._pid, "tid": tid, "args": args,
+            })
+
+    def _update_spans(self, tid, pages, start, end):
+        spans = self._spans.setdefault(tid, _ThreadSpans())
+        # Keep the common prefix of still-running methods, close the rest
+        depth = 0
+        while (depth < len(spans.open) and depth < len(pages)
+               and spans.open[depth][0] is pages[depth]):
+            depth += 1
+        self._close_spans(tid, spans, depth)
+        for frame in pages[depth:]:
+            spans.open.append([frame, frame_name(frame), start, end])
+        for span in spans.open:
+            span[3] = end
+
+    def _close_spans(self, tid, spans, depth=0):
+        while len(spans.open) > depth:
+            _, name, start, end = spans.open.pop()
+            self._events.append({
+                "name": name, "cat": "page", "ph": "X",
+                "ts": start, "dur": end - start,
+                "pid": self._pid, "tid": tid,
+                "args": {"test": self.current_test or SESSION_TRACE},
+            })
+
+    def _on_sleep(self, seconds, started, elapsed, frame):
+        if threading.get_ident() != self._test_thread:
+            return
+        start = (started - self._origin) * 1_000_000
+        args = {"test": self.current_test, "requested_s": seconds}
+        caller = call_site(frame)
+        if caller:
+            args["caller"] = caller
+        with self._lock:
+            self._events.append({
+                "name": "sleep", "cat": "sleep", "ph": "X",
+                "ts": start, "dur": elapsed * 1_000_000,
+                "pid": self._pid, "tid": self._test_thread, "args": args,
+            })
+
+    # -----------------------------------------------------
+    # TEST BOUNDARIES
+    # -----------------------------------------------------
+    def begin_test(self, nodeid):
+        """Start collecting events for `nodeid`."""
+        self._session_events.extend(self._drain())
+        self.current_test = nodeid
+        self._test_thread = threading.get_ident()
+        self._unsubscribe_sleep = subscribe_sleep(self._on_sleep)
+
+    def end_test(self):
+        """Write the current test's trace; returns its path (None if empty)."""
+        if self._unsubscribe_sleep is not None:
+            self._unsubscribe_sleep()
+            self._unsubscribe_sleep = None
+        path = self._write(self.current_test, self._drain())
+        self.current_test = None
+        self._test_thread = None
+        return path
+
+    def close(self):
+        """Write commands recorded outside tests to `<trace_dir>/session.<pid>.json`."""
+        events = self._session_events + self._drain()
+        self._session_events = []
+        return self._write(SESSION_TRACE, events)
+
+    def _drain(self):
+        """Close open spans and hand over everything recorded so far."""
+        with self._lock:
+            for tid, spans in self._spans.items():
+                self._close_spans(tid, spans)
+            events, self._events = self._events, []
+        return events
+
+    def _write(self, name, events):
+        if not events:
+            return None
+
+        commands = [e for e in events if e["cat"] == "webdriver"]
+        sleeps = [e for e in events if e["cat"] == "sleep"]
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": name}},
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+             "args": {"name": "test" if tid == self._test_thread else f"thread-{tid}"}}
+            for tid in sorted({e["tid"] for e in events})
+        ]
+        trace = {
+            "traceEvents": metadata + sorted(events, key=lambda e: e["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "test": name,
+                "commands": len(commands),
+                "command_seconds": round(sum(e["dur"] for e in commands) / 1_000_000, 3),
+                "sleep_seconds": round(sum(e["dur"] for e in sleeps) / 1_000_000, 3),
+            },
+        }
+
+        os.makedirs(self.trace_dir, exist_ok=True)
+        path = os.path.join(self.trace_dir, self._file_name(name))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+        other = trace["otherData"]
+        print(f"\n[TRACE] {name}: {other['commands']} commands ({other['command_seconds']}s), "
+              f"{other['sleep_seconds']}s sleeping -> {path}")
+        return path
+
+    def _file_name(self, name):
+        return f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_')}.{self._pid}.json"
@@ -0,0 +1,353 @@
+import hmac
+import json
+import socket
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Header carrying the shared secret on every coordinator request
+TOKEN_HEADER = "X-Pulse-Coordinator-Token"
+
+# Item states
+PENDING = "pending"
+LEASED = "leased"
+PASSED = "passed"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+class WorkQueue:
+    """Work items with dependencies, leased out to workers.
+
+    Items are dicts with at least "id" and "depends_on" (ids). An item becomes
+    leasable once all its dependencies passed; it is skipped when one failed
+    or was skipped. Data a worker reports with a result (e.g. the RFI handle
+    a step created) is handed to the items that depend on it as item["data"].
+    A lease that sees no heartbeat for `lease_timeout` seconds (worker died,
+    box went away) goes back to the queue. Every worker that polls is
+    remembered, so the coordinator can stay up until each one has been told
+    the run is over (wait_for_workers).
+    """
+
+    def __init__(self, items, lease_timeout=120):
+        self.items = {item["id"]: item for item in items}
+        self.order = [item["id"] for item in items]
+        self.lease_timeout = lease_timeout
+        self.status = {item_id: PENDING for item_id in self.order}
+        self.results = {}
+        self._leases = {}  # item id -> (worker, expires_at)
+        self._lock = threading.Lock()
+        self._workers = set()  # every worker that polled
+        self._released = set()  # workers told the run is over
+        self._workers_changed = threading.Condition(self._lock)
+        self._finished = threading.Event()
+        self._listeners = []
+        self._check_finished()
+
+    def on_result(self, callback):
+        """Call `callback(item, result)` for every reported or skipped item."""
+        self._listeners.append(callback)
+
+    # -----------------------------------------------------
+    # LEASING
+    # -----------------------------------------------------
+    def lease(self, worker):
+        """Next runnable item for `worker`, None if nothing is ready yet.
+
+        Raises StopIteration once every item is finished.
+        """
+        skipped = []
+        with self._lock:
+            self._workers.add(worker)
+            self._expire_leases()
+            item = None
+            for item_id in self.order:
+                if self.status[item_id] != PENDING:
+                    continue
+                deps = [self.status[dep] for dep in self.items[item_id]["depends_on"]]
+                if any(state in (FAILED, SKIPPED) for state in deps):
+                    self.status[item_id] = SKIPPED
+                    skipped.append(self.items[item_id])
+                elif all(state == PASSED for state in deps):
+                    item = dict(self.items[item_id], data=self._inherited_data(item_id))
+                    self.status[item_id] = LEASED
+                    self._leases[item_id] = (worker, time.monotonic() + self.lease_timeout)
+                    break
+            done = item is None and self._all_finished()
+            if done:
+                self._released.add(worker)
+                self._workers_changed.notify_all()
+        for skipped_item in skipped:
+            self._notify(skipped_item, {"status": SKIPPED})
+        self._check_finished()
+        if done:
+            raise StopIteration
+        return item
+
+    def _inherited_data(self, item_id):
+        data = {}
+        for dep in self.items[item_id]["depends_on"]:
+            data.update(self._inherited_data(dep))
+            data.update(self.results.get(dep, {}).get("data") or {})
+        return data
+
+    def heartbeat(self, item_id, worker):
+        """Extend `worker`'s lease on `item_id`; False if the lease was lost."""
+        with self._lock:
+            lease = self._leases.get(item_id)
+            if not lease or lease[0] != worker:
+                return False
+            self._leases[item_id] = (worker, time.monotonic() + self.lease_timeout)
+            return True
+
+    def complete(self, item_id, worker, returncode, duration=0.0, output="", data=None):
+        """Record a worker's result. Results for expired/re-leased items are ignored."""
+        with self._lock:
+            lease = self._leases.get(item_id)
+            if not lease or lease[0] != worker:
+                return False
+            del self._leases[item_id]
+            self.status[item_id] = PASSED if returncode == 0 else FAILED
+            result = {
+                "status": self.status[item_id],
+                "worker": worker,
+                "returncode": returncode,
+                "duration": duration,
+                "output": output,
+                "data": data or {},
+            }
+            self.results[item_id] = result
+        self._notify(self.items[item_id], result)
+        self._check_finished()
+        return True
+
+    def _expire_leases(self):
+        now = time.monotonic()
+        for item_id, (worker, expires_at) in list(self._leases.items()):
+            if expires_at < now:
+                print(f"[QUEUE] [WARN] Lease on {item_id} held by {worker} expired - re-queuing")
+                del self._leases[item_id]
+                self.status[item_id] = PENDING
+
+    def _all_finished(self):
+        return all(state in (PASSED, FAILED, SKIPPED) for state in self.status.values())
+
+    def _check_finished(self):
+        with self._lock:
+            if self._all_finished():
+                self._finished.set()
+
+    def _notify(self, item, result):
+        for callback in self._listeners:
+            callback(item, result)
+
+    def wait(self, timeout=None):
+        """Block until every item passed, failed or was skipped."""
+        return self._finished.wait(timeout)
+
+    def wait_for_workers(self, timeout=None):
+        """After the run, block until every worker that polled has been told it is over.
+
+        Returns False if some worker (e.g. one that died) did not poll again
+        within `timeout` seconds.
+        """
+        with self._workers_changed:
+            return self._workers_changed.wait_for(lambda: self._workers <= self._released, timeout)
+
+    def summary(self):
+        with self._lock:
+            return {state: sum(1 for s in self.status.values() if s == state)
+                    for state in (PENDING, LEASED, PASSED, FAILED, SKIPPED)}
+
+
+# ============================================================================
+# COORDINATOR (HTTP)
+# ============================================================================
+class _CoordinatorHandler(BaseHTTPRequestHandler):
+    """JSON API: POST /lease, /heartbeat, /result; GET /status.
+
+    Every request must carry the coordinator's token in TOKEN_HEADER.
+    """
+
+    def log_message(self, format, *args):
+        pass
+
+    def _authorized(self):
+        token = self.headers.get(TOKEN_HEADER) or ""
+        if hmac.compare_digest(token.encode(), self.server.token.encode()):
+            return True
+        self._send(401, {"error": "missing or wrong coordinator token"})
+        return False
+
+    def _send(self, status, body=None):
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        if self.path == "/status":
+            return self._send(200, self.server.queue.summary())
+        self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        if not self._authorized():
+            return
+        queue = self.server.queue
+        body = self._body()
+        worker = body.get("worker", "unknown")
+        if self.path == "/lease":
+            try:
+                item = queue.lease(worker)
+            except StopIteration:
+                return self._send(410, {"done": True})
+            if item is None:
+                return self._send(200, {"item": None, "retry_after": 1.0})
+            return self._send(200, {"item": item, "heartbeat": queue.lease_timeout / 4})
+        if self.path == "/heartbeat":
+            return self._send(200, {"ok": queue.heartbeat(body["id"], worker)})
+        if self.path == "/result":
+            accepted = queue.complete(body["id"], worker, body["returncode"],
+                                      body.get("duration", 0.0), body.get("output", ""), body.get("data"))
+            return self._send(200, {"accepted": accepted})
+        self._send(404, {"error": "not found"})
+
+
+class CoordinatorServer:
+    """Serves a WorkQueue to workers over HTTP.
+
+    Listens on loopback unless another host is given. Workers must send the
+    same `token` with every request; anything else gets a 401.
+
+    Usage:
+        coordinator = CoordinatorServer(WorkQueue(items), token, port=8790).start()
+        coordinator.queue.wait()
+        coordinator.stop()
+    """
+
+    def __init__(self, queue, token, host="127.0.0.1", port=8790):
+        if not token:
+            raise ValueError("CoordinatorServer needs a non-empty token")
+        self.queue = queue
+        self._httpd = ThreadingHTTPServer((host, port), _CoordinatorHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.queue = queue
+        self._httpd.token = token
+        self._thread = None
+
+    @property
+    def address(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{socket.gethostname() if host == '0.0.0.0' else host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="work-coordinator", daemon=True)
+        self._thread.start()
+        print(f"[QUEUE] Coordinator serving {len(self.queue.items)} item(s) at {self.address}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+# ============================================================================
+# WORKER (HTTP client)
+# ============================================================================
+def default_worker_name():
+    return f"{socket.gethostname()}-{os.getpid()}-{threading.current_thread().name}"
+
+
+class WorkerClient:
+    """Pulls items from a coordinator and reports results back.
+
+    `run_item(item, lease_lost)` must return (returncode, duration, output,
+    data), data being a dict passed on to dependent items. While it runs, a
+    background thread keeps the lease alive; if the coordinator reports the
+    lease lost (it expired and the item went to another worker), the
+    `lease_lost` event is set and run_item should abort. The result of an
+    aborted item is not reported.
+    """
+
+    def __init__(self, coordinator_url, token, name=None, connect_timeout=60):
+        self.url = coordinator_url.rstrip("/")
+        self.token = token
+        self.name = name or default_worker_name()
+        self.connect_timeout = connect_timeout
+
+    def _post(self, path, body):
+        request = urllib.request.Request(
+            f"{self.url}{path}", data=json.dumps(dict(body, worker=self.name)).encode(),
+            headers={"Content-Type": "application/json", TOKEN_HEADER: self.token}, method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read() or b"{}")
+
+    def _lease(self):
+        """Next item, None to retry later; raises StopIteration when the run is over."""
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                return self._post("/lease", {})
+            except urllib.error.HTTPError as e:
+                if e.code == 410:
+                    raise StopIteration
+                raise
+            except urllib.error.URLError:
+                # Coordinator not up yet (workers may be started first) or already gone
+                if time.monotonic() > deadline:
+                    raise StopIteration
+                time.sleep(1)
+
+    def _keep_alive(self, item_id, interval, stop, lease_lost):
+        while not stop.wait(interval):
+            try:
+                if not self._post("/heartbeat", {"id": item_id}).get("ok"):
+                    print(f"[WORKER] [WARN] {self.name} lost the lease on {item_id} - aborting it")
+                    lease_lost.set()
+                    return
+            except Exception as e:
+                print(f"[WORKER] [WARN] Heartbeat for {item_id} failed: {e}")
+
+    def run(self, run_item):
+        """Work until the coordinator has nothing left; returns items processed (aborted ones excluded)."""
+        processed = 0
+        while True:
+            try:
+                reply = self._lease()
+            except StopIteration:
+                return processed
+            item = reply.get("item")
+            if item is None:
+                time.sleep(reply.get("retry_after", 1.0))
+                continue
+
+            stop, lease_lost = threading.Event(), threading.Event()
+            threading.Thread(target=self._keep_alive,
+                             args=(item["id"], reply.get("heartbeat", 30), stop, lease_lost), daemon=True).start()
+            try:
+                returncode, duration, output, data = run_item(item, lease_lost)
+            except Exception as e:
+                returncode, duration, output, data = 1, 0.0, f"Worker error: {e}", {}
+            finally:
+                stop.set()
+            if lease_lost.is_set():
+                # Another worker owns the item now; its result is the one that counts
+                continue
+            try:
+                self._post("/result", {"id": item["id"], "returncode": returncode,
+                                       "duration": duration, "output": output, "data": data})
+            except Exception as e:
+                print(f"[WORKER] [ERROR] Could not report {item['id']}: {e}")
+            processed += 1